@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""
+Benchmark how long the package takes to import, per configured service.
+
+Runs ``python -X importtime`` in a fresh interpreter for each scenario and
+reports the median total import time and the modules with the largest self
+time. Each scenario also lists modules that must not be imported, such as the
+Confluence client when only Jira is configured; finding one of them, or
+exceeding ``--max-ms``, makes the script exit with status 1 so it can gate CI.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N] [--top N]
+        [--max-ms N] [--scenarios cli,jira,...] [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy third-party dependencies that should only load on first use
+HEAVY_MODULES = ("atlassian", "bs4", "markdownify", "md2conf", "thefuzz", "keyring")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class Scenario:
+    """A module to import with a given service configuration."""
+
+    module: str
+    environment: dict[str, str]
+    forbidden: tuple[str, ...] = field(default_factory=tuple)
+
+
+SCENARIOS = {
+    # Running the CLI (e.g. --help, --version, --oauth-setup) loads no server
+    "cli": Scenario(
+        "mcp_atlassian",
+        {},
+        ("fastmcp", "mcp_atlassian.servers", *HEAVY_MODULES),
+    ),
+    "jira": Scenario(
+        "mcp_atlassian.servers.main",
+        {"JIRA_URL": "https://example.atlassian.net"},
+        ("mcp_atlassian.servers.confluence", "mcp_atlassian.confluence.client")
+        + HEAVY_MODULES,
+    ),
+    "confluence": Scenario(
+        "mcp_atlassian.servers.main",
+        {"CONFLUENCE_URL": "https://example.atlassian.net/wiki"},
+        ("mcp_atlassian.servers.jira", "mcp_atlassian.jira.client") + HEAVY_MODULES,
+    ),
+    # Service clients are only loaded by the first tool call
+    "both": Scenario(
+        "mcp_atlassian.servers.main",
+        {
+            "JIRA_URL": "https://example.atlassian.net",
+            "CONFLUENCE_URL": "https://example.atlassian.net/wiki",
+        },
+        ("mcp_atlassian.jira.client", "mcp_atlassian.confluence.client")
+        + HEAVY_MODULES,
+    ),
+}
+
+
+def measure(scenario: Scenario) -> dict[str, tuple[int, int]]:
+    """Import the scenario's module in a new interpreter.
+
+    Returns:
+        Self and cumulative import time in microseconds, by module.
+    """
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if not k.startswith(("JIRA_", "CONFLUENCE_", "ATLASSIAN_"))
+    }
+    env.update(scenario.environment)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.join(ROOT, "src"), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {scenario.module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=False,
+    )
+    if result.returncode != 0:
+        msg = f"Importing {scenario.module} failed:\n{result.stderr[-2000:]}"
+        raise SystemExit(msg)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            times[module] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def run_scenario(scenario: Scenario, runs: int, top: int) -> dict:
+    """Measure a scenario runs times and summarize the results."""
+    samples = [measure(scenario) for _ in range(runs)]
+    totals = [sample[scenario.module][1] / 1000 for sample in samples]
+    last = samples[-1]
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "module": scenario.module,
+        "median_ms": statistics.median(totals),
+        "min_ms": min(totals),
+        "modules": len(last),
+        "slowest": [(module, self_us / 1000) for module, (self_us, _) in slowest],
+        "forbidden": sorted(
+            module
+            for module in last
+            if any(
+                module == name or module.startswith(f"{name}.")
+                for name in scenario.forbidden
+            )
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Imports per scenario; the median is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of slowest modules to show (default: 10)",
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="Fail if a scenario's median import time exceeds this",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default="",
+        help=f"Comma-separated scenarios to run (default: {','.join(SCENARIOS)})",
+    )
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    selected = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = set(selected) - set(SCENARIOS)
+    if unknown:
+        msg = f"Unknown scenarios: {', '.join(sorted(unknown))}"
+        raise SystemExit(msg)
+
+    results = {}
+    failures = []
+    for name in selected:
+        result = results[name] = run_scenario(SCENARIOS[name], args.runs, args.top)
+        print(
+            f"{name}: import {result['module']} took {result['median_ms']:.0f} ms "
+            f"(min {result['min_ms']:.0f} ms, {result['modules']} modules)"
+        )
+        for module, self_ms in result["slowest"]:
+            print(f"  {self_ms:>8.1f} ms  {module}")
+        if result["forbidden"]:
+            failures.append(
+                f"{name}: imported {', '.join(result['forbidden'][:10])}"
+                + (" ..." if len(result["forbidden"]) > 10 else "")
+            )
+        if args.max_ms is not None and result["median_ms"] > args.max_ms:
+            failures.append(
+                f"{name}: {result['median_ms']:.0f} ms exceeds {args.max_ms:.0f} ms"
+            )
+        print()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
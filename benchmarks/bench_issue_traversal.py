@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark attribute traversal and serialization of large Jira issues.
+
+Builds issues with many comments, attachments and custom fields from the test
+fixtures and times reading every model field, ``to_simplified_dict`` and
+``model_dump``. The same work is also timed on a subclass that reinstates a
+``__getattribute__`` override wrapping every attribute read, to show the cost
+such an override puts on the hot path.
+
+Usage:
+    python benchmarks/bench_issue_traversal.py [--issues N] [--repeat N]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+# Add the repository root and src/ to the path so the fixtures and package import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from mcp_atlassian.models.jira import JiraIssue  # noqa: E402
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE  # noqa: E402
+
+
+class GetattributeJiraIssue(JiraIssue):
+    """JiraIssue with a catch-all __getattribute__ override, for comparison."""
+
+    def __getattribute__(self, name: str) -> Any:
+        try:
+            return super().__getattribute__(name)
+        except AttributeError:
+            custom_fields = super().__getattribute__("custom_fields")
+            if name in custom_fields:
+                return custom_fields[name]
+            raise
+
+
+def build_issue_data(index: int) -> dict[str, Any]:
+    """Build a raw issue with many comments, attachments and custom fields."""
+    issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+    issue["key"] = f"PROJ-{index}"
+    fields = issue["fields"]
+    comment = fields["comment"]["comments"][0]
+    fields["comment"]["comments"] = [
+        {**comment, "id": str(i), "body": f"Comment {i}"} for i in range(50)
+    ]
+    fields["attachment"] = [
+        {
+            "id": str(i),
+            "filename": f"file-{i}.txt",
+            "size": 100 * i,
+            "mimeType": "text/plain",
+            "created": "2024-01-01T10:00:00.000+0000",
+            "content": f"https://example.atlassian.net/attachment/{i}",
+        }
+        for i in range(20)
+    ]
+    for i in range(50):
+        fields[f"customfield_2{i:04d}"] = {"value": f"Option {i}"}
+    return issue
+
+
+def read_all_fields(issues: list[JiraIssue]) -> None:
+    """Read every model field of every issue and its comments."""
+    names = list(JiraIssue.model_fields)
+    for issue in issues:
+        for name in names:
+            getattr(issue, name)
+        for comment in issue.comments:
+            _ = comment.body, comment.author, comment.created, comment.updated
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--issues", type=int, default=200, help="Number of issues (default: 200)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Timed runs per case (default: 10)"
+    )
+    args = parser.parse_args()
+
+    raw_issues = [build_issue_data(i) for i in range(args.issues)]
+    variants = {
+        "JiraIssue": [
+            JiraIssue.from_api_response(data, requested_fields="*all")
+            for data in raw_issues
+        ],
+        "__getattribute__": [
+            GetattributeJiraIssue.from_api_response(data, requested_fields="*all")
+            for data in raw_issues
+        ],
+    }
+
+    print(f"{'operation':<22}" + "".join(f"{name:>20}" for name in variants))
+    operations: dict[str, Callable[[list[JiraIssue]], Any]] = {
+        "read all fields": read_all_fields,
+        "to_simplified_dict": lambda issues: [
+            issue.to_simplified_dict() for issue in issues
+        ],
+        "model_dump": lambda issues: [issue.model_dump() for issue in issues],
+    }
+    for operation, func in operations.items():
+        timings = [
+            measure(lambda func=func, issues=issues: func(issues), args.repeat)
+            for issues in variants.values()
+        ]
+        print(
+            f"{operation:<22}"
+            + "".join(f"{f'{seconds * 1000:.2f}ms':>20}" for seconds in timings)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
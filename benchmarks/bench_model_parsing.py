@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Benchmark building API models from large result sets.
+
+Parses a 1000-issue Jira search and 1000 Confluence pages built from the
+test fixtures, once through the trusted construction path the hot models use
+(``ApiModel.construct_trusted``), once with full Pydantic validation of the
+same values and once with ``model_construct``, and reports the timings.
+
+Usage:
+    python benchmarks/bench_model_parsing.py [--count N] [--repeat N]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+# Add the repository root and src/ to the path so the fixtures and package import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from mcp_atlassian.models.base import ApiModel  # noqa: E402
+from mcp_atlassian.models.confluence import ConfluencePage  # noqa: E402
+from mcp_atlassian.models.jira import JiraSearchResult  # noqa: E402
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE  # noqa: E402
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE  # noqa: E402
+
+# Stand-ins for construct_trusted, to compare against the trusted path
+CONSTRUCTORS: dict[str, Callable[..., ApiModel] | None] = {
+    "validated": lambda cls, **values: cls(**values),
+    "model_construct": lambda cls, **values: cls.model_construct(**values),
+    "trusted": None,
+}
+
+
+def build_search_data(count: int) -> dict[str, Any]:
+    """Build a raw Jira search response with count issues."""
+    issues = []
+    for i in range(count):
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        issue["id"] = str(10000 + i)
+        issue["key"] = f"PROJ-{i + 1}"
+        issues.append(issue)
+    return {"issues": issues, "total": count, "startAt": 0, "maxResults": count}
+
+
+def build_page_data(count: int) -> list[dict[str, Any]]:
+    """Build count raw Confluence page responses."""
+    pages = []
+    for i in range(count):
+        page = copy.deepcopy(MOCK_PAGE_RESPONSE)
+        page["id"] = str(100000 + i)
+        pages.append(page)
+    return pages
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of func over repeat runs, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--count", type=int, default=1000, help="Issues/pages per run (default: 1000)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per case (default: 5)"
+    )
+    args = parser.parse_args()
+
+    search_data = build_search_data(args.count)
+    page_data = build_page_data(args.count)
+    cases: dict[str, Callable[[], Any]] = {
+        f"jira search ({args.count} issues)": lambda: (
+            JiraSearchResult.from_api_response(search_data, requested_fields="*all")
+        ),
+        f"confluence pages ({args.count})": lambda: [
+            ConfluencePage.from_api_response(
+                page, base_url="https://example.atlassian.net/wiki"
+            )
+            for page in page_data
+        ],
+    }
+
+    print(f"{'case':<30}" + "".join(f"{name:>17}" for name in CONSTRUCTORS))
+    for case_name, func in cases.items():
+        timings = {}
+        for name, constructor in CONSTRUCTORS.items():
+            if constructor is None:
+                timings[name] = measure(func, args.repeat)
+                continue
+            with patch.object(ApiModel, "construct_trusted", classmethod(constructor)):
+                timings[name] = measure(func, args.repeat)
+        baseline = timings["validated"]
+        print(
+            f"{case_name:<30}"
+            + "".join(
+                f"{f'{seconds * 1000:.1f}ms ({baseline / seconds:.2f}x)':>17}"
+                for seconds in timings.values()
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Benchmark the tool response encoders.
+
+Compares throughput and payload size of the standard library and orjson
+encoders, in pretty and compact mode, on two representative responses built
+from the test fixtures:
+
+- a 50-issue Jira search (``jira_search``)
+- a Confluence page with metadata (``confluence_get_page``)
+
+Usage:
+    python benchmarks/bench_response_encoding.py [--iterations N]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import timeit
+from typing import Any
+
+# Add the repository root and src/ to the path so the fixtures and package import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from mcp_atlassian.models.confluence import ConfluencePage  # noqa: E402
+from mcp_atlassian.models.jira import JiraSearchResult  # noqa: E402
+from mcp_atlassian.utils.serialization import (  # noqa: E402
+    OrjsonResponseEncoder,
+    ResponseEncoder,
+    orjson,
+)
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE  # noqa: E402
+from tests.fixtures.jira_mocks import (  # noqa: E402
+    MOCK_JIRA_ISSUE_RESPONSE,
+    MOCK_JIRA_JQL_RESPONSE,
+)
+
+
+def build_search_response(issue_count: int = 50) -> dict[str, Any]:
+    """Build the simplified output of a Jira search with issue_count issues."""
+    issues = []
+    for i in range(issue_count):
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        issue["id"] = str(10000 + i)
+        issue["key"] = f"PROJ-{i + 1}"
+        issue["fields"]["summary"] = f"Issue {i + 1}: {issue['fields']['summary']}"
+        issues.append(issue)
+    data = {**MOCK_JIRA_JQL_RESPONSE, "issues": issues, "total": issue_count}
+    return JiraSearchResult.from_api_response(
+        data, requested_fields="*all"
+    ).to_simplified_dict()
+
+
+def build_page_response() -> dict[str, Any]:
+    """Build the simplified output of a Confluence page with metadata."""
+    page_data = copy.deepcopy(MOCK_PAGE_RESPONSE)
+    page = ConfluencePage.from_api_response(
+        page_data, base_url="https://example.atlassian.net/wiki"
+    )
+    return {"metadata": page.to_simplified_dict()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Number of encodings timed per encoder and response (default: 2000)",
+    )
+    args = parser.parse_args()
+
+    encoders: list[ResponseEncoder] = [
+        ResponseEncoder(),
+        ResponseEncoder(compact=True),
+    ]
+    if orjson is not None:
+        encoders += [
+            OrjsonResponseEncoder(),
+            OrjsonResponseEncoder(compact=True),
+        ]
+    else:
+        print("orjson is not installed; only the stdlib encoder is benchmarked.\n")
+
+    responses = {
+        "jira_search (50 issues)": build_search_response(),
+        "confluence_get_page": build_page_response(),
+    }
+
+    print(
+        f"{'response':<26}{'encoder':<10}{'mode':<9}"
+        f"{'ops/s':>10}{'bytes':>10}{'vs baseline':>13}"
+    )
+    for response_name, data in responses.items():
+        baseline_seconds = baseline_bytes = 0.0
+        for encoder in encoders:
+            seconds = min(
+                timeit.repeat(
+                    lambda encoder=encoder, data=data: encoder.encode(data),
+                    number=args.iterations,
+                    repeat=3,
+                )
+            )
+            size = len(encoder.encode(data).encode("utf-8"))
+            if not baseline_seconds:
+                baseline_seconds, baseline_bytes = seconds, size
+            relative = f"{baseline_seconds / seconds:.1f}x, {size / baseline_bytes:.0%}"
+            print(
+                f"{response_name:<26}{encoder.name:<10}"
+                f"{'compact' if encoder.compact else 'pretty':<9}"
+                f"{args.iterations / seconds:>10.0f}{size:>10}{relative:>13}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
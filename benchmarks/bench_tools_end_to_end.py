@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+"""
+Benchmark the MCP tools end to end against a local fake Atlassian server.
+
+Starts the fake Jira/Confluence server from ``fake_atlassian.py``, points the
+MCP server at it through the environment and calls the real tools through an
+in-memory MCP client, so every layer runs: tool dispatch, fetchers, HTTP,
+model parsing, content conversion and response encoding. For each tool it
+reports p50/p99 latency, throughput, upstream requests per call, response
+size and the peak memory allocated by one call.
+
+Results can be saved with ``--json`` and compared to a saved baseline with
+``--compare`` to catch regressions.
+
+Usage:
+    python benchmarks/bench_tools_end_to_end.py [--iterations N] [--concurrency N]
+        [--latency-ms N] [--description-kb N] [--json PATH] [--compare PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+# Add the repository root and src/ to the path so the fixtures and package import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from fake_atlassian import FakeAtlassianConfig, FakeAtlassianServer  # noqa: E402
+from fastmcp import Client  # noqa: E402
+from fastmcp.client import FastMCPTransport  # noqa: E402
+
+Scenario = Callable[[int], tuple[str, dict[str, Any]]]
+
+
+def build_scenarios(attachment_dir: str, batch_size: int) -> dict[str, Scenario]:
+    """Map scenario names to functions returning the tool call of iteration i."""
+    return {
+        "jira_get_issue": lambda i: (
+            "jira_get_issue",
+            {"issue_key": f"PROJ-{i % 100 + 1}"},
+        ),
+        "jira_search": lambda i: (
+            "jira_search",
+            {"jql": f"project = PROJ AND text ~ 'run {i}'", "limit": 50},
+        ),
+        "jira_batch_create_issues": lambda i: (
+            "jira_batch_create_issues",
+            {
+                "issues": json.dumps(
+                    [
+                        {
+                            "project_key": "PROJ",
+                            "summary": f"Benchmark issue {i}-{n}",
+                            "issue_type": "Task",
+                            "description": "Created by the benchmark.",
+                        }
+                        for n in range(batch_size)
+                    ]
+                )
+            },
+        ),
+        "jira_download_attachments": lambda i: (
+            "jira_download_attachments",
+            {
+                "issue_key": f"PROJ-{i % 100 + 1}",
+                "target_dir": os.path.join(attachment_dir, str(i)),
+            },
+        ),
+        "confluence_get_page": lambda i: (
+            "confluence_get_page",
+            {"page_id": str(100000 + i % 100)},
+        ),
+        "confluence_search": lambda i: (
+            "confluence_search",
+            {"query": f"type=page AND text ~ 'run {i}'"},
+        ),
+    }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of values."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def run_scenario(
+    client: Client,
+    server: FakeAtlassianServer,
+    scenario: Scenario,
+    iterations: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Time iterations calls of a scenario, concurrency at a time."""
+    latencies: list[float] = []
+    sizes: list[int] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(i: int) -> None:
+        name, arguments = scenario(i)
+        async with semaphore:
+            start = time.perf_counter()
+            result = await client.call_tool(name, arguments)
+            latencies.append(time.perf_counter() - start)
+        sizes.append(sum(len(getattr(c, "text", "")) for c in result))
+
+    # Warm up caches (fields, fetchers) before timing
+    await call(-1)
+    latencies.clear()
+
+    upstream_before = sum(server.fake.requests.values())
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - start
+    upstream = sum(server.fake.requests.values()) - upstream_before
+
+    name, arguments = scenario(iterations)
+    tracemalloc.start()
+    await client.call_tool(name, arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "throughput": iterations / elapsed,
+        "upstream_per_call": upstream / iterations,
+        "response_bytes": int(sum(sizes) / len(sizes)),
+        "peak_kb": peak / 1024,
+    }
+
+
+def print_results(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]
+) -> None:
+    print(
+        f"{'tool':<28}{'p50 ms':>9}{'p99 ms':>9}{'calls/s':>9}"
+        f"{'upstream':>10}{'bytes':>9}{'peak KB':>9}"
+        + (f"{'p50 vs base':>13}{'calls/s vs base':>17}" if baseline else "")
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<28}{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+            f"{result['throughput']:>9.1f}{result['upstream_per_call']:>10.1f}"
+            f"{result['response_bytes']:>9}{result['peak_kb']:>9.0f}"
+        )
+        base = baseline.get(name)
+        if base:
+            line += (
+                f"{result['p50_ms'] / base['p50_ms']:>12.2f}x"
+                f"{result['throughput'] / base['throughput']:>16.2f}x"
+            )
+        print(line)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    config = FakeAtlassianConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        search_issues=args.search_issues,
+        description_kb=args.description_kb,
+        comments=args.comments,
+        attachment_kb=args.attachment_kb,
+    )
+    with (
+        FakeAtlassianServer(config) as server,
+        tempfile.TemporaryDirectory() as attachment_dir,
+    ):
+        os.environ.update(server.environment())
+        # Only import the server once the environment says which services to mount
+        from mcp_atlassian.servers.main import main_mcp
+
+        scenarios = build_scenarios(attachment_dir, args.batch_size)
+        selected = args.tools.split(",") if args.tools else list(scenarios)
+        unknown = set(selected) - set(scenarios)
+        if unknown:
+            msg = f"Unknown tools: {', '.join(sorted(unknown))}"
+            raise SystemExit(msg)
+
+        results = {}
+        async with Client(transport=FastMCPTransport(main_mcp)) as client:
+            for name in selected:
+                results[name] = await run_scenario(
+                    client, server, scenarios[name], args.iterations, args.concurrency
+                )
+        unmatched = {k: v for k, v in server.fake.requests.items() if "unmatched" in k}
+        if unmatched:
+            print(f"Requests the fake server could not answer: {unmatched}\n")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="Number of timed calls per tool (default: 50)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of calls in flight at once (default: 1)",
+    )
+    parser.add_argument(
+        "--tools", default="", help="Comma-separated tools to run (default: all)"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency added to every fake API response (default: 0)",
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=0.0,
+        help="Random extra latency of up to this many ms (default: 0)",
+    )
+    parser.add_argument(
+        "--search-issues",
+        type=int,
+        default=50,
+        help="Issues returned per search page (default: 50)",
+    )
+    parser.add_argument(
+        "--description-kb",
+        type=float,
+        default=1.0,
+        help="Size of issue descriptions and page bodies (default: 1)",
+    )
+    parser.add_argument(
+        "--comments", type=int, default=2, help="Comments per issue (default: 2)"
+    )
+    parser.add_argument(
+        "--attachment-kb",
+        type=int,
+        default=64,
+        help="Size of each attachment (default: 64)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Issues per jira_batch_create_issues call (default: 10)",
+    )
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare to results saved with --json")
+    args = parser.parse_args()
+
+    logging.getLogger("mcp-atlassian").setLevel(logging.ERROR)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    results = asyncio.run(run(args))
+    print_results(results, baseline)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"\nMax RSS: {max_rss / 1024:.0f} MB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
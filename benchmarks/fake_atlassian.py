@@ -0,0 +1,393 @@
+"""
+A local stand-in for the Jira and Confluence REST APIs used by the benchmarks.
+
+Serves the responses in ``tests/fixtures`` over HTTP so the MCP tools can be
+driven end to end, through the real fetchers, models and encoders, without
+network access. Latency and payload sizes are configurable:
+
+- ``latency_ms`` / ``jitter_ms``: delay added to every response
+- ``search_issues``: number of issues returned per Jira search page
+- ``description_kb``: size of issue descriptions and page bodies
+- ``comments``: number of comments per issue
+- ``attachment_kb``: size of each attachment download
+
+Jira is served under ``/jira`` (REST API v2, as for Server/Data Center) and
+Confluence under ``/confluence``.
+
+Usage:
+    python benchmarks/fake_atlassian.py [--port N] [--latency-ms N]
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+# Add the repository root to the path so the fixtures import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tests.fixtures.confluence_mocks import (  # noqa: E402
+    MOCK_CQL_SEARCH_RESPONSE,
+    MOCK_PAGE_RESPONSE,
+)
+from tests.fixtures.jira_mocks import (  # noqa: E402
+    MOCK_JIRA_COMMENTS,
+    MOCK_JIRA_ISSUE_RESPONSE,
+)
+
+JIRA_PREFIX = "/jira"
+CONFLUENCE_PREFIX = "/confluence"
+
+
+@dataclass
+class FakeAtlassianConfig:
+    """Latency and payload settings of the fake server."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    search_issues: int = 50
+    description_kb: float = 1.0
+    comments: int = 2
+    attachments: int = 1
+    attachment_kb: int = 64
+
+
+def _padded_text(kb: float, heading: str) -> str:
+    """Build markdown-ish text of about kb kilobytes with a few headings."""
+    paragraph = (
+        "This paragraph stands in for real issue and page content. It mentions "
+        "*formatting*, a [link|https://example.com] and a {{code}} span.\n\n"
+    )
+    target = max(int(kb * 1024), len(paragraph))
+    sections = []
+    size = 0
+    index = 0
+    while size < target:
+        section = f"h2. {heading} {index + 1}\n\n" + paragraph * 4
+        sections.append(section)
+        size += len(section)
+        index += 1
+    return "".join(sections)[:target]
+
+
+class FakeAtlassian:
+    """Builds the responses of the fake server from the test fixtures."""
+
+    def __init__(self, config: FakeAtlassianConfig, base_url: str) -> None:
+        self.config = config
+        self.base_url = base_url
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._next_issue_id = 20000
+        self._description = _padded_text(config.description_kb, "Section")
+        self._page_body = "".join(
+            f"<h2>Section {i + 1}</h2><p>{line}</p>"
+            for i, line in enumerate(
+                _padded_text(config.description_kb, "Section").split("\n\n")
+            )
+        )
+        self.attachment = b"x" * (config.attachment_kb * 1024)
+
+    def record(self, route: str) -> None:
+        """Count a request to a route."""
+        with self._lock:
+            self.requests[route] += 1
+
+    def issue(self, key: str) -> dict[str, Any]:
+        """Build a Jira issue with the configured payload sizes."""
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        number = int(key.rsplit("-", 1)[-1]) if key[-1:].isdigit() else 1
+        issue["id"] = str(10000 + number)
+        issue["key"] = key
+        issue["self"] = f"{self.base_url}{JIRA_PREFIX}/rest/api/2/issue/{issue['id']}"
+        fields = issue["fields"]
+        fields["summary"] = f"{key}: {fields['summary']}"
+        fields["description"] = self._description
+        fields["comment"] = self.comments(key)
+        fields["attachment"] = [
+            {
+                "id": str(30000 + i),
+                "filename": f"attachment-{i + 1}.bin",
+                "size": len(self.attachment),
+                "mimeType": "application/octet-stream",
+                "content": (
+                    f"{self.base_url}{JIRA_PREFIX}/secure/attachment/"
+                    f"{30000 + i}/attachment-{i + 1}.bin"
+                ),
+            }
+            for i in range(self.config.attachments)
+        ]
+        return issue
+
+    def comments(self, key: str) -> dict[str, Any]:
+        """Build the comments of a Jira issue."""
+        template = MOCK_JIRA_COMMENTS["comments"][0]
+        comments = []
+        for i in range(self.config.comments):
+            comment = copy.deepcopy(template)
+            comment["id"] = str(40000 + i)
+            comment["body"] = f"Comment {i + 1} on {key}.\n\n" + self._description[:512]
+            comments.append(comment)
+        return {
+            "startAt": 0,
+            "maxResults": len(comments),
+            "total": len(comments),
+            "comments": comments,
+        }
+
+    def search(self, start_at: int, max_results: int) -> dict[str, Any]:
+        """Build a Jira search result page."""
+        total = max(self.config.search_issues, 1) * 4
+        count = max(0, min(max_results, self.config.search_issues, total - start_at))
+        return {
+            "expand": "names,schema",
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": total,
+            "issues": [self.issue(f"PROJ-{start_at + i + 1}") for i in range(count)],
+        }
+
+    def create_issues(self, count: int) -> dict[str, Any]:
+        """Build the response of a bulk issue creation."""
+        with self._lock:
+            first = self._next_issue_id
+            self._next_issue_id += count
+        issue_url = f"{self.base_url}{JIRA_PREFIX}/rest/api/2/issue"
+        return {
+            "issues": [
+                {
+                    "id": str(first + i),
+                    "key": f"PROJ-{first + i}",
+                    "self": f"{issue_url}/{first + i}",
+                }
+                for i in range(count)
+            ],
+            "errors": [],
+        }
+
+    def page(self, page_id: str) -> dict[str, Any]:
+        """Build a Confluence page with the configured body size."""
+        page = copy.deepcopy(MOCK_PAGE_RESPONSE)
+        page["id"] = page_id
+        page["body"]["storage"]["value"] = self._page_body
+        if "view" in page["body"]:
+            page["body"]["view"]["value"] = self._page_body
+        return page
+
+
+def _make_handler(fake: FakeAtlassian) -> type[BaseHTTPRequestHandler]:
+    routes: list[tuple[str, re.Pattern[str], str]] = [
+        ("GET", re.compile(r"^/jira/rest/api/2/issue/([^/]+)/comment$"), "comments"),
+        ("GET", re.compile(r"^/jira/rest/api/2/issue/([^/]+)$"), "issue"),
+        ("POST", re.compile(r"^/jira/rest/api/2/issue/bulk$"), "bulk_create"),
+        ("GET", re.compile(r"^/jira/rest/api/2/search$"), "search"),
+        ("POST", re.compile(r"^/jira/rest/api/2/search$"), "search"),
+        ("GET", re.compile(r"^/jira/rest/api/2/field$"), "fields"),
+        ("GET", re.compile(r"^/jira/rest/api/2/myself$"), "myself"),
+        ("GET", re.compile(r"^/jira/secure/attachment/(\d+)/.+$"), "attachment"),
+        ("GET", re.compile(r"^/confluence/rest/api/content/search$"), "cql_search"),
+        ("GET", re.compile(r"^/confluence/rest/api/search$"), "cql_search"),
+        ("GET", re.compile(r"^/confluence/rest/api/content/(\d+)$"), "page"),
+    ]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm and delayed ACKs add ~40 ms to every keep-alive request
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, data: Any, status: int = 200) -> None:
+            self._send(status, json.dumps(data).encode("utf-8"), "application/json")
+
+        def _body(self) -> Any:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            return json.loads(raw) if raw else {}
+
+        def _dispatch(self, method: str) -> None:
+            url = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            route = next(
+                (
+                    (name, match)
+                    for route_method, pattern, name in routes
+                    if route_method == method and (match := pattern.match(url.path))
+                ),
+                None,
+            )
+            if route is None:
+                fake.record(f"unmatched {method} {url.path}")
+                self._send_json({"errorMessages": ["Not found"]}, status=404)
+                return
+            name, match = route
+
+            config = fake.config
+            if config.latency_ms or config.jitter_ms:
+                delay = config.latency_ms + random.uniform(0, config.jitter_ms)  # noqa: S311
+                time.sleep(delay / 1000)
+            fake.record(name)
+            body = self._body() if method == "POST" else {}
+
+            if name == "issue":
+                self._send_json(fake.issue(match.group(1)))
+            elif name == "comments":
+                self._send_json(fake.comments(match.group(1)))
+            elif name == "bulk_create":
+                self._send_json(fake.create_issues(len(body.get("issueUpdates", []))))
+            elif name == "search":
+                params = body or query
+                self._send_json(
+                    fake.search(
+                        int(params.get("startAt", 0)),
+                        int(params.get("maxResults", 50)),
+                    )
+                )
+            elif name == "fields":
+                self._send_json(
+                    [
+                        {"id": "summary", "name": "Summary", "custom": False},
+                        {"id": "description", "name": "Description", "custom": False},
+                        {
+                            "id": "customfield_10011",
+                            "name": "Epic Name",
+                            "custom": True,
+                            "schema": {
+                                "custom": "com.pyxis.greenhopper.jira:gh-epic-label"
+                            },
+                        },
+                        {
+                            "id": "customfield_10014",
+                            "name": "Epic Link",
+                            "custom": True,
+                            "schema": {
+                                "custom": "com.pyxis.greenhopper.jira:gh-epic-link"
+                            },
+                        },
+                    ]
+                )
+            elif name == "myself":
+                self._send_json(
+                    {"name": "bench", "key": "bench", "displayName": "Benchmark User"}
+                )
+            elif name == "attachment":
+                self._send(200, fake.attachment, "application/octet-stream")
+            elif name == "cql_search":
+                self._send_json(MOCK_CQL_SEARCH_RESPONSE)
+            elif name == "page":
+                self._send_json(fake.page(match.group(1)))
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._dispatch("GET")
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._dispatch("POST")
+
+        def do_PUT(self) -> None:  # noqa: N802
+            self._dispatch("PUT")
+
+    return Handler
+
+
+class FakeAtlassianServer:
+    """Runs the fake Jira and Confluence APIs in a background thread."""
+
+    def __init__(
+        self,
+        config: FakeAtlassianConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._server = ThreadingHTTPServer((host, port), BaseHTTPRequestHandler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.fake = FakeAtlassian(config or FakeAtlassianConfig(), self.base_url)
+        self._server.RequestHandlerClass = _make_handler(self.fake)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def jira_url(self) -> str:
+        """The base URL of the fake Jira."""
+        return self.base_url + JIRA_PREFIX
+
+    @property
+    def confluence_url(self) -> str:
+        """The base URL of the fake Confluence."""
+        return self.base_url + CONFLUENCE_PREFIX
+
+    def environment(self) -> dict[str, str]:
+        """Environment variables pointing the MCP server at the fake APIs."""
+        return {
+            "JIRA_URL": self.jira_url,
+            "JIRA_PERSONAL_TOKEN": "benchmark-token",
+            "CONFLUENCE_URL": self.confluence_url,
+            "CONFLUENCE_PERSONAL_TOKEN": "benchmark-token",
+        }
+
+    def start(self) -> "FakeAtlassianServer":
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-atlassian", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeAtlassianServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--description-kb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    config = FakeAtlassianConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        description_kb=args.description_kb,
+    )
+    server = FakeAtlassianServer(config, port=args.port)
+    for name, value in server.environment().items():
+        print(f"{name}={value}")
+    try:
+        server.start()._thread.join()  # type: ignore[union-attr]
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ import click
 from dotenv import load_dotenv
 
 from mcp_atlassian.utils.logging import setup_logging
+from mcp_atlassian.utils.tracing import configure_tracing
 
 __version__ = "0.11.1"
 
@@ -176,6 +177,7 @@ def main(
     global logger
     logger = setup_logging(current_logging_level)
     logger.debug(f"Logging level set to: {logging.getLevelName(current_logging_level)}")
+    configure_tracing()
 
     def was_option_provided(ctx: click.Context, param_name: str) -> bool:
         return (
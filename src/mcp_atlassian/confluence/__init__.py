@@ -1,28 +1,36 @@
 """Confluence API integration module.
 
 This module provides access to Confluence content through the Model Context Protocol.
-"""
-
-from .client import ConfluenceClient
-from .comments import CommentsMixin
-from .config import ConfluenceConfig
-from .labels import LabelsMixin
-from .pages import PagesMixin
-from .search import SearchMixin
-from .spaces import SpacesMixin
-from .users import UsersMixin
-
 
-class ConfluenceFetcher(
-    SearchMixin, SpacesMixin, PagesMixin, CommentsMixin, LabelsMixin, UsersMixin
-):
-    """Main entry point for Confluence operations, providing backward compatibility.
-
-    This class combines functionality from various mixins to maintain the same
-    API as the original ConfluenceFetcher class.
-    """
+The exports are resolved on first access, so that
+``mcp_atlassian.confluence.config`` can be imported without loading the API
+client and its dependencies.
+"""
 
-    pass
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import ConfluenceClient
+    from .config import ConfluenceConfig
+    from .fetcher import ConfluenceFetcher
+
+# Module providing each exported name
+_EXPORTS = {
+    "ConfluenceFetcher": ".fetcher",
+    "ConfluenceConfig": ".config",
+    "ConfluenceClient": ".client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = ["ConfluenceFetcher", "ConfluenceConfig", "ConfluenceClient"]
@@ -7,9 +7,13 @@ from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.circuitbreaker import protect_session
 from ..utils.logging import log_config_param, mask_sensitive
+from ..utils.metrics import instrument_session
 from ..utils.oauth import configure_oauth_session
+from ..utils.ratelimit import rate_limit_session
 from ..utils.ssl import configure_ssl_verification
+from ..utils.tracing import trace_session
 from .config import ConfluenceConfig
 
 # Configure logging
@@ -91,6 +95,10 @@ class ConfluenceClient:
             session=self.confluence._session,
             ssl_verify=self.config.ssl_verify,
         )
+        instrument_session(self.confluence._session, "confluence")
+        trace_session(self.confluence._session, "confluence")
+        rate_limit_session(self.confluence._session, "confluence", self.confluence.url)
+        protect_session(self.confluence._session, self.confluence.url)
 
         # Proxy configuration
         proxies = {}
@@ -1,6 +1,8 @@
 """Module for Confluence comment operations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import requests
 
@@ -13,6 +15,78 @@ logger = logging.getLogger("mcp-atlassian")
 class CommentsMixin(ConfluenceClient):
     """Mixin for Confluence comment operations."""
 
+    def _get_all_page_comments(
+        self, page_id: str, page_size: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every comment of a page, following pagination.
+
+        The space of each comment is expanded alongside the body, so no
+        separate page lookup is needed to learn the space key. Servers may
+        cap the page size below the requested one, so paging stops on an
+        empty batch or a response without ``_links.next``, not on a short
+        batch.
+
+        Args:
+            page_id: The ID of the page to get comments from
+            page_size: Number of comments requested per API call
+
+        Returns:
+            List of raw comment dictionaries from the Confluence API
+        """
+        comments: list[dict[str, Any]] = []
+        start = 0
+        while True:
+            comments_response = self.confluence.get_page_comments(
+                content_id=page_id,
+                expand="body.view.value,version,space",
+                depth="all",
+                start=start,
+                limit=page_size,
+            )
+            batch = comments_response.get("results", [])
+            comments.extend(batch)
+            if not batch or not comments_response.get("_links", {}).get("next"):
+                return comments
+            start += len(batch)
+
+    def _convert_comment_bodies(
+        self, comments: list[dict[str, Any]], max_workers: int = 4
+    ) -> list[tuple[str, str]]:
+        """
+        Convert the view bodies of a batch of comments.
+
+        Conversion can resolve user mentions over the network, so larger
+        batches are spread over a small worker pool.
+
+        Args:
+            comments: Raw comment dictionaries from the Confluence API
+            max_workers: Maximum number of comments converted concurrently
+
+        Returns:
+            List of (processed_html, processed_markdown) tuples in comment order
+        """
+        jobs = [
+            (
+                comment_data["body"]["view"]["value"],
+                comment_data.get("space", {}).get("key", ""),
+            )
+            for comment_data in comments
+        ]
+
+        def convert(job: tuple[str, str]) -> tuple[str, str]:
+            body, space_key = job
+            return self.preprocessor.process_html_content(body, space_key=space_key)
+
+        if len(jobs) <= 1 or max_workers <= 1:
+            return [convert(job) for job in jobs]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(jobs)),
+            thread_name_prefix="confluence-comments",
+        ) as executor:
+            return list(executor.map(convert, jobs))
+
     def get_page_comments(
         self, page_id: str, *, return_markdown: bool = True
     ) -> list[ConfluenceComment]:
@@ -28,24 +102,14 @@ class CommentsMixin(ConfluenceClient):
             List of ConfluenceComment models containing comment content and metadata
         """
         try:
-            # Get page info to extract space details
-            page = self.confluence.get_page_by_id(page_id=page_id, expand="space")
-            space_key = page.get("space", {}).get("key", "")
-
-            # Get comments with expanded content
-            comments_response = self.confluence.get_page_comments(
-                content_id=page_id, expand="body.view.value,version", depth="all"
-            )
+            comments = self._get_all_page_comments(page_id)
+            converted = self._convert_comment_bodies(comments)
 
             # Process each comment
             comment_models = []
-            for comment_data in comments_response.get("results", []):
-                # Get the content based on format
-                body = comment_data["body"]["view"]["value"]
-                processed_html, processed_markdown = (
-                    self.preprocessor.process_html_content(body, space_key=space_key)
-                )
-
+            for comment_data, (processed_html, processed_markdown) in zip(
+                comments, converted, strict=True
+            ):
                 # Create a copy of the comment data to modify
                 modified_comment_data = comment_data.copy()
 
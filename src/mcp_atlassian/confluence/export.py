@@ -0,0 +1,306 @@
+"""Module for exporting whole Confluence spaces to disk."""
+
+import json
+import logging
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .client import ConfluenceClient
+
+logger = logging.getLogger("mcp-atlassian")
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def _safe_filename(page_id: str, title: str) -> str:
+    """
+    Build a stable, filesystem-safe Markdown filename for a page.
+
+    Args:
+        page_id: The ID of the page
+        title: The title of the page
+
+    Returns:
+        Filename of the form ``<page_id>-<slugified-title>.md``
+    """
+    slug = re.sub(r"[^\w\-]+", "-", title, flags=re.UNICODE).strip("-")[:80]
+    return f"{page_id}-{slug}.md" if slug else f"{page_id}.md"
+
+
+def _is_export_file(target_path: Path, page_id: str, path: Any) -> bool:
+    """
+    Check that a manifest path names a page file inside the export directory.
+
+    Args:
+        target_path: The resolved export directory
+        page_id: The ID of the page the path belongs to
+        path: The path recorded in the manifest
+
+    Returns:
+        True if the path is shaped like a ``_safe_filename`` result for the
+        page and resolves to a file directly inside ``target_path``
+    """
+    if not isinstance(path, str) or not re.fullmatch(
+        rf"{re.escape(page_id)}(-[\w\-]+)?\.md", path, flags=re.UNICODE
+    ):
+        return False
+    return (target_path / path).resolve().parent == target_path
+
+
+class ExportMixin(ConfluenceClient):
+    """Mixin for Confluence space export operations."""
+
+    def _load_export_manifest(self, manifest_path: Path) -> dict[str, dict[str, Any]]:
+        """
+        Load the page entries of a previous export, keyed by page ID.
+
+        Args:
+            manifest_path: Path to the manifest of a previous export
+
+        Returns:
+            Dictionary mapping page IDs to their manifest entries, empty if
+            there is no usable previous manifest
+        """
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            entries = {str(entry["id"]): entry for entry in manifest.get("pages", [])}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"Ignoring unreadable export manifest {manifest_path}: {str(e)}"
+            )
+            return {}
+
+        # The manifest is read back from disk, so its paths are not trusted:
+        # anything that is not a file written by _export_page is dropped
+        target_path = manifest_path.parent.resolve()
+        for page_id, entry in entries.items():
+            path = entry.get("path")
+            if path and not _is_export_file(target_path, page_id, path):
+                logger.warning(
+                    f"Ignoring unsafe path {path!r} of page {page_id} "
+                    f"in export manifest {manifest_path}"
+                )
+                entry["path"] = None
+        return entries
+
+    def _export_page(
+        self, page: dict[str, Any], space_key: str, target_path: Path
+    ) -> dict[str, Any]:
+        """
+        Convert a single page to Markdown and write it to disk.
+
+        Runs on a worker thread of the export pool.
+
+        Args:
+            page: Raw page data from the Confluence API
+            space_key: The key of the space being exported
+            target_path: Directory the Markdown file is written to
+
+        Returns:
+            Manifest entry describing the written file
+        """
+        page_id = str(page["id"])
+        if "body" not in page:
+            page = self.confluence.get_page_by_id(
+                page_id=page_id, expand="body.storage,version"
+            )
+
+        content = page.get("body", {}).get("storage", {}).get("value", "")
+        _, processed_markdown = self.preprocessor.process_html_content(
+            content, space_key=space_key
+        )
+
+        title = page.get("title", "")
+        filename = _safe_filename(page_id, title)
+        with open(target_path / filename, "w", encoding="utf-8") as f:
+            f.write(f"# {title}\n\n")
+            f.write(processed_markdown)
+
+        return {
+            "id": page_id,
+            "title": title,
+            "version": page.get("version", {}).get("number", 0),
+            "path": filename,
+        }
+
+    def export_space(
+        self,
+        space_key: str,
+        target_dir: str,
+        *,
+        incremental: bool = True,
+        max_workers: int = 4,
+        page_size: int = 50,
+    ) -> dict[str, Any]:
+        """
+        Export every page of a space as Markdown files plus a JSON manifest.
+
+        Pages are listed batch by batch, with the next batch prefetched while
+        the current one is converted on a worker pool, so memory use stays
+        bounded by the batch size rather than the size of the space. The
+        manifest is streamed to disk as pages complete and atomically replaces
+        the previous one at the end. With ``incremental`` enabled, pages whose
+        version matches the previous manifest are not fetched or converted
+        again, and files of pages that no longer exist are removed.
+
+        Args:
+            space_key: The key of the space to export
+            target_dir: The directory the export is written to
+            incremental: Whether to skip pages unchanged since the last export
+            max_workers: Maximum number of pages converted concurrently
+            page_size: Number of pages listed per API call
+
+        Returns:
+            A dictionary with export results
+        """
+        # Convert to absolute path if relative
+        if not os.path.isabs(target_dir):
+            target_dir = os.path.abspath(target_dir)
+
+        target_path = Path(target_dir)
+        target_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = target_path / MANIFEST_FILENAME
+        tmp_manifest_path = target_path / f"{MANIFEST_FILENAME}.tmp"
+
+        previous = self._load_export_manifest(manifest_path) if incremental else {}
+        # Bodies are only needed for changed pages when a previous export exists
+        list_expand = "version" if previous else "body.storage,version"
+
+        logger.info(
+            f"Exporting space {space_key} to {target_dir} "
+            f"(incremental={incremental}, previous pages={len(previous)})"
+        )
+
+        exported = 0
+        unchanged = 0
+        failed: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        first_entry = True
+
+        def list_batch(start: int) -> list[dict[str, Any]]:
+            return (
+                self.confluence.get_all_pages_from_space(
+                    space=space_key, start=start, limit=page_size, expand=list_expand
+                )
+                or []
+            )
+
+        with (
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="confluence-export-list"
+            ) as list_executor,
+            ThreadPoolExecutor(
+                max_workers=max(1, max_workers),
+                thread_name_prefix="confluence-export",
+            ) as convert_executor,
+            open(tmp_manifest_path, "w", encoding="utf-8") as manifest,
+        ):
+            exported_at = datetime.now(timezone.utc).isoformat()
+            manifest.write(
+                f'{{"space_key": {json.dumps(space_key, ensure_ascii=False)}, '
+                f'"exported_at": "{exported_at}", "pages": [\n'
+            )
+
+            def write_entry(entry: dict[str, Any]) -> None:
+                nonlocal first_entry
+                if not first_entry:
+                    manifest.write(",\n")
+                manifest.write(json.dumps(entry, ensure_ascii=False))
+                first_entry = False
+
+            start = 0
+            next_batch: Future[list[dict[str, Any]]] | None = list_executor.submit(
+                list_batch, start
+            )
+            while next_batch is not None:
+                batch = next_batch.result()
+                start += len(batch)
+                # Prefetch the following batch while this one is converted.
+                # Servers may cap the limit, so only an empty batch ends it.
+                next_batch = list_executor.submit(list_batch, start) if batch else None
+
+                futures: dict[Future[dict[str, Any]], dict[str, Any]] = {}
+                for page in batch:
+                    page_id = str(page.get("id", ""))
+                    if not page_id or page_id in seen:
+                        continue
+                    seen.add(page_id)
+
+                    version = page.get("version", {}).get("number", 0)
+                    previous_entry = previous.get(page_id)
+                    if (
+                        previous_entry
+                        and previous_entry.get("version") == version
+                        and previous_entry.get("path")
+                        and (target_path / previous_entry["path"]).is_file()
+                    ):
+                        write_entry(previous_entry)
+                        unchanged += 1
+                        continue
+
+                    futures[
+                        convert_executor.submit(
+                            self._export_page, page, space_key, target_path
+                        )
+                    ] = page
+
+                for future in as_completed(futures):
+                    page = futures[future]
+                    try:
+                        entry = future.result()
+                    except Exception as e:  # noqa: BLE001 - Record and continue
+                        logger.error(f"Error exporting page {page.get('id')}: {str(e)}")
+                        failed.append(
+                            {
+                                "id": str(page.get("id")),
+                                "title": page.get("title", ""),
+                                "error": str(e),
+                            }
+                        )
+                        continue
+
+                    # Remove the old file if the page was renamed
+                    previous_entry = previous.get(entry["id"])
+                    if (
+                        previous_entry
+                        and previous_entry.get("path")
+                        and previous_entry["path"] != entry["path"]
+                    ):
+                        (target_path / previous_entry["path"]).unlink(missing_ok=True)
+
+                    write_entry(entry)
+                    exported += 1
+
+            manifest.write("\n]}\n")
+
+        os.replace(tmp_manifest_path, manifest_path)
+
+        removed = []
+        for page_id, entry in previous.items():
+            if page_id not in seen:
+                if entry.get("path"):
+                    (target_path / entry["path"]).unlink(missing_ok=True)
+                removed.append(page_id)
+
+        logger.info(
+            f"Exported space {space_key}: {exported} exported, {unchanged} unchanged, "
+            f"{len(removed)} removed, {len(failed)} failed"
+        )
+
+        return {
+            "success": not failed,
+            "space_key": space_key,
+            "target_dir": target_dir,
+            "manifest": str(manifest_path),
+            "exported": exported,
+            "unchanged": unchanged,
+            "removed": removed,
+            "failed": failed,
+        }
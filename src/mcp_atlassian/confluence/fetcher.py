@@ -0,0 +1,27 @@
+"""The ConfluenceFetcher class combining all Confluence operation mixins."""
+
+from .comments import CommentsMixin
+from .export import ExportMixin
+from .labels import LabelsMixin
+from .pages import PagesMixin
+from .search import SearchMixin
+from .spaces import SpacesMixin
+from .users import UsersMixin
+
+
+class ConfluenceFetcher(
+    SearchMixin,
+    SpacesMixin,
+    PagesMixin,
+    CommentsMixin,
+    LabelsMixin,
+    UsersMixin,
+    ExportMixin,
+):
+    """Main entry point for Confluence operations, providing backward compatibility.
+
+    This class combines functionality from various mixins to maintain the same
+    API as the original ConfluenceFetcher class.
+    """
+
+    pass
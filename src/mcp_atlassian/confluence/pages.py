@@ -1,12 +1,16 @@
 """Module for Confluence page operations."""
 
 import logging
+from collections.abc import Generator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.confluence import ConfluencePage
+from ..models.confluence import ConfluencePage, ConfluencePageTreeNode
+from ..utils.singleflight import coalesced
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
@@ -15,6 +19,7 @@ logger = logging.getLogger("mcp-atlassian")
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    @coalesced
     def get_page_content(
         self, page_id: str, *, convert_to_markdown: bool = True
     ) -> ConfluencePage:
@@ -444,6 +449,256 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             return []
 
+    def _get_all_child_pages(
+        self, page_id: str, expand: str, page_size: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every direct child page of a page, following pagination.
+
+        Servers may cap the page size below the requested one, so a short
+        batch does not mean the last one: paging stops on an empty batch, or
+        when a paginated response has no ``_links.next``.
+
+        Args:
+            page_id: The ID of the parent page
+            expand: Fields to expand in the response
+            page_size: Number of children requested per API call
+
+        Returns:
+            List of raw child page dictionaries from the Confluence API
+        """
+        children: list[dict[str, Any]] = []
+        start = 0
+        while True:
+            results = self.confluence.get_page_child_by_type(
+                page_id=page_id,
+                type="page",
+                start=start,
+                limit=page_size,
+                expand=expand,
+            )
+
+            # Handle both pagination modes
+            if isinstance(results, dict) and "results" in results:
+                batch = results.get("results", [])
+                has_next = bool(results.get("_links", {}).get("next"))
+            else:
+                batch = results or []
+                has_next = True
+
+            children.extend(batch)
+            if not batch or not has_next:
+                return children
+            start += len(batch)
+
+    def _get_tree_level(
+        self,
+        page_id: str,
+        expand: str,
+        page_size: int,
+        *,
+        include_content: bool,
+        convert_to_markdown: bool,
+    ) -> list[ConfluencePage]:
+        """
+        Fetch and convert all children of a single page for a tree walk.
+
+        Runs on a worker thread so that fetching and body conversion for
+        sibling subtrees overlap.
+
+        Args:
+            page_id: The ID of the parent page
+            expand: Fields to expand in the response
+            page_size: Number of children requested per API call
+            include_content: Whether page bodies were requested
+            convert_to_markdown: Whether bodies should be converted to markdown
+
+        Returns:
+            List of ConfluencePage models for the children of the page
+        """
+        page_models = []
+        for page in self._get_all_child_pages(page_id, expand, page_size):
+            space_key = page.get("space", {}).get("key", "")
+            content_override = None
+            if include_content:
+                content = page.get("body", {}).get("storage", {}).get("value", "")
+                if content:
+                    processed_html, processed_markdown = (
+                        self.preprocessor.process_html_content(
+                            content, space_key=space_key
+                        )
+                    )
+                    content_override = (
+                        processed_markdown if convert_to_markdown else processed_html
+                    )
+
+            page_models.append(
+                ConfluencePage.from_api_response(
+                    page,
+                    base_url=self.config.url,
+                    include_body=include_content,
+                    content_override=content_override,
+                    content_format="markdown" if convert_to_markdown else "storage",
+                    is_cloud=self.config.is_cloud,
+                )
+            )
+        return page_models
+
+    def iter_page_tree(
+        self,
+        page_id: str,
+        *,
+        max_depth: int = 3,
+        max_nodes: int = 200,
+        include_content: bool = False,
+        convert_to_markdown: bool = True,
+        max_workers: int = 4,
+        page_size: int = 50,
+    ) -> Generator[ConfluencePageTreeNode, None, bool]:
+        """
+        Walk the descendants of a page breadth-first, yielding pages as found.
+
+        Each level of the tree is fetched with up to ``max_workers`` concurrent
+        requests, and every parent's children are paginated completely. Nodes
+        are yielded as soon as their parent's children have been fetched, so
+        callers can start consuming the tree before the walk has finished.
+
+        Args:
+            page_id: The ID of the root page (the root itself is not yielded)
+            max_depth: Maximum depth to descend, where direct children are depth 1
+            max_nodes: Maximum number of pages to yield before stopping
+            include_content: Whether to fetch and convert page bodies
+            convert_to_markdown: When True, bodies are converted to markdown,
+                               otherwise processed HTML is returned
+            max_workers: Maximum number of concurrent child requests
+            page_size: Number of children requested per API call
+
+        Yields:
+            ConfluencePageTreeNode for each discovered descendant
+
+        Returns:
+            True if the walk stopped at ``max_nodes`` with further descendants
+            left unvisited, False if every reachable descendant was yielded
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+        """
+        if max_depth < 1 or max_nodes < 1:
+            return False
+
+        expand = "version,space"
+        if include_content:
+            expand = f"{expand},body.storage"
+
+        yielded = 0
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="confluence-tree"
+        )
+        try:
+            level = [page_id]
+            depth = 1
+            while level and depth <= max_depth:
+                pending: dict[Future[list[ConfluencePage]], str] = {
+                    executor.submit(
+                        self._get_tree_level,
+                        parent_id,
+                        expand,
+                        page_size,
+                        include_content=include_content,
+                        convert_to_markdown=convert_to_markdown,
+                    ): parent_id
+                    for parent_id in level
+                }
+                next_level: list[str] = []
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent_id = pending.pop(future)
+                        try:
+                            children = future.result()
+                        except HTTPError as http_err:
+                            if (
+                                http_err.response is not None
+                                and http_err.response.status_code in [401, 403]
+                            ):
+                                error_msg = (
+                                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
+                                    "Token may be expired or invalid. Please verify credentials."
+                                )
+                                logger.error(error_msg)
+                                raise MCPAtlassianAuthenticationError(
+                                    error_msg
+                                ) from http_err
+                            logger.error(
+                                f"HTTP error fetching child pages for page {parent_id}: {http_err}"
+                            )
+                            continue
+                        except Exception as e:  # noqa: BLE001 - Skip unreadable subtrees
+                            logger.error(
+                                f"Error fetching child pages for page {parent_id}: {str(e)}"
+                            )
+                            logger.debug("Full exception details:", exc_info=True)
+                            continue
+
+                        for child in children:
+                            # Only stop once a page beyond the limit shows up
+                            if yielded >= max_nodes:
+                                return True
+                            yield ConfluencePageTreeNode(
+                                page=child, parent_id=parent_id, depth=depth
+                            )
+                            yielded += 1
+                            next_level.append(child.id)
+                level = next_level
+                depth += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return False
+
+    def get_page_tree(
+        self,
+        page_id: str,
+        *,
+        max_depth: int = 3,
+        max_nodes: int = 200,
+        include_content: bool = False,
+        convert_to_markdown: bool = True,
+        max_workers: int = 4,
+    ) -> tuple[list[ConfluencePageTreeNode], bool]:
+        """
+        Get the descendants of a page, walked breadth-first.
+
+        Args:
+            page_id: The ID of the root page
+            max_depth: Maximum depth to descend, where direct children are depth 1
+            max_nodes: Maximum number of pages to return
+            include_content: Whether to fetch and convert page bodies
+            convert_to_markdown: When True, bodies are converted to markdown,
+                               otherwise processed HTML is returned
+            max_workers: Maximum number of concurrent child requests
+
+        Returns:
+            Tuple of the ConfluencePageTreeNode models in discovery order and
+            whether the walk was truncated at ``max_nodes``
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+        """
+        walk = self.iter_page_tree(
+            page_id,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+            include_content=include_content,
+            convert_to_markdown=convert_to_markdown,
+            max_workers=max_workers,
+        )
+        nodes: list[ConfluencePageTreeNode] = []
+        while True:
+            try:
+                nodes.append(next(walk))
+            except StopIteration as stop:
+                return nodes, stop.value
+
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
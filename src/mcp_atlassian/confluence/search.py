@@ -1,6 +1,7 @@
 """Module for Confluence search operations."""
 
 import logging
+from collections.abc import Iterator
 
 import requests
 from requests.exceptions import HTTPError
@@ -8,7 +9,11 @@ from requests.exceptions import HTTPError
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage, ConfluenceSearchResult
 from .client import ConfluenceClient
-from .utils import quote_cql_identifier_if_needed
+from .utils import (
+    decode_search_cursor,
+    next_search_cursor,
+    quote_cql_identifier_if_needed,
+)
 
 logger = logging.getLogger("mcp-atlassian")
 
@@ -16,6 +21,41 @@ logger = logging.getLogger("mcp-atlassian")
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
 
+    def _apply_spaces_filter(self, cql: str, spaces_filter: str | None) -> str:
+        """
+        Restrict a CQL query to the configured or requested spaces.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by, overrides config
+
+        Returns:
+            The CQL query with the space restriction applied
+        """
+        # Use spaces_filter parameter if provided, otherwise fall back to config
+        filter_to_use = spaces_filter or self.config.spaces_filter
+
+        # Apply spaces filter if present
+        if filter_to_use:
+            # Split spaces filter by commas and handle possible whitespace
+            spaces = [s.strip() for s in filter_to_use.split(",")]
+
+            # Build the space filter query part using proper quoting for each space key
+            space_query = " OR ".join(
+                [f"space = {quote_cql_identifier_if_needed(space)}" for space in spaces]
+            )
+
+            # Add the space filter to existing query with parentheses
+            if cql and space_query:
+                if "space = " not in cql:  # Only add if not already filtering by space
+                    cql = f"({cql}) AND ({space_query})"
+            else:
+                cql = space_query
+
+            logger.info(f"Applied spaces filter to query: {cql}")
+
+        return cql
+
     def search(
         self, cql: str, limit: int = 10, spaces_filter: str | None = None
     ) -> list[ConfluencePage]:
@@ -33,36 +73,85 @@ class SearchMixin(ConfluenceClient):
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
         """
-        try:
-            # Use spaces_filter parameter if provided, otherwise fall back to config
-            filter_to_use = spaces_filter or self.config.spaces_filter
-
-            # Apply spaces filter if present
-            if filter_to_use:
-                # Split spaces filter by commas and handle possible whitespace
-                spaces = [s.strip() for s in filter_to_use.split(",")]
-
-                # Build the space filter query part using proper quoting for each space key
-                space_query = " OR ".join(
-                    [
-                        f"space = {quote_cql_identifier_if_needed(space)}"
-                        for space in spaces
-                    ]
-                )
+        return self.search_page(cql, limit=limit, spaces_filter=spaces_filter).results
+
+    def iter_search(
+        self,
+        cql: str,
+        *,
+        spaces_filter: str | None = None,
+        page_size: int = 25,
+        max_results: int | None = None,
+    ) -> Iterator[ConfluencePage]:
+        """
+        Stream search results page by page, following continuation cursors.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys to filter by, overrides config
+            page_size: Number of results requested per API call
+            max_results: Optional maximum number of results to yield
 
-                # Add the space filter to existing query with parentheses
-                if cql and space_query:
-                    if (
-                        "space = " not in cql
-                    ):  # Only add if not already filtering by space
-                        cql = f"({cql}) AND ({space_query})"
-                else:
-                    cql = space_query
+        Yields:
+            ConfluencePage models in result order
 
-                logger.info(f"Applied spaces filter to query: {cql}")
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+        """
+        cursor: str | None = None
+        yielded = 0
+        while True:
+            result_page = self.search_page(
+                cql, limit=page_size, spaces_filter=spaces_filter, cursor=cursor
+            )
+            for page in result_page.results:
+                yield page
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+            if not result_page.results or not result_page.next_cursor:
+                return
+            cursor = result_page.next_cursor
+
+    def search_page(
+        self,
+        cql: str,
+        limit: int = 10,
+        spaces_filter: str | None = None,
+        cursor: str | None = None,
+    ) -> ConfluenceSearchResult:
+        """
+        Fetch a single page of CQL search results together with its cursor.
 
-            # Execute the CQL search query
-            results = self.confluence.cql(cql=cql, limit=limit)
+        Args:
+            cql: Confluence Query Language string, ignored when a cursor is given
+            limit: Maximum number of results to return
+            spaces_filter: Optional comma-separated list of space keys to filter by,
+                overrides config; ignored when a cursor is given
+            cursor: Optional continuation token from a previous page's
+                ``next_cursor``; the query it was created for is continued
+
+        Returns:
+            ConfluenceSearchResult with the result pages and ``next_cursor`` set
+            when more results are available
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+            ValueError: If the cursor is malformed
+        """
+        cursor_params = decode_search_cursor(cursor) if cursor else None
+
+        try:
+            if cursor_params is not None:
+                # Continue the query the cursor was created for
+                cql = cursor_params["cql"]
+                results = self.confluence.get(
+                    "rest/api/search", params={**cursor_params, "limit": limit}
+                )
+            else:
+                cql = self._apply_spaces_filter(cql, spaces_filter)
+                # Execute the CQL search query
+                results = self.confluence.cql(cql=cql, limit=limit)
 
             # Convert the response to a search result model
             search_result = ConfluenceSearchResult.from_api_response(
@@ -72,29 +161,20 @@ class SearchMixin(ConfluenceClient):
                 is_cloud=self.config.is_cloud,
             )
 
-            # Process result excerpts as content
-            processed_pages = []
+            # Index excerpts by content ID in a single pass over the raw results
+            excerpts = {
+                str(item["content"].get("id")): item.get("excerpt", "")
+                for item in results.get("results", [])
+                if item.get("content")
+            }
+
+            # Use the highlighted excerpt as the content of each result page
             for page in search_result.results:
-                # Get the excerpt from the original search results
-                for result_item in results.get("results", []):
-                    if result_item.get("content", {}).get("id") == page.id:
-                        excerpt = result_item.get("excerpt", "")
-                        if excerpt:
-                            # Process the excerpt as HTML content
-                            space_key = page.space.key if page.space else ""
-                            processed_html, processed_markdown = (
-                                self.preprocessor.process_html_content(
-                                    excerpt, space_key=space_key
-                                )
-                            )
-                            # Create a new page with processed content
-                            page.content = processed_markdown
-                        break
-
-                processed_pages.append(page)
-
-            # Return the list of result pages with processed content
-            return processed_pages
+                if excerpt := excerpts.get(page.id):
+                    page.content = self.preprocessor.highlight_excerpt(excerpt)
+
+            search_result.next_cursor = next_search_cursor(cql, results)
+            return search_result
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
                 401,
@@ -111,14 +191,14 @@ class SearchMixin(ConfluenceClient):
                 raise http_err
         except KeyError as e:
             logger.error(f"Missing key in search results: {str(e)}")
-            return []
+            return ConfluenceSearchResult()
         except requests.RequestException as e:
             logger.error(f"Network error during search: {str(e)}")
-            return []
+            return ConfluenceSearchResult()
         except (ValueError, TypeError) as e:
             logger.error(f"Error processing search results: {str(e)}")
-            return []
+            return ConfluenceSearchResult()
         except Exception as e:  # noqa: BLE001 - Intentional fallback with logging
             logger.error(f"Unexpected error during search: {str(e)}")
             logger.debug("Full exception details for search:", exc_info=True)
-            return []
+            return ConfluenceSearchResult()
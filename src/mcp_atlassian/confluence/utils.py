@@ -1,6 +1,11 @@
 """Utility functions specific to Confluence operations."""
 
+import base64
+import binascii
+import json
 import logging
+from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 from .constants import RESERVED_CQL_WORDS
 
@@ -64,3 +69,74 @@ def quote_cql_identifier_if_needed(identifier: str) -> str:
         # Return the original identifier if no quoting is needed
         logger.debug(f"Identifier '{identifier}' does not need quoting.")
         return identifier
+
+
+def encode_search_cursor(params: dict[str, Any]) -> str:
+    """
+    Encode the request parameters of the next search page as an opaque cursor.
+
+    Args:
+        params: Query parameters for the next ``rest/api/search`` request
+
+    Returns:
+        URL-safe, opaque continuation token
+    """
+    raw = json.dumps(params, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor produced by ``encode_search_cursor``.
+
+    Args:
+        cursor: The opaque continuation token
+
+    Returns:
+        Query parameters for the next ``rest/api/search`` request
+
+    Raises:
+        ValueError: If the cursor is malformed or does not carry a CQL query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        params = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+
+    if not isinstance(params, dict) or not params.get("cql"):
+        raise ValueError(f"Invalid search cursor: {cursor!r}")
+    return params
+
+
+def next_search_cursor(cql: str, response: dict[str, Any]) -> str | None:
+    """
+    Build the cursor for the page following a ``rest/api/search`` response.
+
+    Confluence Cloud returns a ``_links.next`` link carrying its own cursor,
+    which is followed as-is. Server/Data Center only reports offsets, so the
+    next ``start`` is derived from ``start``, ``size`` and ``totalSize``.
+
+    Args:
+        cql: The CQL query the response belongs to
+        response: The raw search response
+
+    Returns:
+        Opaque cursor for the next page, or None if this was the last page
+    """
+    if not isinstance(response, dict):
+        return None
+
+    if next_link := response.get("_links", {}).get("next"):
+        query = parse_qs(urlparse(next_link).query)
+        params: dict[str, Any] = {key: values[-1] for key, values in query.items()}
+        params.setdefault("cql", cql)
+        return encode_search_cursor(params)
+
+    results = response.get("results", [])
+    start = response.get("start", 0) or 0
+    size = response.get("size", len(results)) or 0
+    total_size = response.get("totalSize")
+    if results and size and total_size is not None and start + size < total_size:
+        return encode_search_cursor({"cql": cql, "start": start + size})
+    return None
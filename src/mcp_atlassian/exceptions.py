@@ -1,4 +1,35 @@
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
+
+
 class MCPAtlassianAuthenticationError(Exception):
     """Raised when Atlassian API authentication fails (401/403)."""
 
     pass
+
+
+class MCPAtlassianRateLimitError(HTTPError):
+    """Raised when Atlassian API throttling (429) outlasts the retry budget.
+
+    As an HTTPError carrying the last 429 response, it takes the same paths
+    as other API errors.
+    """
+
+    def __init__(
+        self, *args: object, retry_after: float | None = None, **kwargs: object
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+class MCPAtlassianCircuitOpenError(RequestsConnectionError):
+    """Raised without contacting an Atlassian site whose circuit breaker is open.
+
+    The site failed repeatedly; calls fail fast until a probe succeeds.
+    """
+
+    def __init__(
+        self, *args: object, retry_after: float | None = None, **kwargs: object
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
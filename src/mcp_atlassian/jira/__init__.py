@@ -1,71 +1,39 @@
 """Jira API module for mcp_atlassian.
 
 This module provides various Jira API client implementations.
-"""
-
-# flake8: noqa
-
-# Re-export the Jira class for backward compatibility
-from atlassian.jira import Jira
-
-from .client import JiraClient
-from .comments import CommentsMixin
-from .config import JiraConfig
-from .epics import EpicsMixin
-from .fields import FieldsMixin
-from .formatting import FormattingMixin
-from .issues import IssuesMixin
-from .links import LinksMixin
-from .projects import ProjectsMixin
-from .search import SearchMixin
-from .sprints import SprintsMixin
-from .transitions import TransitionsMixin
-from .users import UsersMixin
-from .worklog import WorklogMixin
-from .boards import BoardsMixin
-from .attachments import AttachmentsMixin
 
+The exports are resolved on first access, so that ``mcp_atlassian.jira.config``
+can be imported without loading the API client and its dependencies.
+"""
 
-class JiraFetcher(
-    ProjectsMixin,
-    FieldsMixin,
-    FormattingMixin,
-    TransitionsMixin,
-    WorklogMixin,
-    EpicsMixin,
-    CommentsMixin,
-    SearchMixin,
-    IssuesMixin,
-    UsersMixin,
-    BoardsMixin,
-    SprintsMixin,
-    AttachmentsMixin,
-    LinksMixin,
-):
-    """
-    The main Jira client class providing access to all Jira operations.
-
-    This class inherits from multiple mixins that provide specific functionality:
-    - ProjectsMixin: Project-related operations
-    - FieldsMixin: Field-related operations
-    - FormattingMixin: Content formatting utilities
-    - TransitionsMixin: Issue transition operations
-    - WorklogMixin: Worklog operations
-    - EpicsMixin: Epic operations
-    - CommentsMixin: Comment operations
-    - SearchMixin: Search operations
-    - IssuesMixin: Issue operations
-    - UsersMixin: User operations
-    - BoardsMixin: Board operations
-    - SprintsMixin: Sprint operations
-    - AttachmentsMixin: Attachment download operations
-    - LinksMixin: Issue link operations
-
-    The class structure is designed to maintain backward compatibility while
-    improving code organization and maintainability.
-    """
-
-    pass
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from atlassian.jira import Jira
+
+    from .client import JiraClient
+    from .config import JiraConfig
+    from .fetcher import JiraFetcher
+
+# Module providing each exported name; Jira is re-exported for backward
+# compatibility
+_EXPORTS = {
+    "JiraFetcher": ".fetcher",
+    "JiraConfig": ".config",
+    "JiraClient": ".client",
+    "Jira": "atlassian.jira",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = ["JiraFetcher", "JiraConfig", "JiraClient", "Jira"]
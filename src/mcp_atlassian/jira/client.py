@@ -9,9 +9,13 @@ from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.circuitbreaker import protect_session
 from mcp_atlassian.utils.logging import log_config_param, mask_sensitive
+from mcp_atlassian.utils.metrics import instrument_session
 from mcp_atlassian.utils.oauth import configure_oauth_session
+from mcp_atlassian.utils.ratelimit import rate_limit_session
 from mcp_atlassian.utils.ssl import configure_ssl_verification
+from mcp_atlassian.utils.tracing import trace_session
 
 from .config import JiraConfig
 
@@ -102,6 +106,10 @@ class JiraClient:
             session=self.jira._session,
             ssl_verify=self.config.ssl_verify,
         )
+        instrument_session(self.jira._session, "jira")
+        trace_session(self.jira._session, "jira")
+        rate_limit_session(self.jira._session, "jira", self.jira.url)
+        protect_session(self.jira._session, self.jira.url)
 
         # Proxy configuration
         proxies = {}
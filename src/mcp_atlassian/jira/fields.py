@@ -3,7 +3,8 @@
 import logging
 from typing import Any
 
-from thefuzz import fuzz
+from mcp_atlassian.utils.metrics import record_cache_lookup
+from mcp_atlassian.utils.singleflight import coalesced
 
 from .client import JiraClient
 from .protocols import EpicOperationsProto, UsersOperationsProto
@@ -21,6 +22,7 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
 
     _field_name_to_id_map: dict[str, str] | None = None  # Cache for name -> id mapping
 
+    @coalesced
     def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get all available fields from Jira.
@@ -34,7 +36,9 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         try:
             # Use cached field data if available and refresh is not requested
             if self._field_ids_cache is not None and not refresh:
+                record_cache_lookup("jira_fields", hit=True)
                 return self._field_ids_cache
+            record_cache_lookup("jira_fields", hit=False)
 
             if refresh:
                 self._field_name_to_id_map = (
@@ -479,6 +483,9 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             if not keyword:
                 return fields[:limit]
 
+            # Deferred so the fuzzy matching library only loads when searched
+            from thefuzz import fuzz
+
             def similarity(keyword: str, field: dict) -> int:
                 """Calculate similarity score between keyword and field."""
                 name_candidates = [
@@ -1,7 +1,9 @@
 """Module for Jira issue operations."""
 
 import logging
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -10,6 +12,8 @@ from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssue
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
+from ..utils.singleflight import coalesced
+from ..utils.tracing import traced
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import (
@@ -22,6 +26,9 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Issue keys (PROJ-123) or numeric issue IDs, safe to embed in JQL
+ISSUE_KEY_PATTERN = re.compile(r"^(?:[A-Za-z][A-Za-z0-9_]*-\d+|\d+)$")
+
 
 class IssuesMixin(
     JiraClient,
@@ -33,6 +40,7 @@ class IssuesMixin(
 ):
     """Mixin for Jira issue operations."""
 
+    @coalesced
     def get_issue(
         self,
         issue_key: str,
@@ -265,6 +273,7 @@ class IssuesMixin(
                 return []
         return []
 
+    @traced("jira.extract_epic_information")
     def _extract_epic_information(self, issue: dict) -> dict[str, str | None]:
         """
         Extract epic information from an issue.
@@ -1354,6 +1363,191 @@ class IssuesMixin(
             logger.error(f"Error in bulk issue creation: {str(e)}")
             raise
 
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        comment_limit: int | str | None = 0,
+        chunk_size: int = 50,
+        max_workers: int = 4,
+    ) -> list[JiraIssue]:
+        """
+        Get multiple Jira issues by key.
+
+        The keys are fetched with ``key in (...)`` JQL searches of up to
+        ``chunk_size`` keys, run concurrently. Comments are fetched in
+        parallel when ``comment_limit`` allows them and the ``comment`` field
+        is requested. Unlike get_issue, no per-issue epic lookups are made.
+
+        Args:
+            issue_keys: Issue keys or IDs (e.g., ['PROJ-123', 'PROJ-124'])
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Optional items to expand (comma-separated)
+            comment_limit: Maximum number of comments per issue, "all", or 0 for none
+            chunk_size: Maximum number of keys per search request
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of JiraIssue models in the order of the requested keys;
+            keys without a visible issue are left out
+
+        Raises:
+            ValueError: If an issue key is malformed
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error retrieving the issues
+        """
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys))
+        invalid = [key for key in keys if not ISSUE_KEY_PATTERN.match(key)]
+        if invalid:
+            msg = f"Invalid issue keys: {', '.join(invalid)}"
+            raise ValueError(msg)
+        if not keys:
+            return []
+
+        # Normalize the fields once; every issue shares the same projection
+        requested_fields: str | list[str]
+        if fields is None:
+            requested_fields = list(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields, str):
+            requested_fields = (
+                fields
+                if fields == "*all"
+                else [field.strip() for field in fields.split(",") if field.strip()]
+            )
+        else:
+            requested_fields = list(fields)
+        fields_param = (
+            requested_fields
+            if isinstance(requested_fields, str)
+            else ",".join(requested_fields)
+        )
+
+        size = max(1, min(chunk_size, 50))
+        chunks = [keys[i : i + size] for i in range(0, len(keys), size)]
+
+        try:
+            # Threads are started on demand, so a single chunk uses one thread
+            with ThreadPoolExecutor(
+                max_workers=max(1, max_workers), thread_name_prefix="jira-batch-get"
+            ) as executor:
+                raw_issues = [
+                    issue
+                    for chunk_issues in executor.map(
+                        lambda chunk: self._search_issue_keys(
+                            chunk, fields_param, expand
+                        ),
+                        chunks,
+                    )
+                    for issue in chunk_issues
+                ]
+
+                comment_limit_int = self._normalize_comment_limit(comment_limit)
+                with_comments = [
+                    issue
+                    for issue in raw_issues
+                    if isinstance((issue.get("fields") or {}).get("comment"), dict)
+                ]
+                # Issues are hydrated concurrently; a limit of 0 sends no requests
+                comments = executor.map(
+                    lambda issue: self._get_issue_comments_if_needed(
+                        issue.get("key", ""), comment_limit_int
+                    ),
+                    with_comments,
+                )
+                for issue, issue_comments in zip(with_comments, comments, strict=True):
+                    issue["fields"]["comment"]["comments"] = issue_comments
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving issues {', '.join(keys)}: {str(e)}")
+            msg = f"Error retrieving issues: {str(e)}"
+            raise Exception(msg) from e
+
+        base_url = self.config.url if hasattr(self, "config") else None
+        issues_by_key: dict[str, JiraIssue] = {}
+        for issue_data in raw_issues:
+            model = JiraIssue.from_api_response(
+                issue_data, base_url=base_url, requested_fields=requested_fields
+            )
+            issues_by_key[str(model.key).upper()] = model
+            issues_by_key[str(model.id)] = model
+        ordered = (issues_by_key.get(key) for key in keys)
+        return list({id(model): model for model in ordered if model}.values())
+
+    def _search_issue_keys(
+        self, keys: list[str], fields_param: str, expand: str | None
+    ) -> list[dict[str, Any]]:
+        """
+        Search for issues by key with a single JQL query.
+
+        Jira rejects a query naming an issue that does not exist or is not
+        visible; those keys are taken from the error messages and the query
+        is repeated without them.
+
+        Args:
+            keys: Issue keys or IDs
+            fields_param: Comma-separated fields to return, or "*all"
+            expand: Optional items to expand (comma-separated)
+
+        Returns:
+            Raw issue dictionaries from the Jira API
+        """
+        remaining = list(keys)
+        while remaining:
+            jql = f"key in ({', '.join(remaining)})"
+            try:
+                if self.config.is_cloud:
+                    issues = self.jira.enhanced_jql_get_list_of_tickets(
+                        jql, fields=fields_param, limit=len(remaining), expand=expand
+                    )
+                else:
+                    response = self.jira.jql(
+                        jql,
+                        fields=fields_param,
+                        start=0,
+                        limit=len(remaining),
+                        expand=expand,
+                    )
+                    issues = response.get("issues") if response else []
+            except HTTPError as http_err:
+                rejected = self._rejected_issue_keys(http_err, remaining)
+                if not rejected:
+                    raise
+                logger.debug(f"Skipping unknown issue keys: {', '.join(rejected)}")
+                remaining = [key for key in remaining if key not in rejected]
+                continue
+            if not isinstance(issues, list):
+                msg = f"Unexpected return value type from Jira search: {type(issues)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return issues
+        return []
+
+    @staticmethod
+    def _rejected_issue_keys(http_err: HTTPError, keys: list[str]) -> set[str]:
+        """Find the requested keys a 400 response says do not exist."""
+        response = http_err.response
+        if response is None or response.status_code != 400:
+            return set()
+        try:
+            messages = " ".join(response.json().get("errorMessages", []))
+        except ValueError:
+            return set()
+        mentioned = {word.upper() for word in re.findall(r"'([^']+)'", messages)}
+        return {key for key in keys if key in mentioned}
+
     def batch_get_changelogs(
         self, issue_ids_or_keys: list[str], fields: list[str] | None = None
     ) -> list[JiraIssue]:
@@ -5,6 +5,7 @@ from typing import Any
 
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
+from ..utils.singleflight import coalesced
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
@@ -18,6 +19,7 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
     including project details, components, versions, and other project-related operations.
     """
 
+    @coalesced
     def get_all_projects(self, include_archived: bool = False) -> list[dict[str, Any]]:
         """
         Get all projects visible to the current user.
@@ -45,6 +45,18 @@ class IssueOperationsProto(Protocol):
     ) -> JiraIssue:
         """Get a Jira issue by key."""
 
+    @abstractmethod
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        comment_limit: int | str | None = 0,
+        chunk_size: int = 50,
+        max_workers: int = 4,
+    ) -> list[JiraIssue]:
+        """Get multiple Jira issues by key."""
+
 
 class SearchOperationsProto(Protocol):
     """Protocol defining search operations interface."""
@@ -1,17 +1,40 @@
 """Module for Jira transition operations."""
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
+from cachetools import TTLCache
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraIssue, JiraTransition
+from ..utils.singleflight import SingleFlight
+from ..utils.urls import site_key
 from .client import JiraClient
 from .protocols import IssueOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Seconds a resolved transition is reused for batch transitions
+TRANSITION_CACHE_TTL = 3600
+
+# Transition (ID, target status) by (site, project, issue type, from status,
+# target). Jira assigns workflows per project and issue type, so that pair
+# stands in for the workflow.
+_transition_cache: TTLCache[tuple[str, ...], tuple[str, str | None], float] = TTLCache(
+    maxsize=4096, ttl=TRANSITION_CACHE_TTL
+)
+_transition_cache_lock = threading.Lock()
+_transition_lookups = SingleFlight()
+
+
+def clear_transition_cache() -> None:
+    """Forget all transitions resolved for batch transitions."""
+    with _transition_cache_lock:
+        _transition_cache.clear()
+
 
 class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
     """Mixin for Jira transition operations."""
@@ -259,6 +282,282 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def batch_transition_issues(
+        self,
+        issue_keys: list[str],
+        target: str,
+        fields: dict[str, Any] | None = None,
+        comment: str | None = None,
+        max_workers: int = 4,
+    ) -> list[dict[str, Any]]:
+        """
+        Transition multiple Jira issues to the same status.
+
+        The current status, project and issue type of all issues are read
+        with one batch search. The transition leading to the target is looked
+        up once per workflow and current status, and then reused from a
+        cache. Transitions are applied concurrently, paced by the site's
+        shared rate limiter. An authentication failure (401) stops the batch:
+        transitions not started yet are reported as failed without being
+        attempted.
+
+        Args:
+            issue_keys: Keys of the issues to transition
+            target: Target status name, transition name, or transition ID
+            fields: Optional fields to set during every transition
+            comment: Optional comment to add with every transition
+            max_workers: Maximum number of concurrent transitions
+
+        Returns:
+            One outcome per issue, in the order of the keys, with the issue
+            key, a status ("transitioned", "skipped" when the issue already
+            has the target status, or "failed"), and the from/to statuses or
+            the error
+
+        Raises:
+            ValueError: If the target is empty or an issue key is malformed
+            MCPAtlassianAuthenticationError: If reading the issues fails to authenticate
+        """
+        target = str(target).strip()
+        if not target:
+            msg = "A target status or transition is required"
+            raise ValueError(msg)
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys))
+        if not keys:
+            return []
+
+        issues: dict[str, JiraIssue] = {}
+        for issue in self.batch_get_issues(keys, fields="status,issuetype,project"):
+            issues[str(issue.key).upper()] = issue
+            issues[str(issue.id)] = issue
+
+        # Shared by all issues: assignees are resolved and markdown converted once
+        fields_for_api = self._sanitize_transition_fields(fields) if fields else None
+        update_for_api = None
+        if comment:
+            transition_data: dict[str, Any] = {}
+            self._add_comment_to_transition_data(transition_data, comment)
+            update_for_api = transition_data.get("update")
+
+        def apply(key: str) -> dict[str, Any]:
+            issue = issues.get(key)
+            if issue is None:
+                return {
+                    "issue_key": key,
+                    "status": "failed",
+                    "error": "Issue not found",
+                }
+            try:
+                return self._apply_batch_transition(
+                    issue, target, fields_for_api, update_for_api
+                )
+            except (HTTPError, MCPAtlassianAuthenticationError) as e:
+                # Lookups report auth failures wrapping the HTTP error
+                http_err = e if isinstance(e, HTTPError) else e.__cause__
+                response = getattr(http_err, "response", None)
+                status_code = getattr(response, "status_code", None)
+                if status_code == 401:
+                    error = (
+                        "Authentication failed for Jira API (401). "
+                        "Token may be expired or invalid. Please verify credentials."
+                    )
+                    logger.error(error)
+                    # Transitions already running finish; queued ones are dropped
+                    executor.shutdown(wait=False, cancel_futures=True)
+                elif status_code == 403:
+                    error = f"Permission denied for Jira API (403): {str(e)}"
+                else:
+                    error = str(e)
+            except Exception as e:  # noqa: BLE001 - Reported as the issue's outcome
+                error = str(e)
+            logger.warning(f"Failed to transition {issue.key}: {error}")
+            return {"issue_key": issue.key, "status": "failed", "error": error}
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(keys))),
+            thread_name_prefix="jira-batch-transition",
+        ) as executor:
+            futures: list[Future[dict[str, Any]] | None] = []
+            for key in keys:
+                try:
+                    futures.append(executor.submit(apply, key))
+                except RuntimeError:
+                    # Shut down by an authentication failure
+                    futures.append(None)
+
+        return [
+            {
+                "issue_key": key,
+                "status": "failed",
+                "error": "Not attempted: authentication with the Jira API failed",
+            }
+            if future is None or future.cancelled()
+            else future.result()
+            for key, future in zip(keys, futures, strict=True)
+        ]
+
+    def _apply_batch_transition(
+        self,
+        issue: JiraIssue,
+        target: str,
+        fields: dict[str, Any] | None,
+        update: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Transition one issue of a batch.
+
+        Args:
+            issue: The issue, with its status, issue type and project
+            target: Target status name, transition name, or transition ID
+            fields: Sanitized fields to set during the transition
+            update: Update operations (the comment) to apply
+
+        Returns:
+            The outcome of the transition
+        """
+        from_status = issue.status.name if issue.status else None
+        if from_status and from_status.casefold() == target.casefold():
+            return {
+                "issue_key": issue.key,
+                "status": "skipped",
+                "from_status": from_status,
+                "to_status": from_status,
+            }
+
+        transition_id, to_status = self._resolve_transition(issue, target)
+        payload: dict[str, Any] = {"transition": {"id": transition_id}}
+        if fields:
+            payload["fields"] = fields
+        if update:
+            payload["update"] = update
+        base_url = self.jira.resource_url("issue")
+        try:
+            self.jira.post(f"{base_url}/{issue.key}/transitions", data=payload)
+        except HTTPError as http_err:
+            if http_err.response is None or http_err.response.status_code not in (
+                400,
+                404,
+            ):
+                raise
+            # The cached transition may predate a workflow change: look it up
+            # again, and retry if the workflow now uses another transition
+            self._forget_transition(issue, target)
+            stale_id = transition_id
+            transition_id, to_status = self._resolve_transition(issue, target)
+            if transition_id == stale_id:
+                raise
+            payload = {**payload, "transition": {"id": transition_id}}
+            self.jira.post(f"{base_url}/{issue.key}/transitions", data=payload)
+        logger.info(f"Transitioned {issue.key} with transition ID {transition_id}")
+        return {
+            "issue_key": issue.key,
+            "status": "transitioned",
+            "from_status": from_status,
+            "to_status": to_status,
+            "transition_id": transition_id,
+        }
+
+    def _resolve_transition(
+        self, issue: JiraIssue, target: str
+    ) -> tuple[str, str | None]:
+        """
+        Get the transition leading an issue to a target, through the cache.
+
+        Concurrent lookups for the same workflow and status share one request.
+
+        Args:
+            issue: The issue, with its status, issue type and project
+            target: Target status name, transition name, or transition ID
+
+        Returns:
+            The transition ID and the name of the status it leads to
+        """
+        key = self._transition_cache_key(issue, target)
+        if key is None:
+            # Without the workflow and status, the answer is specific to the issue
+            return self._find_transition(str(issue.key), target)
+
+        with _transition_cache_lock:
+            cached = _transition_cache.get(key)
+        if cached is not None:
+            return cached
+        resolved, _ = _transition_lookups.do(
+            key, self._find_transition, str(issue.key), target
+        )
+        with _transition_cache_lock:
+            _transition_cache[key] = resolved
+        return resolved
+
+    def _forget_transition(self, issue: JiraIssue, target: str) -> None:
+        """
+        Evict the cached transition leading an issue to a target.
+
+        Args:
+            issue: The issue, with its status, issue type and project
+            target: Target status name, transition name, or transition ID
+        """
+        key = self._transition_cache_key(issue, target)
+        if key is not None:
+            with _transition_cache_lock:
+                _transition_cache.pop(key, None)
+
+    def _transition_cache_key(
+        self, issue: JiraIssue, target: str
+    ) -> tuple[str, ...] | None:
+        """
+        Get the transition cache key of an issue and target.
+
+        Args:
+            issue: The issue, with its status, issue type and project
+            target: Target status name, transition name, or transition ID
+
+        Returns:
+            The cache key, or None if the issue's workflow or status is unknown
+        """
+        parts = (
+            issue.project.key if issue.project else None,
+            issue.issue_type.id if issue.issue_type else None,
+            issue.status.id if issue.status else None,
+        )
+        if not all(parts):
+            return None
+        return (site_key(self.config.url), *parts, target.casefold())
+
+    def _find_transition(self, issue_key: str, target: str) -> tuple[str, str | None]:
+        """
+        Find the available transition of an issue matching a target.
+
+        Transition IDs take precedence over transition names, which take
+        precedence over target status names.
+
+        Args:
+            issue_key: The issue key
+            target: Target status name, transition name, or transition ID
+
+        Returns:
+            The transition ID and the name of the status it leads to
+
+        Raises:
+            ValueError: If no available transition matches the target
+        """
+        transitions = self.get_transitions_models(issue_key)
+        wanted = target.casefold()
+        for matches in (
+            lambda t: str(t.id) == target,
+            lambda t: t.name.casefold() == wanted,
+            lambda t: t.to_status is not None and t.to_status.name.casefold() == wanted,
+        ):
+            for transition in transitions:
+                if matches(transition):
+                    to_status = (
+                        transition.to_status.name if transition.to_status else None
+                    )
+                    return str(transition.id), to_status
+
+        available = ", ".join(f"{t.id} ({t.name})" for t in transitions) or "none"
+        msg = f"No transition to '{target}' for {issue_key}. Available: {available}"
+        raise ValueError(msg)
+
     def _normalize_transition_id(self, transition_id: str | int | dict) -> str | int:
         """
         Normalize the transition ID to a common format.
@@ -15,6 +15,7 @@ from .confluence import (
     ConfluenceComment,
     ConfluenceLabel,
     ConfluencePage,
+    ConfluencePageTreeNode,
     ConfluenceSearchResult,
     ConfluenceSpace,
     ConfluenceUser,
@@ -99,6 +100,7 @@ __all__ = [
     "ConfluenceUser",
     "ConfluenceSpace",
     "ConfluencePage",
+    "ConfluencePageTreeNode",
     "ConfluenceComment",
     "ConfluenceLabel",
     "ConfluenceVersion",
@@ -16,6 +16,12 @@ from .constants import EMPTY_STRING
 # Type variable for the return type of from_api_response
 T = TypeVar("T", bound="ApiModel")
 
+_object_setattr = object.__setattr__
+
+# Field names of models that can be assembled directly by construct_trusted,
+# or an empty set for models that need model_construct
+_trusted_field_names: dict[type, frozenset[str]] = {}
+
 
 class ApiModel(BaseModel):
     """
@@ -43,6 +49,40 @@ class ApiModel(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement from_api_response")
 
+    @classmethod
+    def construct_trusted(cls: type[T], **values: Any) -> T:
+        """
+        Create a model instance from already-normalized values, skipping validation.
+
+        Used by ``from_api_response`` implementations of frequently built
+        models that coerce every value to its field type by hand. When every
+        field is passed, the instance is assembled directly, which is
+        considerably cheaper than both validation and ``model_construct``.
+        Otherwise this falls back to ``model_construct`` to fill in defaults.
+
+        Args:
+            **values: Field values, each already of the declared field type
+
+        Returns:
+            An instance of the model
+        """
+        field_names = _trusted_field_names.get(cls)
+        if field_names is None:
+            field_names = _trusted_field_names[cls] = (
+                frozenset()
+                if cls.__private_attributes__ or cls.__pydantic_post_init__
+                else frozenset(cls.model_fields)
+            )
+        if values.keys() != field_names:
+            return cls.model_construct(**values)
+
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", set(values))
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
     def to_simplified_dict(self) -> dict[str, Any]:
         """
         Convert the model to a simplified dictionary for API responses.
@@ -10,12 +10,13 @@ Key models:
 - ConfluenceSearchResult: Container for Confluence search (CQL) results
 - ConfluenceComment: Page and inline comments
 - ConfluenceVersion: Content versioning information
+- ConfluencePageTreeNode: A page together with its position in a page tree
 """
 
 from .comment import ConfluenceComment
 from .common import ConfluenceAttachment, ConfluenceUser
 from .label import ConfluenceLabel
-from .page import ConfluencePage, ConfluenceVersion
+from .page import ConfluencePage, ConfluencePageTreeNode, ConfluenceVersion
 from .search import ConfluenceSearchResult
 from .space import ConfluenceSpace
 
@@ -27,5 +28,6 @@ __all__ = [
     "ConfluenceComment",
     "ConfluenceLabel",
     "ConfluencePage",
+    "ConfluencePageTreeNode",
     "ConfluenceSearchResult",
 ]
@@ -9,6 +9,7 @@ from typing import Any
 
 from pydantic import Field
 
+from ...utils.tracing import traced
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
     CONFLUENCE_DEFAULT_ID,
@@ -111,6 +112,7 @@ class ConfluencePage(ApiModel, TimestampMixin):
         return self.content
 
     @classmethod
+    @traced("confluence.parse_page")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ConfluencePage":
         """
         Create a ConfluencePage from a Confluence API response.
@@ -211,11 +213,11 @@ class ConfluencePage(ApiModel, TimestampMixin):
                 # Server format: {base_url}/pages/viewpage.action?pageId={page_id}
                 url = f"{base_url}/pages/viewpage.action?pageId={page_id}"
 
-        return cls(
+        return cls.construct_trusted(
             id=str(data.get("id", CONFLUENCE_DEFAULT_ID)),
-            title=data.get("title", EMPTY_STRING),
-            type=data.get("type", "page"),
-            status=data.get("status", "current"),
+            title=str(data.get("title") or EMPTY_STRING),
+            type=str(data.get("type") or "page"),
+            status=str(data.get("status") or "current"),
             space=space,
             content=content,
             content_format=content_format,
@@ -223,8 +225,8 @@ class ConfluencePage(ApiModel, TimestampMixin):
             updated=updated,
             author=author,
             version=version,
-            ancestors=data.get("ancestors", []),
-            children=data.get("children", {}),
+            ancestors=data.get("ancestors") or [],
+            children=data.get("children") or {},
             attachments=attachments,
             url=url,
         )
@@ -270,3 +272,23 @@ class ConfluencePage(ApiModel, TimestampMixin):
             ]
 
         return result
+
+
+class ConfluencePageTreeNode(ApiModel):
+    """
+    Model representing a page discovered while walking a Confluence page tree.
+
+    Wraps the page itself together with its position in the hierarchy
+    relative to the root page the walk started from.
+    """
+
+    page: ConfluencePage
+    parent_id: str = CONFLUENCE_DEFAULT_ID
+    depth: int = 1
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        result = self.page.to_simplified_dict()
+        result["parent_id"] = self.parent_id
+        result["depth"] = self.depth
+        return result
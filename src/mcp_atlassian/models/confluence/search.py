@@ -27,6 +27,7 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
     results: list[ConfluencePage] = Field(default_factory=list)
     cql_query: str | None = None
     search_duration: int | None = None
+    next_cursor: str | None = None
 
     @classmethod
     def from_api_response(
@@ -63,6 +64,18 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
             search_duration=data.get("searchDuration"),
         )
 
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        result: dict[str, Any] = {
+            "total": self.total_size,
+            "start": self.start,
+            "limit": self.limit,
+            "results": [page.to_simplified_dict() for page in self.results],
+        }
+        if self.next_cursor:
+            result["next_cursor"] = self.next_cursor
+        return result
+
     @model_validator(mode="after")
     def validate_search_result(self) -> "ConfluenceSearchResult":
         """Validate the search result and log warnings if needed."""
@@ -54,9 +54,8 @@ class JiraComment(ApiModel, TimestampMixin):
             author = JiraUser.from_api_response(author_data)
 
         # Ensure ID is a string
-        comment_id = data.get("id", JIRA_DEFAULT_ID)
-        if comment_id is not None:
-            comment_id = str(comment_id)
+        comment_id = data.get("id")
+        comment_id = str(comment_id) if comment_id is not None else JIRA_DEFAULT_ID
 
         # Get the body content
         body_content = EMPTY_STRING
@@ -70,7 +69,7 @@ class JiraComment(ApiModel, TimestampMixin):
             # Handle plain text or HTML content
             body_content = str(body)
 
-        return cls(
+        return cls.construct_trusted(
             id=comment_id,
             body=body_content,
             created=str(data.get("created", EMPTY_STRING)),
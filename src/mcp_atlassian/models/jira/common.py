@@ -64,7 +64,7 @@ class JiraUser(ApiModel):
             else:
                 logger.debug(f"Unexpected avatar data format: {type(avatars)}")
 
-        return cls(
+        return cls.construct_trusted(
             account_id=data.get("accountId"),
             display_name=str(data.get("displayName", UNASSIGNED)),
             email=data.get("emailAddress"),
@@ -122,7 +122,7 @@ class JiraStatusCategory(ApiModel):
         except (ValueError, TypeError):
             id_value = 0
 
-        return cls(
+        return cls.construct_trusted(
             id=id_value,
             key=str(data.get("key", EMPTY_STRING)),
             name=str(data.get("name", UNKNOWN)),
@@ -166,11 +166,10 @@ class JiraStatus(ApiModel):
             category = JiraStatusCategory.from_api_response(category_data)
 
         # Ensure ID is a string (API sometimes returns integers)
-        status_id = data.get("id", JIRA_DEFAULT_ID)
-        if status_id is not None:
-            status_id = str(status_id)
+        status_id = data.get("id")
+        status_id = str(status_id) if status_id is not None else JIRA_DEFAULT_ID
 
-        return cls(
+        return cls.construct_trusted(
             id=status_id,
             name=str(data.get("name", UNKNOWN)),
             description=data.get("description"),
@@ -219,11 +218,12 @@ class JiraIssueType(ApiModel):
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
-        issue_type_id = data.get("id", JIRA_DEFAULT_ID)
-        if issue_type_id is not None:
-            issue_type_id = str(issue_type_id)
+        issue_type_id = data.get("id")
+        issue_type_id = (
+            str(issue_type_id) if issue_type_id is not None else JIRA_DEFAULT_ID
+        )
 
-        return cls(
+        return cls.construct_trusted(
             id=issue_type_id,
             name=str(data.get("name", UNKNOWN)),
             description=data.get("description"),
@@ -263,11 +263,10 @@ class JiraPriority(ApiModel):
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
-        priority_id = data.get("id", JIRA_DEFAULT_ID)
-        if priority_id is not None:
-            priority_id = str(priority_id)
+        priority_id = data.get("id")
+        priority_id = str(priority_id) if priority_id is not None else JIRA_DEFAULT_ID
 
-        return cls(
+        return cls.construct_trusted(
             id=priority_id,
             name=str(data.get("name", NONE_VALUE)),
             description=data.get("description"),
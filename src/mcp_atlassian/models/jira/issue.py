@@ -6,10 +6,19 @@ This module provides Pydantic models for Jira issues.
 
 import logging
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Literal
 
-from pydantic import Field
+from pydantic import (
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
+from ...utils.tracing import traced
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
     EMPTY_STRING,
@@ -47,6 +56,284 @@ EPIC_LINK_PATTERNS = [
 ]
 
 
+def _parse_user(fields: dict[str, Any], field_name: str) -> JiraUser | None:
+    user_data = fields.get(field_name)
+    return JiraUser.from_api_response(user_data) if user_data else None
+
+
+def _parse_status(data: dict[str, Any], fields: dict[str, Any]) -> JiraStatus | None:
+    status_data = fields.get("status")
+    return JiraStatus.from_api_response(status_data) if status_data else None
+
+
+def _parse_issue_type(
+    data: dict[str, Any], fields: dict[str, Any]
+) -> JiraIssueType | None:
+    issue_type_data = fields.get("issuetype")
+    return JiraIssueType.from_api_response(issue_type_data) if issue_type_data else None
+
+
+def _parse_priority(
+    data: dict[str, Any], fields: dict[str, Any]
+) -> JiraPriority | None:
+    priority_data = fields.get("priority")
+    return JiraPriority.from_api_response(priority_data) if priority_data else None
+
+
+def _parse_assignee(data: dict[str, Any], fields: dict[str, Any]) -> JiraUser | None:
+    return _parse_user(fields, "assignee")
+
+
+def _parse_reporter(data: dict[str, Any], fields: dict[str, Any]) -> JiraUser | None:
+    return _parse_user(fields, "reporter")
+
+
+def _parse_project(data: dict[str, Any], fields: dict[str, Any]) -> JiraProject | None:
+    project_data = fields.get("project")
+    if isinstance(project_data, dict):
+        return JiraProject.from_api_response(project_data)
+    return None
+
+
+def _parse_resolution(
+    data: dict[str, Any], fields: dict[str, Any]
+) -> JiraResolution | None:
+    resolution_data = fields.get("resolution")
+    if isinstance(resolution_data, dict):
+        return JiraResolution.from_api_response(resolution_data)
+    return None
+
+
+def _parse_comments(data: dict[str, Any], fields: dict[str, Any]) -> list[JiraComment]:
+    comments_field = fields.get("comment", {})
+    if isinstance(comments_field, dict) and "comments" in comments_field:
+        comments_data = comments_field["comments"]
+        if isinstance(comments_data, list):
+            return [
+                JiraComment.from_api_response(comment)
+                for comment in comments_data
+                if comment
+            ]
+    return []
+
+
+def _parse_attachments(
+    data: dict[str, Any], fields: dict[str, Any]
+) -> list[JiraAttachment]:
+    attachments_data = fields.get("attachment", [])
+    if isinstance(attachments_data, list):
+        return [
+            JiraAttachment.from_api_response(attachment)
+            for attachment in attachments_data
+            if attachment
+        ]
+    return []
+
+
+def _parse_timetracking(
+    data: dict[str, Any], fields: dict[str, Any]
+) -> JiraTimetracking | None:
+    timetracking_data = fields.get("timetracking")
+    if timetracking_data:
+        return JiraTimetracking.from_api_response(timetracking_data)
+    return None
+
+
+def _parse_epic_key(data: dict[str, Any], fields: dict[str, Any]) -> str | None:
+    # Check for "Epic Link" field
+    epic_link = JiraIssue._find_custom_field_in_api_response(
+        fields, ["epic link", "parent epic"]
+    )
+    return epic_link if isinstance(epic_link, str) else None
+
+
+def _parse_epic_name(data: dict[str, Any], fields: dict[str, Any]) -> str | None:
+    # Check for "Epic Name" field
+    epic_name = JiraIssue._find_custom_field_in_api_response(fields, ["epic name"])
+    return epic_name if isinstance(epic_name, str) else None
+
+
+# Fields that are expensive to build from the raw API data, with their parser
+# and the requested field names that select them. When a caller passes an
+# explicit list of requested fields, fields it did not select are parsed on
+# first access instead of up front.
+DEFERRABLE_FIELDS: dict[
+    str, tuple[Callable[[dict[str, Any], dict[str, Any]], Any], tuple[str, ...]]
+] = {
+    "status": (_parse_status, ("status",)),
+    "issue_type": (_parse_issue_type, ("issuetype", "issue_type")),
+    "priority": (_parse_priority, ("priority",)),
+    "assignee": (_parse_assignee, ("assignee",)),
+    "reporter": (_parse_reporter, ("reporter",)),
+    "project": (_parse_project, ("project",)),
+    "resolution": (_parse_resolution, ("resolution",)),
+    "comments": (_parse_comments, ("comment", "comments")),
+    "attachments": (_parse_attachments, ("attachment", "attachments")),
+    "timetracking": (_parse_timetracking, ("timetracking",)),
+    "epic_key": (_parse_epic_key, ("epic_key",)),
+    "epic_name": (_parse_epic_name, ("epic_name",)),
+}
+
+
+# Standard fields emitted by JiraIssue.to_simplified_dict, in output order, as
+# (requested field name that selects it, output key, getter). A getter
+# returning None leaves the key out of the output.
+SIMPLIFIED_FIELDS: tuple[tuple[str, str, Callable[["JiraIssue"], Any]], ...] = (
+    ("summary", "summary", lambda issue: issue.summary),
+    ("url", "url", lambda issue: issue.url or None),
+    ("description", "description", lambda issue: issue.description or None),
+    (
+        "status",
+        "status",
+        lambda issue: issue.status.to_simplified_dict() if issue.status else None,
+    ),
+    (
+        "issue_type",
+        "issue_type",
+        lambda issue: (
+            issue.issue_type.to_simplified_dict() if issue.issue_type else None
+        ),
+    ),
+    (
+        "priority",
+        "priority",
+        lambda issue: issue.priority.to_simplified_dict() if issue.priority else None,
+    ),
+    (
+        "project",
+        "project",
+        lambda issue: issue.project.to_simplified_dict() if issue.project else None,
+    ),
+    (
+        "resolution",
+        "resolution",
+        lambda issue: (
+            issue.resolution.to_simplified_dict() if issue.resolution else None
+        ),
+    ),
+    ("duedate", "duedate", lambda issue: issue.duedate or None),
+    ("resolutiondate", "resolutiondate", lambda issue: issue.resolutiondate or None),
+    ("parent", "parent", lambda issue: issue.parent or None),
+    ("subtasks", "subtasks", lambda issue: issue.subtasks or None),
+    ("security", "security", lambda issue: issue.security or None),
+    ("worklog", "worklog", lambda issue: issue.worklog or None),
+    (
+        "assignee",
+        "assignee",
+        lambda issue: (
+            issue.assignee.to_simplified_dict()
+            if issue.assignee
+            else {"display_name": "Unassigned"}
+        ),
+    ),
+    (
+        "reporter",
+        "reporter",
+        lambda issue: issue.reporter.to_simplified_dict() if issue.reporter else None,
+    ),
+    ("labels", "labels", lambda issue: issue.labels or None),
+    ("components", "components", lambda issue: issue.components or None),
+    ("fix_versions", "fix_versions", lambda issue: issue.fix_versions or None),
+    ("epic_key", "epic_key", lambda issue: issue.epic_key or None),
+    ("epic_name", "epic_name", lambda issue: issue.epic_name or None),
+    (
+        "timetracking",
+        "timetracking",
+        lambda issue: (
+            issue.timetracking.to_simplified_dict() if issue.timetracking else None
+        ),
+    ),
+    ("created", "created", lambda issue: issue.created or None),
+    ("updated", "updated", lambda issue: issue.updated or None),
+    (
+        "comment",
+        "comments",
+        lambda issue: (
+            [comment.to_simplified_dict() for comment in issue.comments] or None
+        ),
+    ),
+    (
+        "attachment",
+        "attachments",
+        lambda issue: (
+            [attachment.to_simplified_dict() for attachment in issue.attachments]
+            or None
+        ),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class JiraIssueProjection:
+    """
+    Precomputed plan of the fields JiraIssue.to_simplified_dict emits.
+
+    Built once per set of requested fields and shared by all issues that
+    were requested with it, so simplifying an issue is a loop over the
+    selected emitters instead of a membership test per field.
+    """
+
+    # Requested field names, or None when all standard fields are included
+    requested: frozenset[str] | None
+    # (output key, getter) of the selected standard fields, in output order
+    emitters: tuple[tuple[str, Callable[["JiraIssue"], Any]], ...]
+    # Whether every custom field is included ("*all")
+    all_custom_fields: bool
+    # Requested names matched against custom fields, as
+    # (requested name, lowercased name, custom field ID for a "cf_" alias)
+    custom_field_requests: tuple[tuple[str, str, str | None], ...]
+
+    @classmethod
+    def for_requested_fields(
+        cls, requested_fields: Literal["*all"] | list[str] | None
+    ) -> "JiraIssueProjection":
+        """
+        Get the projection for a requested_fields value.
+
+        Args:
+            requested_fields: "*all", a list of field names, or None
+
+        Returns:
+            The (cached) projection
+        """
+        if isinstance(requested_fields, list):
+            return _build_projection(tuple(requested_fields))
+        return _build_projection(requested_fields)
+
+
+@lru_cache(maxsize=128)
+def _build_projection(
+    requested_fields: Literal["*all"] | tuple[str, ...] | None,
+) -> JiraIssueProjection:
+    if not isinstance(requested_fields, tuple):
+        return JiraIssueProjection(
+            requested=None,
+            emitters=tuple((key, getter) for _, key, getter in SIMPLIFIED_FIELDS),
+            all_custom_fields=requested_fields == "*all",
+            custom_field_requests=(),
+        )
+
+    requested = frozenset(requested_fields)
+    return JiraIssueProjection(
+        requested=requested,
+        emitters=tuple(
+            (key, getter)
+            for selector, key, getter in SIMPLIFIED_FIELDS
+            if selector in requested
+        ),
+        all_custom_fields=False,
+        custom_field_requests=tuple(
+            (
+                name,
+                name.lower(),
+                "customfield_" + name[3:] if name.startswith("cf_") else None,
+            )
+            for name in requested_fields
+            if name
+        ),
+    )
+
+
 class JiraIssue(ApiModel, TimestampMixin):
     """
     Model representing a Jira issue.
@@ -87,32 +374,70 @@ class JiraIssue(ApiModel, TimestampMixin):
     worklog: dict | None = None
     changelogs: list[JiraChangelog] = Field(default_factory=list)
 
-    def __getattribute__(self, name: str) -> Any:
+    # Raw (data, fields) of the API response while some fields are deferred
+    _deferred_source: tuple[dict[str, Any], dict[str, Any]] | None = PrivateAttr(
+        default=None
+    )
+
+    def __getattr__(self, name: str) -> Any:
         """
-        Custom attribute access to handle custom field access.
+        Handle attribute lookups that miss the regular model fields.
 
-        This allows accessing custom fields by their name as if they were
-        regular attributes of the JiraIssue class.
+        Only reached when normal attribute lookup fails, so regular field
+        access carries no extra cost. Deferred fields (not requested when
+        the issue was created) are parsed from the raw API response on first
+        access, and custom fields can be accessed by their ID as if they
+        were regular attributes of the JiraIssue class.
 
         Args:
             name: The attribute name to access
 
         Returns:
-            The attribute value or custom field value
+            The parsed field value or custom field value
         """
-        # First try to get the attribute normally
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
-            # Re-raise the original AttributeError
-            raise
+        if name in DEFERRABLE_FIELDS:
+            source = self.__pydantic_private__.get("_deferred_source")
+            if source is not None:
+                value = DEFERRABLE_FIELDS[name][0](*source)
+                self.__dict__[name] = value
+                return value
+
+        custom_fields = self.__dict__.get("custom_fields")
+        if custom_fields and name in custom_fields:
+            return custom_fields[name]
+
+        return super().__getattr__(name)
+
+    def _resolve_deferred_fields(self) -> None:
+        """Parse all remaining deferred fields and drop the raw API response."""
+        # Private attributes are not in __dict__, so read them directly rather
+        # than through the failing attribute lookup
+        private = self.__pydantic_private__
+        source = private.get("_deferred_source")
+        if source is None:
+            return
+        for name, (parser, _) in DEFERRABLE_FIELDS.items():
+            if name not in self.__dict__:
+                self.__dict__[name] = parser(*source)
+        private["_deferred_source"] = None
+
+    @model_serializer(mode="wrap")
+    def _serialize_with_deferred_fields(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> dict[str, Any]:
+        """Make sure deferred fields are included when dumping the model."""
+        self._resolve_deferred_fields()
+        return handler(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JiraIssue):
+            self._resolve_deferred_fields()
+            other._resolve_deferred_fields()
+        return super().__eq__(other)
+
+    def __repr_args__(self) -> Any:
+        self._resolve_deferred_fields()
+        return super().__repr_args__()
 
     @property
     def page_content(self) -> str | None:
@@ -238,6 +563,7 @@ class JiraIssue(ApiModel, TimestampMixin):
         return None
 
     @classmethod
+    @traced("jira.parse_issue")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraIssue":
         """
         Create a JiraIssue from a Jira API response.
@@ -271,47 +597,6 @@ class JiraIssue(ApiModel, TimestampMixin):
         created = str(fields.get("created", EMPTY_STRING))
         updated = str(fields.get("updated", EMPTY_STRING))
 
-        # Extract assignee data
-        assignee = None
-        assignee_data = fields.get("assignee")
-        if assignee_data:
-            assignee = JiraUser.from_api_response(assignee_data)
-
-        # Extract reporter data
-        reporter = None
-        reporter_data = fields.get("reporter")
-        if reporter_data:
-            reporter = JiraUser.from_api_response(reporter_data)
-
-        # Extract status data
-        status = None
-        status_data = fields.get("status")
-        if status_data:
-            status = JiraStatus.from_api_response(status_data)
-
-        # Extract issue type data
-        issue_type = None
-        issue_type_data = fields.get("issuetype")
-        if issue_type_data:
-            issue_type = JiraIssueType.from_api_response(issue_type_data)
-
-        # Extract priority data
-        priority = None
-        priority_data = fields.get("priority")
-        if priority_data:
-            priority = JiraPriority.from_api_response(priority_data)
-
-        # Extract project data
-        project = None
-        project_data = fields.get("project")
-        if isinstance(project_data, dict):
-            project = JiraProject.from_api_response(project_data)
-
-        resolution = None
-        resolution_data = fields.get("resolution")
-        if isinstance(resolution_data, dict):
-            resolution = JiraResolution.from_api_response(resolution_data)
-
         duedate = (
             fields.get("duedate") if isinstance(fields.get("duedate"), str) else None
         )
@@ -363,18 +648,6 @@ class JiraIssue(ApiModel, TimestampMixin):
                     if version
                 ]
 
-        # Handling comments
-        comments = []
-        comments_field = fields.get("comment", {})
-        if isinstance(comments_field, dict) and "comments" in comments_field:
-            comments_data = comments_field["comments"]
-            if isinstance(comments_data, list):
-                comments = [
-                    JiraComment.from_api_response(comment)
-                    for comment in comments_data
-                    if comment
-                ]
-
         # Handling changelogs
         changelogs = []
         changelogs_data = data.get("changelog", {})
@@ -384,41 +657,9 @@ class JiraIssue(ApiModel, TimestampMixin):
                 for history in changelogs_data["histories"]
             ]
 
-        # Handling attachments
-        attachments = []
-        attachments_data = fields.get("attachment", [])
-        if isinstance(attachments_data, list):
-            attachments = [
-                JiraAttachment.from_api_response(attachment)
-                for attachment in attachments_data
-                if attachment
-            ]
-
-        # Timetracking
-        timetracking = None
-        timetracking_data = fields.get("timetracking")
-        if timetracking_data:
-            timetracking = JiraTimetracking.from_api_response(timetracking_data)
-
         # URL
         url = data.get("self")  # API URL for the issue
 
-        # Try to find epic fields (varies by Jira instance)
-        epic_key = None
-        epic_name = None
-
-        # Check for "Epic Link" field
-        epic_link = cls._find_custom_field_in_api_response(
-            fields, ["epic link", "parent epic"]
-        )
-        if isinstance(epic_link, str):
-            epic_key = epic_link
-
-        # Check for "Epic Name" field
-        epic_name_value = cls._find_custom_field_in_api_response(fields, ["epic name"])
-        if isinstance(epic_name_value, str):
-            epic_name = epic_name_value
-
         # Store custom fields
         custom_fields = {}
         fields_name_map = data.get("names", {})
@@ -439,21 +680,29 @@ class JiraIssue(ApiModel, TimestampMixin):
             # Strip whitespace from each field name
             requested_fields_param = [field.strip() for field in requested_fields_param]
 
+        # Parse the expensive fields, deferring those not requested
+        deferred_fields: set[str] = set()
+        if isinstance(requested_fields_param, list):
+            requested = set(requested_fields_param)
+            deferred_fields = {
+                name
+                for name, (_, selectors) in DEFERRABLE_FIELDS.items()
+                if requested.isdisjoint(selectors)
+            }
+        parsed_fields = {
+            name: parser(data, fields)
+            for name, (parser, _) in DEFERRABLE_FIELDS.items()
+            if name not in deferred_fields
+        }
+
         # Create the issue instance with all the extracted data
-        return cls(
+        issue = cls(
             id=issue_id,
             key=key,
             summary=summary,
             description=description,
             created=created,
             updated=updated,
-            status=status,
-            issue_type=issue_type,
-            priority=priority,
-            assignee=assignee,
-            reporter=reporter,
-            project=project,
-            resolution=resolution,
             duedate=duedate,
             resolutiondate=resolutiondate,
             parent=parent,
@@ -462,203 +711,119 @@ class JiraIssue(ApiModel, TimestampMixin):
             worklog=worklog,
             labels=labels,
             components=components,
-            comments=comments,
-            attachments=attachments,
-            timetracking=timetracking,
             url=url,
-            epic_key=epic_key,
-            epic_name=epic_name,
             fix_versions=fix_versions,
             custom_fields=custom_fields,
             requested_fields=requested_fields_param,
             changelogs=changelogs,
+            **parsed_fields,
         )
+        if deferred_fields:
+            # Removing the defaults makes attribute lookup fall through to
+            # __getattr__, which parses the field on first access
+            for name in deferred_fields:
+                del issue.__dict__[name]
+            issue._deferred_source = (data, fields)
+        return issue
+
+    def to_simplified_dict(
+        self, projection: JiraIssueProjection | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert to simplified dictionary for API response.
+
+        Args:
+            projection: Precomputed projection of the fields to include;
+                derived from requested_fields when not given
+
+        Returns:
+            A dictionary with the requested fields
+        """
+        if projection is None:
+            projection = JiraIssueProjection.for_requested_fields(self.requested_fields)
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
         result: dict[str, Any] = {
             "id": self.id,
             "key": self.key,
         }
 
-        # Helper method to check if a field should be included
-        def should_include_field(field_name: str) -> bool:
-            return (
-                self.requested_fields == "*all"
-                or not isinstance(self.requested_fields, list)
-                or field_name in self.requested_fields
-            )
-
-        # Add summary if requested
-        if should_include_field("summary"):
-            result["summary"] = self.summary
-
-        # Add URL if available and requested
-        if self.url and should_include_field("url"):
-            result["url"] = self.url
-
-        # Add description if available and requested
-        if self.description and should_include_field("description"):
-            result["description"] = self.description
-
-        # Add status if available and requested
-        if self.status and should_include_field("status"):
-            result["status"] = self.status.to_simplified_dict()
-
-        # Add issue type if available and requested
-        if self.issue_type and should_include_field("issue_type"):
-            result["issue_type"] = self.issue_type.to_simplified_dict()
-
-        # Add priority if available and requested
-        if self.priority and should_include_field("priority"):
-            result["priority"] = self.priority.to_simplified_dict()
-
-        # Add project info if available and requested
-        if self.project and should_include_field("project"):
-            result["project"] = self.project.to_simplified_dict()
-
-        # Add resolution if available and requested
-        if self.resolution and should_include_field("resolution"):
-            result["resolution"] = self.resolution.to_simplified_dict()
-
-        # Add dates if available and requested
-        if self.duedate and should_include_field("duedate"):
-            result["duedate"] = self.duedate
-
-        if self.resolutiondate and should_include_field("resolutiondate"):
-            result["resolutiondate"] = self.resolutiondate
-
-        # Add parent and subtasks if available and requested
-        if self.parent and should_include_field("parent"):
-            result["parent"] = self.parent
-
-        if self.subtasks and should_include_field("subtasks"):
-            result["subtasks"] = self.subtasks
-
-        # Add security and worklog if available and requested
-        if self.security and should_include_field("security"):
-            result["security"] = self.security
-
-        if self.worklog and should_include_field("worklog"):
-            result["worklog"] = self.worklog
-
-        # Add assignee if requested
-        if should_include_field("assignee"):
-            if self.assignee:
-                result["assignee"] = self.assignee.to_simplified_dict()
-            else:
-                result["assignee"] = {"display_name": "Unassigned"}
-
-        # Add reporter if available and requested
-        if self.reporter and should_include_field("reporter"):
-            result["reporter"] = self.reporter.to_simplified_dict()
-
-        # Add lists if available and requested
-        if self.labels and should_include_field("labels"):
-            result["labels"] = self.labels
-
-        if self.components and should_include_field("components"):
-            result["components"] = self.components
-
-        if self.fix_versions and should_include_field("fix_versions"):
-            result["fix_versions"] = self.fix_versions
+        for key, getter in projection.emitters:
+            value = getter(self)
+            if value is not None:
+                result[key] = value
 
-        # Add epic fields if available and requested
-        if self.epic_key and should_include_field("epic_key"):
-            result["epic_key"] = self.epic_key
-
-        if self.epic_name and should_include_field("epic_name"):
-            result["epic_name"] = self.epic_name
-
-        # Add time tracking if available and requested
-        if self.timetracking and should_include_field("timetracking"):
-            result["timetracking"] = self.timetracking.to_simplified_dict()
-
-        # Add created and updated timestamps if available and requested
-        if self.created and should_include_field("created"):
-            result["created"] = self.created
-
-        if self.updated and should_include_field("updated"):
-            result["updated"] = self.updated
-
-        # Add comments if available and requested
-        if self.comments and should_include_field("comment"):
-            result["comments"] = [
-                comment.to_simplified_dict() for comment in self.comments
-            ]
-
-        # Add attachments if available and requested
-        if self.attachments and should_include_field("attachment"):
-            result["attachments"] = [
-                attachment.to_simplified_dict() for attachment in self.attachments
-            ]
-
-        # Not use should_include_field since you won't get changelogs
+        # Changelogs are always included since you won't get them
         # if you don't ask for them
         if self.changelogs:
             result["changelogs"] = [
                 changelog.to_simplified_dict() for changelog in self.changelogs
             ]
 
-        # Process custom fields
         if self.custom_fields:
-            if self.requested_fields == "*all":
-                for internal_id, field_data_obj in self.custom_fields.items():
-                    processed_value = self._process_custom_field_value(
-                        field_data_obj.get("value")
+            self._add_simplified_custom_fields(result, projection)
+
+        return result
+
+    def _add_simplified_custom_fields(
+        self, result: dict[str, Any], projection: JiraIssueProjection
+    ) -> None:
+        """
+        Add the custom fields selected by a projection to a simplified dict.
+
+        Requested names match custom fields by ID, by name (case-insensitive)
+        or through the "cf_<number>" shorthand.
+
+        Args:
+            result: The simplified dictionary to add the fields to
+            projection: The projection of the fields to include
+        """
+        custom_fields = self.custom_fields
+        if projection.all_custom_fields:
+            for internal_id, field_data_obj in custom_fields.items():
+                result[internal_id] = self._simplify_custom_field(field_data_obj)
+            return
+
+        names_index: dict[str, str] | None = None
+        for requested_name, lowered_name, alias_id in projection.custom_field_requests:
+            if requested_name.startswith("customfield_") and (
+                requested_name in custom_fields
+            ):
+                result[requested_name] = self._simplify_custom_field(
+                    custom_fields[requested_name]
+                )
+                continue
+
+            if names_index is None:
+                # First custom field of each (lowercased) name wins
+                names_index = {}
+                for internal_id, field_data_obj in custom_fields.items():
+                    names_index.setdefault(
+                        field_data_obj.get("name", "").lower(), internal_id
                     )
-                    output_value_obj = {"value": processed_value}
-                    if "name" in field_data_obj:
-                        output_value_obj["name"] = field_data_obj["name"]
-                    result[internal_id] = output_value_obj
-            elif isinstance(self.requested_fields, list):
-                for requested_key_or_name in self.requested_fields:
-                    found_by_id_or_name = False
-                    if (
-                        requested_key_or_name.startswith("customfield_")
-                        and requested_key_or_name in self.custom_fields
-                    ):
-                        field_data_obj = self.custom_fields[requested_key_or_name]
-                        output_value_obj = {
-                            "value": self._process_custom_field_value(
-                                field_data_obj.get("value")
-                            )
-                        }
-                        if "name" in field_data_obj:
-                            output_value_obj["name"] = field_data_obj["name"]
-                        result[requested_key_or_name] = output_value_obj
-                        found_by_id_or_name = True
-                    else:
-                        for internal_id, field_data_obj in self.custom_fields.items():
-                            if (
-                                field_data_obj.get("name", "").lower()
-                                == requested_key_or_name.lower()
-                            ):
-                                output_value_obj = {
-                                    "value": self._process_custom_field_value(
-                                        field_data_obj.get("value")
-                                    )
-                                }
-                                output_value_obj["name"] = field_data_obj["name"]
-                                result[internal_id] = output_value_obj
-                                found_by_id_or_name = True
-                                break
-                    if not found_by_id_or_name and requested_key_or_name.startswith(
-                        "cf_"
-                    ):
-                        full_id = "customfield_" + requested_key_or_name[3:]
-                        if full_id in self.custom_fields:
-                            field_data_obj = self.custom_fields[full_id]
-                            output_value_obj = {
-                                "value": self._process_custom_field_value(
-                                    field_data_obj.get("value")
-                                )
-                            }
-                            if "name" in field_data_obj:
-                                output_value_obj["name"] = field_data_obj["name"]
-                            result[full_id] = output_value_obj
-
-        return {k: v for k, v in result.items() if v is not None}
+            internal_id = names_index.get(lowered_name)
+            if internal_id is not None:
+                result[internal_id] = self._simplify_custom_field(
+                    custom_fields[internal_id]
+                )
+            elif alias_id is not None and alias_id in custom_fields:
+                result[alias_id] = self._simplify_custom_field(custom_fields[alias_id])
+
+    def _simplify_custom_field(self, field_data_obj: dict[str, Any]) -> dict[str, Any]:
+        """
+        Simplify a stored custom field to its output form.
+
+        Args:
+            field_data_obj: The stored {"value": ..., "name": ...} object
+
+        Returns:
+            The simplified value object, with the name if known
+        """
+        output_value_obj = {
+            "value": self._process_custom_field_value(field_data_obj.get("value"))
+        }
+        if "name" in field_data_obj:
+            output_value_obj["name"] = field_data_obj["name"]
+        return output_value_obj
 
     def _process_custom_field_value(self, field_value: Any) -> Any:
         """
@@ -9,8 +9,9 @@ from typing import Any
 
 from pydantic import Field, model_validator
 
+from ...utils.tracing import traced
 from ..base import ApiModel
-from .issue import JiraIssue
+from .issue import JiraIssue, JiraIssueProjection
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class JiraSearchResult(ApiModel):
     issues: list[JiraIssue] = Field(default_factory=list)
 
     @classmethod
+    @traced("jira.parse_search_result")
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
     ) -> "JiraSearchResult":
@@ -46,12 +48,16 @@ class JiraSearchResult(ApiModel):
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
+        # Normalize the requested fields once for all issues of the search
+        requested_fields = kwargs.get("requested_fields")
+        if isinstance(requested_fields, str) and requested_fields != "*all":
+            requested_fields = [field.strip() for field in requested_fields.split(",")]
+
         issues = []
         issues_data = data.get("issues", [])
         if isinstance(issues_data, list):
             for issue_data in issues_data:
                 if issue_data:
-                    requested_fields = kwargs.get("requested_fields")
                     issues.append(
                         JiraIssue.from_api_response(
                             issue_data, requested_fields=requested_fields
@@ -84,6 +90,32 @@ class JiraSearchResult(ApiModel):
             issues=issues,
         )
 
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """
+        Convert to simplified dictionary for API response.
+
+        All issues of a search are normally requested with the same fields,
+        so the field projection is computed once and shared across issues.
+
+        Returns:
+            A dictionary with pagination metadata and the simplified issues
+        """
+        issues = []
+        projection: JiraIssueProjection | None = None
+        projection_fields: Any = None
+        for issue in self.issues:
+            if projection is None or issue.requested_fields != projection_fields:
+                projection_fields = issue.requested_fields
+                projection = JiraIssueProjection.for_requested_fields(projection_fields)
+            issues.append(issue.to_simplified_dict(projection))
+
+        return {
+            "total": self.total,
+            "start_at": self.start_at,
+            "max_results": self.max_results,
+            "issues": issues,
+        }
+
     @model_validator(mode="after")
     def validate_search_result(self) -> "JiraSearchResult":
         """
@@ -8,6 +8,8 @@ from typing import Any, Protocol
 from bs4 import BeautifulSoup, Tag
 from markdownify import markdownify as md
 
+from ..utils.metrics import instrument_conversion
+
 logger = logging.getLogger("mcp-atlassian")
 
 
@@ -39,6 +41,7 @@ class BasePreprocessor:
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.confluence_client = confluence_client
 
+    @instrument_conversion("html_to_markdown")
     def process_html_content(
         self, html_content: str, space_key: str = ""
     ) -> tuple[str, str]:
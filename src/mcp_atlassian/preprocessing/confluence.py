@@ -1,6 +1,8 @@
 """Confluence-specific text preprocessing module."""
 
+import html
 import logging
+import re
 import shutil
 import tempfile
 from pathlib import Path
@@ -14,10 +16,20 @@ from md2conf.converter import (
     markdown_to_html,
 )
 
+from ..utils.metrics import instrument_conversion
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Markers Confluence wraps around matched terms in CQL search excerpts
+EXCERPT_HIGHLIGHT_START = "@@@hl@@@"
+EXCERPT_HIGHLIGHT_END = "@@@endhl@@@"
+
+_EXCERPT_EMPHASIS_TAG = re.compile(r"</?(?:strong|b)(?:\s[^>]*)?>", re.IGNORECASE)
+_EXCERPT_BREAK_TAG = re.compile(r"<(?:br|/p|/div|/li)(?:\s[^>]*)?/?>", re.IGNORECASE)
+_EXCERPT_ANY_TAG = re.compile(r"<[^>]*>")
+_EXCERPT_SPACES = re.compile(r"[ \t\r\f\v]+")
+
 
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
@@ -32,6 +44,7 @@ class ConfluencePreprocessor(BasePreprocessor):
         """
         super().__init__(base_url=base_url, **kwargs)
 
+    @instrument_conversion("markdown_to_confluence_storage")
     def markdown_to_confluence_storage(self, markdown_content: str) -> str:
         """
         Convert Markdown content to Confluence storage format (XHTML)
@@ -90,4 +103,30 @@ class ConfluencePreprocessor(BasePreprocessor):
 
             return str(storage_format)
 
-    # Confluence-specific methods can be added here
+    def highlight_excerpt(self, excerpt: str) -> str:
+        """
+        Convert a CQL search excerpt to markdown without a full HTML parse.
+
+        Excerpts are short plain-text snippets with Confluence highlight
+        markers and occasional inline tags, so a few regular expressions are
+        enough; highlighted terms become markdown bold.
+
+        Args:
+            excerpt: The excerpt returned with a CQL search result
+
+        Returns:
+            The excerpt as lightweight markdown
+        """
+        if not excerpt:
+            return ""
+
+        text = excerpt.replace(EXCERPT_HIGHLIGHT_START, "**").replace(
+            EXCERPT_HIGHLIGHT_END, "**"
+        )
+        if "<" in text:
+            text = _EXCERPT_EMPHASIS_TAG.sub("**", text)
+            text = _EXCERPT_BREAK_TAG.sub("\n", text)
+            text = _EXCERPT_ANY_TAG.sub("", text)
+        if "&" in text:
+            text = html.unescape(text)
+        return _EXCERPT_SPACES.sub(" ", text).strip()
@@ -1,17 +1,18 @@
 """Confluence FastMCP server instance and tool definitions."""
 
-import json
 import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.servers.dependencies import get_confluence_fetcher, run_blocking
 from mcp_atlassian.utils.decorators import (
     check_write_access,
     convert_empty_defaults_to_none,
 )
+from mcp_atlassian.utils.serialization import encode_response
+from mcp_atlassian.utils.shaping import resolve_budget
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +70,28 @@ async def search(
             default="",
         ),
     ] = "",
+    cursor: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Continuation token returned as 'next_cursor' by a previous call. "
+                "When provided, the next page of that earlier search is returned and "
+                "'query' and 'spaces_filter' are ignored."
+            ),
+            default="",
+        ),
+    ] = "",
+    paginate: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to return an object with 'results', 'total' and a 'next_cursor' "
+                "for fetching the next page, instead of a list of results. "
+                "Always the case when 'cursor' is provided."
+            ),
+            default=False,
+        ),
+    ] = False,
 ) -> str:
     """Search Confluence content using simple terms or CQL.
 
@@ -77,13 +100,31 @@ async def search(
         query: Search query - can be simple text or a CQL query string.
         limit: Maximum number of results (1-50).
         spaces_filter: Comma-separated list of space keys to filter by.
+        cursor: Continuation token from a previous search's 'next_cursor'.
+        paginate: Whether to return the results with their continuation cursor.
 
     Returns:
-        JSON string representing a list of simplified Confluence page objects.
+        JSON string representing a list of search results, or with paginate or
+        cursor an object with the results and 'next_cursor' set when more
+        results are available.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
+    if cursor:
+        try:
+            search_result = await run_blocking(
+                confluence_fetcher.search_page, query, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            logger.warning(f"Rejected search cursor: {e}")
+            return encode_response(
+                {
+                    "error": f"{e}. Pass the 'next_cursor' of a previous search "
+                    "unchanged, or omit 'cursor' to start a new search."
+                },
+                "confluence",
+            )
     # Check if the query is a simple search term or already a CQL query
-    if query and not any(
+    elif query and not any(
         x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
     ):
         original_query = query
@@ -92,22 +133,34 @@ async def search(
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_result = await run_blocking(
+                confluence_fetcher.search_page,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            search_result = await run_blocking(
+                confluence_fetcher.search_page,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        search_result = await run_blocking(
+            confluence_fetcher.search_page,
+            query,
+            limit=limit,
+            spaces_filter=spaces_filter,
         )
-    search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    if cursor or paginate:
+        result = search_result.to_simplified_dict()
+    else:
+        result = [page.to_simplified_dict() for page in search_result.results]
+    return encode_response(result, "confluence")
 
 
 @convert_empty_defaults_to_none
@@ -162,6 +215,29 @@ async def get_page(
             default=True,
         ),
     ] = True,
+    max_bytes: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in bytes. Long page bodies "
+                "are shortened to fit, keeping their beginning, end and section headings, "
+                "and a 'truncation' entry reports what was elided. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
+    max_tokens: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in LLM tokens (estimated). "
+                "Applied like max_bytes; the tighter of the two wins. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
 ) -> str:
     """Get content of a specific Confluence page by its ID, or by its title and space key.
 
@@ -172,6 +248,8 @@ async def get_page(
         space_key: The key of the space. Must be used with 'title'.
         include_metadata: Whether to include page metadata.
         convert_to_markdown: Convert content to markdown (true) or keep raw HTML (false).
+        max_bytes: Maximum response size in bytes, 0 for no limit.
+        max_tokens: Maximum response size in estimated tokens, 0 for no limit.
 
     Returns:
         JSON string representing the page content and/or metadata, or an error if not found or parameters are invalid.
@@ -185,27 +263,30 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            page_object = await run_blocking(
+                confluence_fetcher.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
+            return encode_response(
                 {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+                "confluence",
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await run_blocking(
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
-            return json.dumps(
+            return encode_response(
                 {
                     "error": f"Page with title '{title}' not found in space '{space_key}'."
                 },
-                indent=2,
-                ensure_ascii=False,
+                "confluence",
             )
     else:
         raise ValueError(
@@ -213,10 +294,8 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
+        return encode_response(
+            {"error": "Page not found with the provided identifiers."}, "confluence"
         )
 
     if include_metadata:
@@ -224,7 +303,9 @@ async def get_page(
     else:
         result = {"content": {"value": page_object.content}}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(
+        result, "confluence", max_bytes=resolve_budget(max_bytes, max_tokens)
+    )
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -290,7 +371,8 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        pages = await run_blocking(
+            confluence_fetcher.get_page_children,
             page_id=parent_id,
             start=start,
             limit=limit,
@@ -312,7 +394,137 @@ async def get_page_children(
         )
         result = {"error": f"Failed to get child pages: {e}"}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "confluence")
+
+
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def get_page_tree(
+    ctx: Context,
+    root_id: Annotated[
+        str,
+        Field(description="The ID of the page whose descendants you want to retrieve"),
+    ],
+    max_depth: Annotated[
+        int,
+        Field(
+            description="Maximum depth to descend (1 returns only direct children, 1-10)",
+            default=3,
+            ge=1,
+            le=10,
+        ),
+    ] = 3,
+    max_nodes: Annotated[
+        int,
+        Field(
+            description="Maximum number of descendant pages to return (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    include_content: Annotated[
+        bool,
+        Field(
+            description="Whether to include the page content of every descendant in the response",
+            default=False,
+        ),
+    ] = False,
+    convert_to_markdown: Annotated[
+        bool,
+        Field(
+            description="Whether to convert page content to markdown (true) or keep it in raw HTML format (false). Only relevant if include_content is true.",
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Get the page tree below a Confluence page, walking descendants breadth-first.
+
+    Args:
+        ctx: The FastMCP context.
+        root_id: The ID of the root page.
+        max_depth: Maximum depth to descend.
+        max_nodes: Maximum number of descendant pages.
+        include_content: Whether to include page content.
+        convert_to_markdown: Convert content to markdown if include_content is true.
+
+    Returns:
+        JSON string representing the descendant pages with their parent and depth.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    try:
+        nodes, truncated = await run_blocking(
+            confluence_fetcher.get_page_tree,
+            page_id=root_id,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+            include_content=include_content,
+            convert_to_markdown=convert_to_markdown,
+        )
+        tree_nodes = [node.to_simplified_dict() for node in nodes]
+        result = {
+            "root_id": root_id,
+            "count": len(tree_nodes),
+            "max_depth_requested": max_depth,
+            "truncated": truncated,
+            "results": tree_nodes,
+        }
+    except Exception as e:
+        logger.error(
+            f"Error getting page tree for page ID {root_id}: {e}",
+            exc_info=True,
+        )
+        result = {"error": f"Failed to get page tree: {e}"}
+
+    return encode_response(result, "confluence")
+
+
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def export_space(
+    ctx: Context,
+    space_key: Annotated[
+        str,
+        Field(description="The key of the space to export (e.g., 'DEV', 'TEAM')"),
+    ],
+    target_dir: Annotated[
+        str,
+        Field(
+            description="Directory where the Markdown files and manifest.json should be written"
+        ),
+    ],
+    incremental: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to skip pages whose version is unchanged since a previous export "
+                "into the same directory"
+            ),
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Export all pages of a Confluence space to Markdown files with a JSON manifest.
+
+    Args:
+        ctx: The FastMCP context.
+        space_key: The key of the space.
+        target_dir: Directory to write the export to.
+        incremental: Whether to only re-export pages changed since the last export.
+
+    Returns:
+        JSON string summarizing the export.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    try:
+        result = await run_blocking(
+            confluence_fetcher.export_space,
+            space_key=space_key,
+            target_dir=target_dir,
+            incremental=incremental,
+        )
+    except Exception as e:
+        logger.error(f"Error exporting space {space_key}: {e}", exc_info=True)
+        result = {"error": f"Failed to export space: {e}"}
+    return encode_response(result, "confluence")
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -339,9 +551,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await run_blocking(confluence_fetcher.get_page_comments, page_id)
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return encode_response(formatted_comments, "confluence")
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -368,9 +580,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await run_blocking(confluence_fetcher.get_page_labels, page_id)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return encode_response(formatted_labels, "confluence")
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -394,9 +606,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await run_blocking(confluence_fetcher.add_page_label, page_id, name)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return encode_response(formatted_labels, "confluence")
 
 
 @convert_empty_defaults_to_none
@@ -441,7 +653,8 @@ async def create_page(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    page = confluence_fetcher.create_page(
+    page = await run_blocking(
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -449,10 +662,8 @@ async def create_page(
         is_markdown=True,
     )
     result = page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
+    return encode_response(
+        {"message": "Page created successfully", "page": result}, "confluence"
     )
 
 
@@ -498,7 +709,8 @@ async def update_page(
     # TODO: revert this once Cursor IDE handles optional parameters with Union types correctly.
     actual_parent_id = parent_id if parent_id else None
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await run_blocking(
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -508,10 +720,8 @@ async def update_page(
         parent_id=actual_parent_id,
     )
     page_data = updated_page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
+    return encode_response(
+        {"message": "Page updated successfully", "page": page_data}, "confluence"
     )
 
 
@@ -535,7 +745,7 @@ async def delete_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        result = confluence_fetcher.delete_page(page_id=page_id)
+        result = await run_blocking(confluence_fetcher.delete_page, page_id=page_id)
         if result:
             response = {
                 "success": True,
@@ -554,7 +764,7 @@ async def delete_page(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return encode_response(response, "confluence")
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -583,7 +793,9 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await run_blocking(
+            confluence_fetcher.add_comment, page_id=page_id, content=content
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
@@ -604,4 +816,4 @@ async def add_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return encode_response(response, "confluence")
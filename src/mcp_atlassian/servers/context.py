@@ -19,4 +19,4 @@ class MainAppContext:
     full_jira_config: JiraConfig | None = None
     full_confluence_config: ConfluenceConfig | None = None
     read_only: bool = False
-    enabled_tools: list[str] | None = None
+    enabled_tools: frozenset[str] | None = None
@@ -7,25 +7,58 @@ from __future__ import annotations
 
 import dataclasses
 import logging
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import anyio.to_thread
+import requests
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
 
-from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
-from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.servers.context import MainAppContext
-from mcp_atlassian.utils.oauth import OAuthConfig
+from mcp_atlassian.utils.oauth import OAuthConfig, find_cloud_id
+from mcp_atlassian.utils.profiling import profile_fetcher_call
+from mcp_atlassian.utils.tracing import traced
 
 if TYPE_CHECKING:
+    from mcp_atlassian.confluence import ConfluenceFetcher
     from mcp_atlassian.confluence.config import (
         ConfluenceConfig as UserConfluenceConfigType,
     )
+    from mcp_atlassian.jira import JiraFetcher
     from mcp_atlassian.jira.config import JiraConfig as UserJiraConfigType
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+T = TypeVar("T")
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking fetcher call in a worker thread.
+
+    Fetchers block on HTTP, rate limiting and retry backoff; running them off
+    the event loop keeps it serving other tool calls, /healthz and /metrics
+    meanwhile. Context variables (such as the active trace span) are copied
+    into the thread, where slow calls are profiled if profiling is enabled.
+
+    Args:
+        func: The blocking callable.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The return value of func.
+    """
+
+    def call() -> T:
+        with profile_fetcher_call():
+            return func(*args, **kwargs)
+
+    return await anyio.to_thread.run_sync(call)
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -77,13 +110,27 @@ def _create_user_config_for_fetcher(
             not base_config
             or not hasattr(base_config, "oauth_config")
             or not getattr(base_config, "oauth_config", None)
-            or not getattr(getattr(base_config, "oauth_config", None), "cloud_id", None)
         ):
             raise ValueError(
-                f"Global OAuth config (with cloud_id) for {type(base_config).__name__} is missing, "
+                f"Global OAuth config for {type(base_config).__name__} is missing, "
                 "but user auth_type is 'oauth'. Cannot determine cloud_id."
             )
         global_oauth_cfg = base_config.oauth_config
+        cloud_id = global_oauth_cfg.cloud_id
+        if not cloud_id:
+            # Discovered once per token, then served from the resources cache
+            try:
+                cloud_id = find_cloud_id(user_access_token, base_config.url)
+            except requests.RequestException as e:
+                logger.warning(
+                    f"Failed to discover the cloud ID of the user token: {e}"
+                )
+            if not cloud_id:
+                raise ValueError(
+                    f"Global OAuth config for {type(base_config).__name__} has no "
+                    "cloud_id and none was found for the user's token. "
+                    "Cannot determine cloud_id."
+                )
         oauth_config_for_user = OAuthConfig(
             client_id=global_oauth_cfg.client_id if global_oauth_cfg else "",
             client_secret=global_oauth_cfg.client_secret if global_oauth_cfg else "",
@@ -92,7 +139,7 @@ def _create_user_config_for_fetcher(
             access_token=user_access_token,
             refresh_token=None,
             expires_at=None,
-            cloud_id=global_oauth_cfg.cloud_id if global_oauth_cfg else "",
+            cloud_id=cloud_id,
         )
         common_args.update(
             {
@@ -131,6 +178,7 @@ def _create_user_config_for_fetcher(
         raise TypeError(f"Unsupported base_config type: {type(base_config)}")
 
 
+@traced("jira.get_fetcher")
 async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
     """Returns a JiraFetcher instance appropriate for the current request context.
 
@@ -143,6 +191,9 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
     Raises:
         ValueError: If configuration or credentials are invalid.
     """
+    # Imported here so the Jira client is only loaded once Jira is used
+    from mcp_atlassian.jira import JiraFetcher
+
     logger.debug(f"get_jira_fetcher: ENTERED. Context ID: {id(ctx)}")
     try:
         request: Request = get_http_request()
@@ -186,14 +237,19 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             logger.info(
                 f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
-            user_specific_config = _create_user_config_for_fetcher(
+            user_specific_config = await run_blocking(
+                _create_user_config_for_fetcher,
                 base_config=app_lifespan_ctx.full_jira_config,
                 auth_type=user_auth_type,
                 credentials=credentials,
             )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
+                user_jira_fetcher = await run_blocking(
+                    JiraFetcher, config=user_specific_config
+                )
+                current_user_id = await run_blocking(
+                    user_jira_fetcher.get_current_user_account_id
+                )
                 logger.debug(
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
@@ -225,13 +281,16 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        return await run_blocking(
+            JiraFetcher, config=app_lifespan_ctx_global.full_jira_config
+        )
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
     )
 
 
+@traced("confluence.get_fetcher")
 async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
     """Returns a ConfluenceFetcher instance appropriate for the current request context.
 
@@ -244,6 +303,9 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
     Raises:
         ValueError: If configuration or credentials are invalid.
     """
+    # Imported here so the Confluence client is only loaded once Confluence is used
+    from mcp_atlassian.confluence import ConfluenceFetcher
+
     logger.debug(f"get_confluence_fetcher: ENTERED. Context ID: {id(ctx)}")
     try:
         request: Request = get_http_request()
@@ -288,14 +350,19 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             logger.info(
                 f"Creating user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
-            user_specific_config = _create_user_config_for_fetcher(
+            user_specific_config = await run_blocking(
+                _create_user_config_for_fetcher,
                 base_config=app_lifespan_ctx.full_confluence_config,
                 auth_type=user_auth_type,
                 credentials=credentials,
             )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                user_confluence_fetcher = await run_blocking(
+                    ConfluenceFetcher, config=user_specific_config
+                )
+                current_user_data = await run_blocking(
+                    user_confluence_fetcher.get_current_user_info
+                )
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -344,7 +411,9 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return await run_blocking(
+            ConfluenceFetcher, config=app_lifespan_ctx_global.full_confluence_config
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -11,9 +11,12 @@ from requests.exceptions import HTTPError
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.models.jira.common import JiraUser
-from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.models.jira.issue import JiraIssueProjection
+from mcp_atlassian.servers.dependencies import get_jira_fetcher, run_blocking
 from mcp_atlassian.utils import convert_empty_defaults_to_none
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.serialization import encode_response
+from mcp_atlassian.utils.shaping import resolve_budget
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +51,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await run_blocking(
+            jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -78,7 +83,7 @@ async def get_user_profile(
             f"get_user_profile failed for '{user_identifier}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return encode_response(response_data, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -130,6 +135,29 @@ async def get_issue(
             default=True,
         ),
     ] = True,
+    max_bytes: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in bytes. Long descriptions and comments "
+                "are shortened to fit, keeping their beginning, end and section headings, "
+                "and a 'truncation' entry reports what was elided. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
+    max_tokens: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in LLM tokens (estimated). "
+                "Applied like max_bytes; the tighter of the two wins. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
 ) -> str:
     """Get details of a specific Jira issue including its Epic links and relationship information.
 
@@ -141,6 +169,8 @@ async def get_issue(
         comment_limit: Maximum number of comments.
         properties: Issue properties to return.
         update_history: Whether to update issue view history.
+        max_bytes: Maximum response size in bytes, 0 for no limit.
+        max_tokens: Maximum response size in estimated tokens, 0 for no limit.
 
     Returns:
         JSON string representing the Jira issue object.
@@ -153,7 +183,8 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    issue = await run_blocking(
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -162,7 +193,125 @@ async def get_issue(
         update_history=update_history,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(
+        result, "jira", max_bytes=resolve_budget(max_bytes, max_tokens)
+    )
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']",
+            min_length=1,
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return for every issue "
+                "(e.g., 'summary,status,customfield_10010'). "
+                "Use '*all' for all fields (including custom fields), or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    expand: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Fields to expand. Examples: 'renderedFields', 'transitions', 'changelog'"
+            ),
+            default="",
+        ),
+    ] = "",
+    comment_limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of comments to include per issue (0 for no comments)",
+            default=0,
+            ge=0,
+            le=100,
+        ),
+    ] = 0,
+    max_bytes: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in bytes. Long descriptions and comments "
+                "are shortened to fit, keeping their beginning, end and section headings, "
+                "then trailing issues are omitted if needed. A 'truncation' entry "
+                "reports what was elided. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
+    max_tokens: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in LLM tokens (estimated). "
+                "Applied like max_bytes; the tighter of the two wins. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
+) -> str:
+    """Get multiple Jira issues by key in one call.
+
+    Use this instead of repeated jira_get_issue calls for issues collected from
+    links, subtasks or epics.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        expand: Optional fields to expand.
+        comment_limit: Maximum number of comments per issue.
+        max_bytes: Maximum response size in bytes, 0 for no limit.
+        max_tokens: Maximum response size in estimated tokens, 0 for no limit.
+
+    Returns:
+        JSON string with the issues in the requested order and the keys that
+        were not found.
+
+    Raises:
+        ValueError: If an issue key is malformed or the Jira client is unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    issues = await run_blocking(
+        jira.batch_get_issues,
+        issue_keys=issue_keys,
+        fields=fields_list,
+        expand=expand or None,
+        comment_limit=comment_limit,
+    )
+    # All issues were requested with the same fields, so they share a projection
+    projection = JiraIssueProjection.for_requested_fields(
+        issues[0].requested_fields if issues else None
+    )
+    found = {str(issue.key).upper() for issue in issues}
+    found.update(str(issue.id) for issue in issues)
+    result = {
+        "issues": [issue.to_simplified_dict(projection) for issue in issues],
+        "not_found": [
+            key
+            for key in dict.fromkeys(k.strip().upper() for k in issue_keys)
+            if key not in found
+        ],
+    }
+    return encode_response(
+        result, "jira", max_bytes=resolve_budget(max_bytes, max_tokens)
+    )
 
 
 @convert_empty_defaults_to_none
@@ -221,6 +370,30 @@ async def search(
             default="",
         ),
     ] = "",
+    max_bytes: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in bytes. Long descriptions "
+                "are shortened to fit, keeping their beginning, end and section headings, "
+                "then trailing issues are omitted if needed. A 'truncation' entry "
+                "reports what was elided. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
+    max_tokens: Annotated[
+        int,
+        Field(
+            description=(
+                "(Optional) Maximum size of the response in LLM tokens (estimated). "
+                "Applied like max_bytes; the tighter of the two wins. 0 for no limit."
+            ),
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -232,6 +405,8 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        max_bytes: Maximum response size in bytes, 0 for no limit.
+        max_tokens: Maximum response size in estimated tokens, 0 for no limit.
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -241,7 +416,8 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
+    search_result = await run_blocking(
+        jira.search_issues,
         jql=jql,
         fields=fields_list,
         limit=limit,
@@ -250,7 +426,9 @@ async def search(
         projects_filter=projects_filter,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(
+        result, "jira", max_bytes=resolve_budget(max_bytes, max_tokens)
+    )
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -283,8 +461,10 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -312,11 +492,11 @@ async def get_project_issues(
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await run_blocking(
+        jira.get_project_issues, project_key=project_key, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -335,8 +515,8 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
-    return json.dumps(transitions, indent=2, ensure_ascii=False)
+    transitions = await run_blocking(jira.get_available_transitions, issue_key)
+    return encode_response(transitions, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -354,9 +534,9 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await run_blocking(jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -378,8 +558,10 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.download_issue_attachments, issue_key=issue_key, target_dir=target_dir
+    )
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -421,7 +603,8 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await run_blocking(
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -429,7 +612,7 @@ async def get_agile_boards(
         limit=limit,
     )
     result = [board.to_simplified_dict() for board in boards]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -498,7 +681,8 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    search_result = await run_blocking(
+        jira.get_board_issues,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -507,7 +691,7 @@ async def get_board_issues(
         expand=expand,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -541,11 +725,15 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await run_blocking(
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -590,11 +778,15 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    search_result = await run_blocking(
+        jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -608,9 +800,9 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await run_blocking(jira.get_issue_link_types)
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
-    return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
+    return encode_response(formatted_link_types, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -702,7 +894,8 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await run_blocking(
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -712,10 +905,8 @@ async def create_issue(
         **extra_fields,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(
-        {"message": "Issue created successfully", "issue": result},
-        indent=2,
-        ensure_ascii=False,
+    return encode_response(
+        {"message": "Issue created successfully", "issue": result}, "jira"
     )
 
 
@@ -774,7 +965,9 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
+    created_issues = await run_blocking(
+        jira.batch_create_issues, issues_list, validate_only=validate_only
+    )
 
     message = (
         "Issues validated successfully"
@@ -785,7 +978,7 @@ async def batch_create_issues(
         "message": message,
         "issues": [issue.to_simplified_dict() for issue in created_issues],
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -841,8 +1034,8 @@ async def batch_get_changelogs(
         )
 
     # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+    issues_with_changelogs = await run_blocking(
+        jira.batch_get_changelogs, issue_ids_or_keys=issue_ids_or_keys, fields=fields
     )
 
     # Format the response
@@ -858,7 +1051,7 @@ async def batch_get_changelogs(
                 ],
             }
         )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return encode_response(results, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -946,17 +1139,17 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await run_blocking(
+            jira.update_issue, issue_key=issue_key, **all_updates
+        )
         result = issue.to_simplified_dict()
         if (
             hasattr(issue, "custom_fields")
             and "attachment_results" in issue.custom_fields
         ):
             result["attachment_results"] = issue.custom_fields["attachment_results"]
-        return json.dumps(
-            {"message": "Issue updated successfully", "issue": result},
-            indent=2,
-            ensure_ascii=False,
+        return encode_response(
+            {"message": "Issue updated successfully", "issue": result}, "jira"
         )
     except Exception as e:
         logger.error(f"Error updating issue {issue_key}: {str(e)}", exc_info=True)
@@ -982,10 +1175,10 @@ async def delete_issue(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    deleted = jira.delete_issue(issue_key)
+    deleted = await run_blocking(jira.delete_issue, issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1010,8 +1203,8 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.add_comment, issue_key, comment)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -1070,7 +1263,8 @@ async def add_worklog(
     """
     jira = await get_jira_fetcher(ctx)
     # add_worklog returns dict
-    worklog_result = jira.add_worklog(
+    worklog_result = await run_blocking(
+        jira.add_worklog,
         issue_key=issue_key,
         time_spent=time_spent,
         comment=comment,
@@ -1079,7 +1273,7 @@ async def add_worklog(
         remaining_estimate=remaining_estimate,
     )
     result = {"message": "Worklog added successfully", "worklog": worklog_result}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1107,12 +1301,12 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await run_blocking(jira.link_issue_to_epic, issue_key, epic_key)
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -1180,8 +1374,8 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.create_issue_link, link_data)
+    return encode_response(result, "jira")
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1206,8 +1400,10 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.remove_issue_link, link_id
+    )  # Returns dict on success
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -1270,7 +1466,8 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await run_blocking(
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1281,7 +1478,80 @@ async def transition_issue(
         "message": f"Issue {issue_key} transitioned successfully",
         "issue": issue.to_simplified_dict() if issue else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return encode_response(result, "jira")
+
+
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "write"})
+@check_write_access
+async def batch_transition_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']",
+            min_length=1,
+        ),
+    ],
+    target: Annotated[
+        str,
+        Field(
+            description=(
+                "Status to move every issue to (e.g., 'Done'), or the name or ID of the "
+                "transition to perform. Issues already in that status are skipped."
+            )
+        ),
+    ],
+    fields: Annotated[
+        dict[str, Any],
+        Field(
+            description=(
+                "(Optional) Dictionary of fields to set during every transition. "
+                "Example: {'resolution': {'name': 'Fixed'}}"
+            ),
+            default_factory=dict,
+        ),
+    ] = {},  # noqa: B006
+    comment: Annotated[
+        str,
+        Field(description="(Optional) Comment to add to every transitioned issue."),
+    ] = "",
+) -> str:
+    """Transition multiple Jira issues to the same status, e.g. to close out a sprint.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        target: Target status name, transition name, or transition ID.
+        fields: Optional dictionary of fields to set during every transition.
+        comment: Optional comment for every transition.
+
+    Returns:
+        JSON string with a summary and the outcome of each issue.
+
+    Raises:
+        ValueError: If the target is missing, in read-only mode, or Jira client unavailable.
+    """
+    jira = await get_jira_fetcher(ctx)
+    outcomes = await run_blocking(
+        jira.batch_transition_issues,
+        issue_keys=issue_keys,
+        target=target,
+        fields=fields or None,
+        comment=comment or None,
+    )
+    summary = {"transitioned": 0, "skipped": 0, "failed": 0}
+    for outcome in outcomes:
+        summary[outcome["status"]] += 1
+    result = {
+        "message": (
+            f"Transitioned {summary['transitioned']} issues to '{target}', "
+            f"skipped {summary['skipped']}, failed {summary['failed']}"
+        ),
+        "summary": summary,
+        "results": outcomes,
+    }
+    return encode_response(result, "jira")
 
 
 @convert_empty_defaults_to_none
@@ -1318,14 +1588,15 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await run_blocking(
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
         end_date=end_date,
         goal=goal,
     )
-    return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return encode_response(sprint.to_simplified_dict(), "jira")
 
 
 @convert_empty_defaults_to_none
@@ -1367,7 +1638,8 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await run_blocking(
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1380,6 +1652,6 @@ async def update_sprint(
         error_payload = {
             "error": f"Failed to update sprint {sprint_id}. Check logs for details."
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return encode_response(error_payload, "jira")
     else:
-        return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return encode_response(sprint.to_simplified_dict(), "jira")
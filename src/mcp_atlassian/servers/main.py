@@ -1,38 +1,93 @@
 """Main FastMCP server setup for Atlassian integration."""
 
+import asyncio
 import logging
+import os
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Optional
 
 from cachetools import TTLCache
 from fastmcp import FastMCP
 from fastmcp.tools import Tool as FastMCPTool
+from mcp.types import EmbeddedResource, ImageContent, TextContent
 from mcp.types import Tool as MCPTool
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import FileResponse, JSONResponse, PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
-from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.circuitbreaker import circuit_breaker_states
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from mcp_atlassian.utils.metrics import (
+    metrics_enabled,
+    record_tool_call,
+    render_metrics,
+)
+from mcp_atlassian.utils.oauth import stop_oauth_token_managers
+from mcp_atlassian.utils.profiling import get_slow_call_profiler, tool_call_scope
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
+from mcp_atlassian.utils.tracing import span
 
-from .confluence import confluence_mcp
 from .context import MainAppContext
-from .jira import jira_mcp
+
+if TYPE_CHECKING:
+    from mcp_atlassian.confluence import ConfluenceFetcher
+    from mcp_atlassian.jira import JiraFetcher
 
 logger = logging.getLogger("mcp-atlassian.server.main")
 
 
 async def health_check(request: Request) -> JSONResponse:
-    return JSONResponse({"status": "ok"})
+    breakers = circuit_breaker_states()
+    degraded = any(breaker["state"] != "closed" for breaker in breakers.values())
+    return JSONResponse(
+        {"status": "degraded" if degraded else "ok", "circuit_breakers": breakers}
+    )
+
+
+async def metrics(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+async def list_slow_call_profiles(request: Request) -> JSONResponse:
+    profiler = get_slow_call_profiler()
+    if profiler is None:
+        return JSONResponse({"error": "Profiling is disabled"}, status_code=404)
+    try:
+        limit = int(request.query_params.get("limit", "20"))
+    except ValueError:
+        return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+    return JSONResponse(
+        {
+            "threshold_ms": profiler.threshold_ms,
+            "profiles": profiler.list_profiles(limit),
+        }
+    )
+
+
+async def get_slow_call_profile(
+    request: Request,
+) -> PlainTextResponse | FileResponse | JSONResponse:
+    profiler = get_slow_call_profiler()
+    name = request.path_params["name"]
+    path = profiler.get_profile_path(name) if profiler else None
+    if profiler is None or path is None:
+        return JSONResponse({"error": f"Profile {name} not found"}, status_code=404)
+    if request.query_params.get("raw", "").lower() in ("true", "1", "yes"):
+        return FileResponse(path, media_type="application/octet-stream")
+    sort = request.query_params.get("sort", "cumulative")
+    try:
+        return PlainTextResponse(profiler.summarize(name, sort=sort))
+    except KeyError:
+        return JSONResponse({"error": f"Invalid sort key {sort}"}, status_code=400)
 
 
 @asynccontextmanager
@@ -40,7 +95,10 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info("Main Atlassian MCP server lifespan starting...")
     services = get_available_services()
     read_only = is_read_only_mode()
-    enabled_tools = get_enabled_tools()
+    enabled_tool_names = get_enabled_tools()
+    enabled_tools = (
+        frozenset(enabled_tool_names) if enabled_tool_names is not None else None
+    )
 
     loaded_jira_config: JiraConfig | None = None
     loaded_confluence_config: ConfluenceConfig | None = None
@@ -82,14 +140,65 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         enabled_tools=enabled_tools,
     )
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
-    logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
-    yield {"app_lifespan_context": app_context}
-    logger.info("Main Atlassian MCP server lifespan shutting down.")
+    logger.info(
+        f"Enabled tools filter: {', '.join(enabled_tool_names or []) or 'All tools enabled'}"
+    )
+    # Get OAuth tokens refreshing in the background before the first tool call
+    for config in (loaded_jira_config, loaded_confluence_config):
+        oauth_config = getattr(config, "oauth_config", None)
+        if config and config.auth_type == "oauth" and oauth_config:
+            if oauth_config.refresh_token:
+                await asyncio.to_thread(oauth_config.ensure_valid_token)
+    try:
+        yield {"app_lifespan_context": app_context}
+    finally:
+        stop_oauth_token_managers()
+        logger.info("Main Atlassian MCP server lifespan shutting down.")
+
+
+class ToolFilter(NamedTuple):
+    """The settings that decide which tools are listed."""
+
+    has_context: bool
+    read_only: bool
+    enabled_tools: frozenset[str] | None
+    jira_configured: bool
+    confluence_configured: bool
 
 
 class AtlassianMCP(FastMCP[MainAppContext]):
     """Custom FastMCP server class for Atlassian integration with tool filtering."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Filtered tool lists by the settings they were filtered with
+        self._tool_list_cache: dict[ToolFilter, list[MCPTool]] = {}
+        super().__init__(*args, **kwargs)
+
+    def invalidate_tool_list_cache(self) -> None:
+        """Drop the cached tool lists.
+
+        Adding, removing or mounting tools on this server does this
+        automatically; call it after changing the tools of an already
+        mounted server.
+        """
+        self._tool_list_cache.clear()
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        super().add_tool(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
+    def remove_tool(self, *args: Any, **kwargs: Any) -> None:
+        super().remove_tool(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
+    def mount(self, *args: Any, **kwargs: Any) -> None:
+        super().mount(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
+    def unmount(self, *args: Any, **kwargs: Any) -> None:
+        super().unmount(*args, **kwargs)
+        self.invalidate_tool_list_cache()
+
     async def _mcp_list_tools(self) -> list[MCPTool]:
         # Filter tools based on enabled_tools, read_only mode, and service configuration from the lifespan context.
         req_context = self._mcp_server.request_context
@@ -105,16 +214,32 @@ class AtlassianMCP(FastMCP[MainAppContext]):
             if isinstance(lifespan_ctx_dict, dict)
             else None
         )
-        read_only = (
-            getattr(app_lifespan_state, "read_only", False)
-            if app_lifespan_state
-            else False
-        )
-        enabled_tools_filter = (
+        enabled_tools = (
             getattr(app_lifespan_state, "enabled_tools", None)
             if app_lifespan_state
             else None
         )
+        tool_filter = ToolFilter(
+            has_context=app_lifespan_state is not None,
+            read_only=getattr(app_lifespan_state, "read_only", False),
+            enabled_tools=(
+                frozenset(enabled_tools) if enabled_tools is not None else None
+            ),
+            jira_configured=bool(getattr(app_lifespan_state, "full_jira_config", None)),
+            confluence_configured=bool(
+                getattr(app_lifespan_state, "full_confluence_config", None)
+            ),
+        )
+        filtered_tools = self._tool_list_cache.get(tool_filter)
+        if filtered_tools is None:
+            filtered_tools = await self._filter_tools(tool_filter)
+            self._tool_list_cache[tool_filter] = filtered_tools
+        return list(filtered_tools)
+
+    async def _filter_tools(self, tool_filter: ToolFilter) -> list[MCPTool]:
+        """Build the tool list for one combination of settings."""
+        read_only = tool_filter.read_only
+        enabled_tools_filter = tool_filter.enabled_tools
         logger.debug(
             f"_main_mcp_list_tools: read_only={read_only}, enabled_tools_filter={enabled_tools_filter}"
         )
@@ -142,13 +267,13 @@ class AtlassianMCP(FastMCP[MainAppContext]):
             is_jira_tool = "jira" in tool_tags
             is_confluence_tool = "confluence" in tool_tags
             service_configured_and_available = True
-            if app_lifespan_state:
-                if is_jira_tool and not app_lifespan_state.full_jira_config:
+            if tool_filter.has_context:
+                if is_jira_tool and not tool_filter.jira_configured:
                     logger.debug(
                         f"Excluding Jira tool '{registered_name}' as Jira configuration/authentication is incomplete."
                     )
                     service_configured_and_available = False
-                if is_confluence_tool and not app_lifespan_state.full_confluence_config:
+                if is_confluence_tool and not tool_filter.confluence_configured:
                     logger.debug(
                         f"Excluding Confluence tool '{registered_name}' as Confluence configuration/authentication is incomplete."
                     )
@@ -169,6 +294,24 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         )
         return filtered_tools
 
+    async def _mcp_call_tool(
+        self, key: str, arguments: dict[str, Any]
+    ) -> list[TextContent | ImageContent | EmbeddedResource]:
+        start = time.perf_counter()
+        status = "error"
+        # Tool names come from the client; keep unknown ones out of the labels
+        tool = key if key in await self.get_tools() else "unknown"
+        try:
+            with (
+                span(f"mcp.tool {key}", **{"mcp.tool": key}),
+                tool_call_scope(key, arguments),
+            ):
+                result = await super()._mcp_call_tool(key, arguments)
+            status = "success"
+            return result
+        finally:
+            record_tool_call(tool, status, time.perf_counter() - start)
+
     def http_app(
         self,
         path: str | None = None,
@@ -186,111 +329,154 @@ class AtlassianMCP(FastMCP[MainAppContext]):
 
 
 token_validation_cache: TTLCache[
-    int, tuple[bool, str | None, JiraFetcher | None, ConfluenceFetcher | None]
+    int, tuple[bool, str | None, "JiraFetcher | None", "ConfluenceFetcher | None"]
 ] = TTLCache(maxsize=100, ttl=300)
 
 
-class UserTokenMiddleware(BaseHTTPMiddleware):
-    """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
+class UserTokenMiddleware:
+    """Middleware to extract Atlassian user tokens/credentials from Authorization headers.
+
+    This is a plain ASGI middleware rather than a ``BaseHTTPMiddleware``, so
+    requests are not wrapped in an extra task and response stream. Only POST
+    requests to the MCP endpoint are inspected; everything else is passed on
+    untouched.
+    """
 
     def __init__(
-        self, app: Any, mcp_server_ref: Optional["AtlassianMCP"] = None
+        self, app: ASGIApp, mcp_server_ref: Optional["AtlassianMCP"] = None
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.mcp_server_ref = mcp_server_ref
         if not self.mcp_server_ref:
             logger.warning(
                 "UserTokenMiddleware initialized without mcp_server_ref. Path matching for MCP endpoint might fail if settings are needed."
             )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> JSONResponse:
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: ENTERED for request path='{request.url.path}', method='{request.method}'"
-        )
-        mcp_server_instance = self.mcp_server_ref
-        if mcp_server_instance is None:
-            logger.debug(
-                "UserTokenMiddleware.dispatch: self.mcp_server_ref is None. Skipping MCP auth logic."
-            )
-            return await call_next(request)
-
-        mcp_path = mcp_server_instance.settings.streamable_http_path.rstrip("/")
-        request_path = request.url.path.rstrip("/")
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: Comparing request_path='{request_path}' with mcp_path='{mcp_path}'. Request method='{request.method}'"
-        )
-        if request_path == mcp_path and request.method == "POST":
-            auth_header = request.headers.get("Authorization")
-            token_for_log = mask_sensitive(
-                auth_header.split(" ", 1)[1].strip()
-                if auth_header and " " in auth_header
-                else auth_header
+    def _is_mcp_request(self, scope: Scope) -> bool:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or self.mcp_server_ref is None
+        ):
+            return False
+        mcp_path = self.mcp_server_ref.settings.streamable_http_path.rstrip("/")
+        return scope["path"].rstrip("/") == mcp_path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._is_mcp_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        with span("mcp.auth", **{"http.path": scope["path"]}) as auth_span:
+            error_response = self._set_user_auth_state(request)
+            auth_span.set_attribute(
+                "mcp.auth_type",
+                getattr(request.state, "user_atlassian_auth_type", None) or "none",
             )
+        if error_response is not None:
+            await error_response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _set_user_auth_state(self, request: Request) -> JSONResponse | None:
+        """Store the credentials of the Authorization header in request.state.
+
+        Args:
+            request: The incoming MCP request.
+
+        Returns:
+            A 401 response if the header is invalid, None otherwise.
+        """
+        auth_header = request.headers.get("Authorization")
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"UserTokenMiddleware: Path='{request.url.path}', AuthHeader='{mask_sensitive(auth_header)}', ParsedToken(masked)='{token_for_log}'"
+                "UserTokenMiddleware: Path='%s', AuthHeader='%s'",
+                request.scope["path"],
+                mask_sensitive(auth_header),
             )
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header.split(" ", 1)[1].strip()
-                if not token:
-                    return JSONResponse(
-                        {"error": "Unauthorized: Empty Bearer token"},
-                        status_code=401,
-                    )
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: Bearer token extracted (masked): ...{mask_sensitive(token, 8)}"
-                )
-                request.state.user_atlassian_token = token
-                request.state.user_atlassian_auth_type = "oauth"
-                request.state.user_atlassian_email = None
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: Set request.state (pre-validation): "
-                    f"auth_type='{getattr(request.state, 'user_atlassian_auth_type', 'N/A')}', "
-                    f"token_present={bool(getattr(request.state, 'user_atlassian_token', None))}"
-                )
-            elif auth_header and auth_header.startswith("Token "):
-                token = auth_header.split(" ", 1)[1].strip()
-                if not token:
-                    return JSONResponse(
-                        {"error": "Unauthorized: Empty Token (PAT)"},
-                        status_code=401,
-                    )
-                logger.debug(
-                    f"UserTokenMiddleware.dispatch: PAT (Token scheme) extracted (masked): ...{mask_sensitive(token, 8)}"
-                )
-                request.state.user_atlassian_token = token
-                request.state.user_atlassian_auth_type = "pat"
-                request.state.user_atlassian_email = (
-                    None  # PATs don't carry email in the token itself
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header.split(" ", 1)[1].strip()
+            if not token:
+                return JSONResponse(
+                    {"error": "Unauthorized: Empty Bearer token"},
+                    status_code=401,
                 )
+            request.state.user_atlassian_token = token
+            request.state.user_atlassian_auth_type = "oauth"
+            request.state.user_atlassian_email = None
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    "UserTokenMiddleware.dispatch: Set request.state for PAT auth."
-                )
-            elif auth_header:
-                logger.warning(
-                    f"Unsupported Authorization type for {request.url.path}: {auth_header.split(' ', 1)[0] if ' ' in auth_header else 'UnknownType'}"
+                    "UserTokenMiddleware: Bearer token extracted (masked): ...%s",
+                    mask_sensitive(token, 8),
                 )
+        elif auth_header and auth_header.startswith("Token "):
+            token = auth_header.split(" ", 1)[1].strip()
+            if not token:
                 return JSONResponse(
-                    {
-                        "error": "Unauthorized: Only 'Bearer <OAuthToken>' or 'Token <PAT>' types are supported."
-                    },
+                    {"error": "Unauthorized: Empty Token (PAT)"},
                     status_code=401,
                 )
-            else:
+            request.state.user_atlassian_token = token
+            request.state.user_atlassian_auth_type = "pat"
+            request.state.user_atlassian_email = (
+                None  # PATs don't carry email in the token itself
+            )
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"No Authorization header provided for {request.url.path}. Will proceed with global/fallback server configuration if applicable."
+                    "UserTokenMiddleware: PAT (Token scheme) extracted (masked): ...%s",
+                    mask_sensitive(token, 8),
                 )
-        response = await call_next(request)
-        logger.debug(
-            f"UserTokenMiddleware.dispatch: EXITED for request path='{request.url.path}'"
-        )
-        return response
+        elif auth_header:
+            logger.warning(
+                "Unsupported Authorization type for %s: %s",
+                request.scope["path"],
+                auth_header.split(" ", 1)[0] if " " in auth_header else "UnknownType",
+            )
+            return JSONResponse(
+                {
+                    "error": "Unauthorized: Only 'Bearer <OAuthToken>' or 'Token <PAT>' types are supported."
+                },
+                status_code=401,
+            )
+        else:
+            logger.debug(
+                "No Authorization header provided for %s. Will proceed with global/fallback server configuration if applicable.",
+                request.scope["path"],
+            )
+        return None
+
+
+def mount_service_servers(mcp: FastMCP, services: dict[str, bool | None]) -> None:
+    """Mount the tool servers of the given services.
+
+    The tool modules, and through them the service clients, are only imported
+    for the services that are mounted.
+
+    Args:
+        mcp: The server to mount the tool servers on.
+        services: Whether each service ("jira", "confluence") is configured.
+    """
+    if services.get("jira"):
+        from .jira import jira_mcp
+
+        mcp.mount("jira", jira_mcp)
+    if services.get("confluence"):
+        from .confluence import confluence_mcp
+
+        mcp.mount("confluence", confluence_mcp)
 
 
 main_mcp = AtlassianMCP(name="Atlassian MCP", lifespan=main_lifespan)
-main_mcp.mount("jira", jira_mcp)
-main_mcp.mount("confluence", confluence_mcp)
+# Services without a URL can't be used, so their tools are not even loaded;
+# the lifespan decides which of the mounted tools are listed.
+mount_service_servers(
+    main_mcp,
+    {
+        "jira": bool(os.getenv("JIRA_URL")),
+        "confluence": bool(os.getenv("CONFLUENCE_URL")),
+    },
+)
 
 
 @main_mcp.custom_route("/healthz", methods=["GET"], include_in_schema=False)
@@ -299,3 +485,27 @@ async def _health_check_route(request: Request) -> JSONResponse:
 
 
 logger.info("Added /healthz endpoint for Kubernetes probes")
+
+if metrics_enabled():
+
+    @main_mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def _metrics_route(request: Request) -> PlainTextResponse:
+        return await metrics(request)
+
+    logger.info("Added /metrics endpoint for Prometheus")
+
+if get_slow_call_profiler() is not None:
+
+    @main_mcp.custom_route("/debug/profiles", methods=["GET"], include_in_schema=False)
+    async def _list_profiles_route(request: Request) -> JSONResponse:
+        return await list_slow_call_profiles(request)
+
+    @main_mcp.custom_route(
+        "/debug/profiles/{name}", methods=["GET"], include_in_schema=False
+    )
+    async def _get_profile_route(
+        request: Request,
+    ) -> PlainTextResponse | FileResponse | JSONResponse:
+        return await get_slow_call_profile(request)
+
+    logger.info("Added /debug/profiles endpoints for slow tool call profiles")
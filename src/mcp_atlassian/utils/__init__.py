@@ -1,17 +1,47 @@
 """
 Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
+
+The re-exports below are resolved on first access, so importing a single
+utility module does not load the OAuth, SSL and FastMCP dependencies of the
+others.
 """
 
-from .date import parse_date
-from .decorators import convert_empty_defaults_to_none
-from .io import is_read_only_mode
-from .logging import setup_logging
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .date import parse_date
+    from .decorators import convert_empty_defaults_to_none
+    from .io import is_read_only_mode
+    from .logging import setup_logging
+    from .oauth import OAuthConfig, configure_oauth_session
+    from .ssl import SSLIgnoreAdapter, configure_ssl_verification
+    from .urls import is_atlassian_cloud_url
+
+# Module providing each exported name
+_EXPORTS = {
+    "SSLIgnoreAdapter": ".ssl",
+    "configure_ssl_verification": ".ssl",
+    "is_atlassian_cloud_url": ".urls",
+    "is_read_only_mode": ".io",
+    "setup_logging": ".logging",
+    "parse_date": ".date",
+    "OAuthConfig": ".oauth",
+    "configure_oauth_session": ".oauth",
+    "convert_empty_defaults_to_none": ".decorators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Export OAuth utilities
-from .oauth import OAuthConfig, configure_oauth_session
-from .ssl import SSLIgnoreAdapter, configure_ssl_verification
-from .urls import is_atlassian_cloud_url
 
 # Export all utility functions for backward compatibility
 __all__ = [
@@ -21,7 +51,6 @@ __all__ = [
     "is_read_only_mode",
     "setup_logging",
     "parse_date",
-    "parse_iso8601_date",
     "OAuthConfig",
     "configure_oauth_session",
     "convert_empty_defaults_to_none",
@@ -0,0 +1,301 @@
+"""Per-site circuit breakers for Atlassian API requests.
+
+When a Jira or Confluence site is down, every request would otherwise wait
+for its connection timeout. A :class:`CircuitBreaker` is shared by all
+sessions of a site (see :func:`get_circuit_breaker`):
+
+- **closed**: requests go through. Connection errors, timeouts and 5xx
+  responses count as failures; any other response resets the count.
+- **open**: after ``ATLASSIAN_CIRCUIT_BREAKER_FAILURES`` consecutive failures,
+  requests fail immediately with
+  :class:`~mcp_atlassian.exceptions.MCPAtlassianCircuitOpenError` for
+  ``ATLASSIAN_CIRCUIT_BREAKER_RESET_TIMEOUT`` seconds.
+- **half_open**: then a single probe request is let through. If it
+  succeeds the circuit closes, otherwise it opens again.
+
+The state of every breaker is reported by ``/healthz``. Disable with
+``ATLASSIAN_CIRCUIT_BREAKER_ENABLED=false``.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any
+
+from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
+
+from ..exceptions import MCPAtlassianCircuitOpenError
+from .metrics import record_circuit_transition
+from .urls import site_key
+
+logger = logging.getLogger("mcp-atlassian.utils.circuitbreaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Responses meaning the site itself is failing, as opposed to the request
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class CircuitBreakerSettings:
+    """Circuit breaker settings, read from the environment."""
+
+    enabled: bool = True
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerSettings":
+        """Create the settings from environment variables.
+
+        Returns:
+            The settings; invalid values fall back to the defaults.
+        """
+        enabled = os.getenv("ATLASSIAN_CIRCUIT_BREAKER_ENABLED", "true").lower() in (
+            "true",
+            "1",
+            "yes",
+            "y",
+            "on",
+        )
+        try:
+            return cls(
+                enabled=enabled,
+                failure_threshold=max(
+                    int(os.getenv("ATLASSIAN_CIRCUIT_BREAKER_FAILURES", "5")), 1
+                ),
+                reset_timeout=max(
+                    float(os.getenv("ATLASSIAN_CIRCUIT_BREAKER_RESET_TIMEOUT", "30")),
+                    0.0,
+                ),
+            )
+        except ValueError:
+            logger.warning(
+                "Invalid ATLASSIAN_CIRCUIT_BREAKER_* setting, using defaults"
+            )
+            return cls(enabled=enabled)
+
+
+class CircuitBreaker:
+    """Tracks the failures of one Atlassian site and sheds load while it is down."""
+
+    def __init__(
+        self,
+        site: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            site: The site the breaker applies to.
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a probe.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.site = site
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._last_error: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The current state: "closed", "open" or "half_open"."""
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        record_circuit_transition(self.site, state)
+        if state == OPEN:
+            logger.warning(
+                f"Circuit for {self.site} opened after {self._failures} "
+                f"consecutive failures ({self._last_error}); failing fast for "
+                f"{self.reset_timeout:g}s"
+            )
+        else:
+            logger.info(f"Circuit for {self.site} is {state.replace('_', '-')}")
+
+    def before_call(self) -> None:
+        """Check that a request may be sent.
+
+        Raises:
+            MCPAtlassianCircuitOpenError: If the circuit is open, or half-open
+                with a probe already in flight.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            retry_in = self._opened_at + self.reset_timeout - self._clock()
+            if self._state == OPEN and retry_in <= 0:
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+        msg = (
+            f"{self.site} is unavailable: circuit breaker open after "
+            f"{self._failures} consecutive failures (last: {self._last_error}). "
+            f"Retrying in {max(retry_in, 0):.0f}s."
+        )
+        raise MCPAtlassianCircuitOpenError(msg, retry_after=max(retry_in, 0.0))
+
+    def record_success(self) -> None:
+        """Record a response from the site, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._transition(CLOSED)
+
+    def record_failure(self, error: str) -> None:
+        """Record a failed request, opening the circuit past the threshold.
+
+        Args:
+            error: A short description of the failure.
+        """
+        with self._lock:
+            self._failures += 1
+            self._last_error = error
+            self._probing = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """End a request that neither succeeded nor failed, freeing the probe."""
+        with self._lock:
+            self._probing = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """Describe the breaker for health reporting.
+
+        Returns:
+            The state, consecutive failures, last error and, when open, the
+            seconds until the next probe.
+        """
+        with self._lock:
+            snapshot: dict[str, Any] = {
+                "state": self._state,
+                "failures": self._failures,
+            }
+            if self._last_error:
+                snapshot["last_error"] = self._last_error
+            if self._state == OPEN:
+                retry_in = self._opened_at + self.reset_timeout - self._clock()
+                snapshot["retry_in"] = round(max(retry_in, 0.0), 1)
+            return snapshot
+
+
+_settings: CircuitBreakerSettings | None = None
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker_settings() -> CircuitBreakerSettings:
+    """Get the circuit breaker settings, reading the environment on first use.
+
+    Returns:
+        The settings.
+    """
+    global _settings
+    if _settings is None:
+        _settings = CircuitBreakerSettings.from_env()
+    return _settings
+
+
+def set_circuit_breaker_settings(settings: CircuitBreakerSettings | None) -> None:
+    """Replace the circuit breaker settings and drop the existing breakers.
+
+    Args:
+        settings: The settings, or None to re-read the environment.
+    """
+    global _settings
+    _settings = settings
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Get the circuit breaker shared by all sessions of a site.
+
+    Args:
+        url: An API base URL of the site.
+
+    Returns:
+        The site's circuit breaker.
+    """
+    key = site_key(url)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            settings = get_circuit_breaker_settings()
+            breaker = _breakers[key] = CircuitBreaker(
+                key,
+                failure_threshold=settings.failure_threshold,
+                reset_timeout=settings.reset_timeout,
+            )
+        return breaker
+
+
+def circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """Describe the circuit breakers of all sites contacted so far.
+
+    Returns:
+        Breaker snapshots by site.
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.site: breaker.snapshot() for breaker in breakers}
+
+
+def protect_session(session: Session, url: str) -> None:
+    """Send the requests of a session through its site's circuit breaker.
+
+    Sessions are only wrapped once.
+
+    Args:
+        session: The session used by the Atlassian API client.
+        url: The API base URL of the site.
+    """
+    if not get_circuit_breaker_settings().enabled or getattr(
+        session, "_mcp_circuit_breaker", None
+    ):
+        return
+
+    breaker = get_circuit_breaker(url)
+    send = session.send
+
+    @wraps(send)
+    def protected_send(request: Any, **kwargs: Any) -> Any:
+        breaker.before_call()
+        try:
+            response = send(request, **kwargs)
+        except (RequestsConnectionError, Timeout) as e:
+            breaker.record_failure(type(e).__name__)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        if response.status_code in FAILURE_STATUS_CODES:
+            breaker.record_failure(f"HTTP {response.status_code}")
+        else:
+            breaker.record_success()
+        return response
+
+    session.send = protected_send  # type: ignore[method-assign]
+    session._mcp_circuit_breaker = breaker  # type: ignore[attr-defined]
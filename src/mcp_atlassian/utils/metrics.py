@@ -0,0 +1,510 @@
+"""Prometheus-style metrics for MCP Atlassian.
+
+A small, dependency-free metrics registry rendered in the Prometheus text
+exposition format by the ``/metrics`` endpoint. Instrumentation hooks cover:
+
+- MCP tool calls (:func:`record_tool_call`), by tool, service and status
+- Upstream Atlassian HTTP calls (:func:`instrument_session`), by service,
+  method and status code
+- Content conversions of the preprocessors (:func:`instrument_conversion`)
+- Cache lookups (:func:`record_cache_lookup`)
+- Rate limiter waits and throttled retries (:func:`record_rate_limit_wait`,
+  :func:`record_upstream_retry`)
+- Circuit breaker state changes (:func:`record_circuit_transition`)
+- Reads served by an identical in-flight call (:func:`record_coalesced_call`)
+
+Metrics are enabled by default and can be turned off with
+``METRICS_ENABLED=false``, which also removes the ``/metrics`` endpoint.
+"""
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .tracing import span
+
+if TYPE_CHECKING:
+    from requests import Session
+
+logger = logging.getLogger("mcp-atlassian.utils.metrics")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_enabled: bool | None = None
+
+
+def metrics_enabled() -> bool:
+    """Check whether metrics collection is enabled.
+
+    Returns:
+        False if METRICS_ENABLED is set to a false value, True otherwise.
+    """
+    global _enabled
+    if _enabled is None:
+        value = os.getenv("METRICS_ENABLED", "true")
+        _enabled = value.lower() in ("true", "1", "yes", "y", "on")
+    return _enabled
+
+
+def set_metrics_enabled(*, enabled: bool | None) -> None:
+    """Enable or disable metrics collection, overriding METRICS_ENABLED.
+
+    Args:
+        enabled: Whether metrics are collected, or None to re-read the
+            environment on next use.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    """Base class of labelled metrics."""
+
+    type_name = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Render the sample lines of the metric."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text format.
+
+        Returns:
+            The exposition lines of the metric.
+        """
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: The amount to add.
+            **labels: The label values of the sample.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value of a sample.
+
+        Args:
+            **labels: The label values of the sample.
+
+        Returns:
+            The value, 0 if never incremented.
+        """
+        return self._values.get(self._key(labels), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    """A histogram of observed values with cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: bucket counts (non-cumulative), sum and count
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value, e.g. a duration in seconds.
+            **labels: The label values of the sample.
+        """
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations of a sample.
+
+        Args:
+            **labels: The label values of the sample.
+
+        Returns:
+            The number of observations, 0 if none.
+        """
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._values.items()
+            )
+        lines = []
+        bucket_labelnames = (*self.labelnames, "le")
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(bucket_labelnames, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """A collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Add a metric to the registry.
+
+        Args:
+            metric: The metric to add.
+
+        Returns:
+            The metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def reset(self) -> None:
+        """Drop the samples of all metrics."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns:
+            The exposition text.
+        """
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_tool_calls_total",
+        "MCP tool calls.",
+        ("tool", "service", "status"),
+    )
+)
+TOOL_DURATION = REGISTRY.register(
+    Histogram(
+        "mcp_atlassian_tool_duration_seconds",
+        "MCP tool call latency in seconds.",
+        ("tool", "service", "status"),
+    )
+)
+UPSTREAM_REQUESTS = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_upstream_requests_total",
+        "HTTP requests sent to Atlassian.",
+        ("service", "method", "status"),
+    )
+)
+UPSTREAM_DURATION = REGISTRY.register(
+    Histogram(
+        "mcp_atlassian_upstream_request_duration_seconds",
+        "Latency of HTTP requests sent to Atlassian in seconds.",
+        ("service", "method", "status"),
+    )
+)
+CONVERSION_DURATION = REGISTRY.register(
+    Histogram(
+        "mcp_atlassian_conversion_duration_seconds",
+        "Content conversion latency in seconds.",
+        ("conversion", "status"),
+    )
+)
+UPSTREAM_RETRIES = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_upstream_retries_total",
+        "HTTP requests to Atlassian retried after throttling.",
+        ("service", "reason"),
+    )
+)
+RATE_LIMIT_WAIT = REGISTRY.register(
+    Histogram(
+        "mcp_atlassian_rate_limit_wait_seconds",
+        "Time HTTP requests to Atlassian waited for the client-side rate limiter.",
+        ("service",),
+    )
+)
+CIRCUIT_TRANSITIONS = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_circuit_breaker_transitions_total",
+        "Circuit breaker state changes per Atlassian site.",
+        ("site", "state"),
+    )
+)
+COALESCED_CALLS = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_coalesced_calls_total",
+        "Reads served by an identical in-flight call instead of a new request.",
+        ("call",),
+    )
+)
+CACHE_LOOKUPS = REGISTRY.register(
+    Counter(
+        "mcp_atlassian_cache_lookups_total",
+        "Cache lookups.",
+        ("cache", "result"),
+    )
+)
+
+
+def record_tool_call(tool: str, status: str, duration: float) -> None:
+    """Record a completed MCP tool call.
+
+    Args:
+        tool: The tool name, e.g. "jira_get_issue".
+        status: "success" or "error".
+        duration: The call duration in seconds.
+    """
+    if not metrics_enabled():
+        return
+    service = tool.split("_", 1)[0] if "_" in tool else "main"
+    TOOL_CALLS.inc(tool=tool, service=service, status=status)
+    TOOL_DURATION.observe(duration, tool=tool, service=service, status=status)
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Record a cache lookup.
+
+    Args:
+        cache: The cache name.
+        hit: Whether the lookup was served from the cache.
+    """
+    if metrics_enabled():
+        CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_upstream_retry(service: str, reason: str) -> None:
+    """Record a retried upstream request.
+
+    Args:
+        service: The service name, e.g. "jira" or "confluence".
+        reason: Why the request was retried, e.g. "429".
+    """
+    if metrics_enabled():
+        UPSTREAM_RETRIES.inc(service=service, reason=reason)
+
+
+def record_rate_limit_wait(service: str, seconds: float) -> None:
+    """Record the time a request waited for the rate limiter.
+
+    Args:
+        service: The service name, e.g. "jira" or "confluence".
+        seconds: The time waited.
+    """
+    if metrics_enabled():
+        RATE_LIMIT_WAIT.observe(seconds, service=service)
+
+
+def record_circuit_transition(site: str, state: str) -> None:
+    """Record a circuit breaker changing state.
+
+    Args:
+        site: The Atlassian site of the breaker.
+        state: The new state: "closed", "open" or "half_open".
+    """
+    if metrics_enabled():
+        CIRCUIT_TRANSITIONS.inc(site=site, state=state)
+
+
+def record_coalesced_call(call: str) -> None:
+    """Record a read that shared the result of an in-flight call.
+
+    Args:
+        call: The coalesced method, e.g. "IssuesMixin.get_issue".
+    """
+    if metrics_enabled():
+        COALESCED_CALLS.inc(call=call)
+
+
+def instrument_session(session: "Session", service: str) -> None:
+    """Record the requests sent through a requests session.
+
+    Wraps ``session.send`` so every request, including those failing
+    before a response is received, is counted and timed. Sessions are
+    only instrumented once.
+
+    Args:
+        session: The session used by the Atlassian API client.
+        service: The service name, e.g. "jira" or "confluence".
+    """
+    if not metrics_enabled() or getattr(session, "_mcp_metrics_service", None):
+        return
+
+    send = session.send
+
+    @wraps(send)
+    def instrumented_send(request: Any, **kwargs: Any) -> Any:
+        method = getattr(request, "method", None) or "GET"
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = send(request, **kwargs)
+            status = str(response.status_code)
+            return response
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            UPSTREAM_REQUESTS.inc(service=service, method=method, status=status)
+            UPSTREAM_DURATION.observe(
+                time.perf_counter() - start,
+                service=service,
+                method=method,
+                status=status,
+            )
+
+    session.send = instrumented_send  # type: ignore[method-assign]
+    session._mcp_metrics_service = service  # type: ignore[attr-defined]
+
+
+def instrument_conversion(conversion: str) -> Callable[[F], F]:
+    """Decorate a content conversion to record its latency and trace it.
+
+    Args:
+        conversion: The conversion name used as the metric label.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not metrics_enabled():
+                with span(f"conversion.{conversion}"):
+                    return func(*args, **kwargs)
+            start = time.perf_counter()
+            status = "error"
+            try:
+                with span(f"conversion.{conversion}"):
+                    result = func(*args, **kwargs)
+                status = "success"
+                return result
+            finally:
+                CONVERSION_DURATION.observe(
+                    time.perf_counter() - start, conversion=conversion, status=status
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def render_metrics() -> str:
+    """Render all metrics in the Prometheus text format.
+
+    Returns:
+        The exposition text.
+    """
+    return REGISTRY.render()
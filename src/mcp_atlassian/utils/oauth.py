@@ -7,18 +7,23 @@ It handles:
 - Session configuration for API clients
 """
 
+import hashlib
 import json
 import logging
 import os
 import pprint
+import threading
 import time
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Optional
 
-import keyring
 import requests
+from cachetools import TTLCache
+
+from .singleflight import SingleFlight
+from .urls import site_key
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.oauth")
@@ -28,6 +33,11 @@ TOKEN_URL = "https://auth.atlassian.com/oauth/token"  # noqa: S105 - This is a p
 AUTHORIZE_URL = "https://auth.atlassian.com/authorize"
 CLOUD_ID_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
 TOKEN_EXPIRY_MARGIN = 300  # 5 minutes in seconds
+# Delay before retrying a failed background refresh, doubled up to the maximum
+REFRESH_RETRY_DELAY = 30
+MAX_REFRESH_RETRY_DELAY = 300
+# Seconds the sites accessible with a token are cached for
+ACCESSIBLE_RESOURCES_TTL = 3600
 KEYRING_SERVICE_NAME = "mcp-atlassian-oauth"
 
 
@@ -222,9 +232,15 @@ class OAuthConfig:
     def ensure_valid_token(self) -> bool:
         """Ensure the access token is valid, refreshing if necessary.
 
+        Configurations with a refresh token go through the process-wide
+        :class:`OAuthTokenManager` of their client, which refreshes in the
+        background and only blocks when the token has actually expired.
+
         Returns:
             True if the token is valid (or was refreshed successfully), False otherwise.
         """
+        if self.refresh_token:
+            return get_oauth_token_manager(self).ensure_valid_token(self)
         if not self.is_token_expired:
             return True
         return self.refresh_access_token()
@@ -240,11 +256,7 @@ class OAuthConfig:
             return
 
         try:
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            response = requests.get(CLOUD_ID_URL, headers=headers)
-            response.raise_for_status()
-
-            resources = response.json()
+            resources = get_accessible_resources(self.access_token)
             if resources and len(resources) > 0:
                 # Use the first cloud site (most users have only one)
                 # For users with multiple sites, they might need to specify which one to use
@@ -272,6 +284,9 @@ class OAuthConfig:
         the user to go through the authorization flow again.
         """
         try:
+            # keyring loads its backends on import, so defer it until needed
+            import keyring
+
             username = self._get_keyring_username()
 
             # Store token data as JSON string in keyring
@@ -340,6 +355,8 @@ class OAuthConfig:
 
         # Try to load tokens from keyring first
         try:
+            import keyring
+
             token_json = keyring.get_password(KEYRING_SERVICE_NAME, username)
             if token_json:
                 logger.debug(f"Loaded OAuth tokens from keyring for {username}")
@@ -416,6 +433,268 @@ class OAuthConfig:
         return config
 
 
+class OAuthTokenManager:
+    """Keeps the tokens of one OAuth client fresh for the whole process.
+
+    All configurations with the same client ID share a manager and therefore
+    one set of tokens. A background thread refreshes the access token
+    ``TOKEN_EXPIRY_MARGIN`` seconds before it expires, and callers keep using
+    the current token, which is still valid, in the meantime. Only a token
+    that has actually expired is refreshed in the calling thread. Concurrent
+    refreshes are de-duplicated, and refreshed tokens are saved through the
+    keyring/file storage of :class:`OAuthConfig`.
+    """
+
+    def __init__(self, config: OAuthConfig) -> None:
+        """Initialize the manager.
+
+        Args:
+            config: The configuration whose client and tokens to manage.
+        """
+        self._config = replace(config)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def expires_at(self) -> float | None:
+        """When the current access token expires."""
+        return self._config.expires_at
+
+    def _adopt(self, config: OAuthConfig) -> None:
+        """Take over the tokens of config if they are newer than ours."""
+        with self._lock:
+            current = self._config
+            if config.expires_at and config.expires_at > (current.expires_at or 0):
+                self._config = replace(
+                    current,
+                    access_token=config.access_token,
+                    refresh_token=config.refresh_token or current.refresh_token,
+                    expires_at=config.expires_at,
+                )
+            elif not current.refresh_token and config.refresh_token:
+                self._config = replace(current, refresh_token=config.refresh_token)
+
+    def _apply(self, config: OAuthConfig) -> None:
+        """Copy the current tokens into config."""
+        with self._lock:
+            current = self._config
+        config.access_token = current.access_token
+        config.refresh_token = current.refresh_token
+        config.expires_at = current.expires_at
+        if not config.cloud_id:
+            config.cloud_id = current.cloud_id
+
+    def ensure_valid_token(self, config: OAuthConfig) -> bool:
+        """Give config a valid access token.
+
+        Args:
+            config: A configuration of this manager's client.
+
+        Returns:
+            True if config now holds a valid token, False if it had expired
+            and could not be refreshed.
+        """
+        self._adopt(config)
+        current = self._config
+        if current.access_token and current.expires_at:
+            if time.time() < current.expires_at:
+                self._start()
+                if current.is_token_expired:
+                    # Expiring soon: let the background thread refresh it now
+                    self._wakeup.set()
+                self._apply(config)
+                return True
+        refreshed = self.refresh()
+        self._apply(config)
+        return refreshed
+
+    def refresh(self) -> bool:
+        """Refresh the access token unless it was refreshed in the meantime.
+
+        Threads arriving while a refresh is in progress wait for it and use
+        its result.
+
+        Returns:
+            True if the token is valid afterwards, False otherwise.
+        """
+        with self._refresh_lock:
+            if not self._config.is_token_expired:
+                return True
+            fresh = replace(self._config)
+            if not fresh.refresh_access_token():
+                return False
+            with self._lock:
+                self._config = fresh
+        logger.debug(f"Refreshed OAuth access token for client {fresh.client_id}")
+        if fresh.expires_at and fresh.expires_at > time.time():
+            self._start()
+            self._wakeup.set()
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._stopped or (self._thread and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-atlassian-oauth-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        retry_delay = REFRESH_RETRY_DELAY
+        while not self._stopped:
+            expires_at = self._config.expires_at or 0
+            delay = expires_at - TOKEN_EXPIRY_MARGIN - time.time()
+            if delay <= 0:
+                if self.refresh() and not self._config.is_token_expired:
+                    retry_delay = REFRESH_RETRY_DELAY
+                    continue
+                logger.warning(
+                    f"Background refresh of the OAuth access token failed; "
+                    f"retrying in {retry_delay}s"
+                )
+                delay = retry_delay
+                retry_delay = min(retry_delay * 2, MAX_REFRESH_RETRY_DELAY)
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+
+_token_managers: dict[str, OAuthTokenManager] = {}
+_token_managers_lock = threading.Lock()
+
+
+def get_oauth_token_manager(config: OAuthConfig) -> OAuthTokenManager:
+    """Get the token manager shared by all configurations of a client.
+
+    Args:
+        config: An OAuth configuration.
+
+    Returns:
+        The manager of the configuration's client ID.
+    """
+    with _token_managers_lock:
+        manager = _token_managers.get(config.client_id)
+        if manager is None:
+            manager = _token_managers[config.client_id] = OAuthTokenManager(config)
+        return manager
+
+
+def stop_oauth_token_managers() -> None:
+    """Stop all background token refreshes and forget the shared tokens."""
+    with _token_managers_lock:
+        managers = list(_token_managers.values())
+        _token_managers.clear()
+    for manager in managers:
+        manager.stop()
+
+
+_resources_cache: TTLCache[str, list[dict[str, Any]], float] = TTLCache(
+    maxsize=1024, ttl=ACCESSIBLE_RESOURCES_TTL
+)
+_resources_lock = threading.Lock()
+_resources_flight = SingleFlight()
+_resources_session: requests.Session | None = None
+
+
+def _token_subject(access_token: str) -> str:
+    """Key the accessible resources of a token without keeping the token.
+
+    The ``sub`` claim of Atlassian access tokens cannot be verified here, so
+    the hash of the token itself identifies whose sites are cached.
+    """
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+
+def _get_resources_session() -> requests.Session:
+    """Get the session reusing connections to the accessible resources API."""
+    global _resources_session
+    with _resources_lock:
+        if _resources_session is None:
+            _resources_session = requests.Session()
+        return _resources_session
+
+
+def _fetch_accessible_resources(access_token: str) -> list[dict[str, Any]]:
+    response = _get_resources_session().get(
+        CLOUD_ID_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json() or []
+
+
+def get_accessible_resources(access_token: str) -> list[dict[str, Any]]:
+    """Get the Atlassian sites an access token can reach.
+
+    Results are cached per token for ``ACCESSIBLE_RESOURCES_TTL`` seconds and
+    concurrent lookups for the same token share one request, so per-user
+    clients do not repeat the discovery on every tool call.
+
+    Args:
+        access_token: An OAuth access token.
+
+    Returns:
+        The accessible resources, each with the site's ``id`` (its cloud ID),
+        ``url`` and ``name``.
+
+    Raises:
+        requests.RequestException: If the lookup fails; failures are not cached.
+    """
+    key = _token_subject(access_token)
+    with _resources_lock:
+        resources = _resources_cache.get(key)
+    if resources is not None:
+        return resources
+
+    resources, _ = _resources_flight.do(key, _fetch_accessible_resources, access_token)
+    with _resources_lock:
+        _resources_cache[key] = resources
+    return resources
+
+
+def find_cloud_id(access_token: str, url: str | None = None) -> str | None:
+    """Find the cloud ID of a site through the token's accessible resources.
+
+    Args:
+        access_token: An OAuth access token.
+        url: The site URL; without one, the first accessible site is used.
+
+    Returns:
+        The cloud ID, or None if the token cannot reach the site (or any site
+        when no URL is given).
+
+    Raises:
+        requests.RequestException: If the accessible resources lookup fails.
+    """
+    resources = get_accessible_resources(access_token)
+    if url:
+        key = site_key(url)
+        for resource in resources:
+            if resource.get("url") and site_key(resource["url"]) == key:
+                return resource["id"]
+        return None
+    return resources[0]["id"] if resources else None
+
+
+def clear_accessible_resources_cache() -> None:
+    """Forget all cached accessible resources."""
+    with _resources_lock:
+        _resources_cache.clear()
+
+
 def configure_oauth_session(
     session: requests.Session, oauth_config: OAuthConfig
 ) -> bool:
@@ -0,0 +1,328 @@
+"""Profiling of slow tool calls for MCP Atlassian.
+
+When ``PROFILE_SLOW_CALLS_MS`` is set, the blocking fetcher calls a tool
+makes run under cProfile in their worker thread, and a profile is kept if
+the fetcher call took longer than that many milliseconds. The await points
+of the tool on the event loop are not profiled, so profiles do not pick up
+other tool calls served by the loop meanwhile. Profiles are written as
+``pstats`` files to ``PROFILE_DIR`` (default: ``mcp-atlassian-profiles``
+in the system temp directory), which is rotated to the
+``PROFILE_MAX_FILES`` most recent ones (default: 50).
+
+File names encode the call: ``<epoch ms>-<tool>-<arguments hash>-<ms>ms.prof``.
+Only one fetcher call is profiled at a time; fetcher calls overlapping it
+are not profiled themselves. On Python 3.11 and earlier cProfile only
+records the thread it was enabled in. From Python 3.12 it records every
+thread, so work of concurrent calls (and of the event loop) can show up in
+a profile as well.
+"""
+
+import cProfile
+import hashlib
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("mcp-atlassian.utils.profiling")
+
+DEFAULT_MAX_FILES = 50
+PROFILE_SUFFIX = ".prof"
+# The tool call (name, arguments) the current context is serving
+_current_tool_call: ContextVar[tuple[str, dict[str, Any] | None] | None] = ContextVar(
+    "mcp_atlassian_tool_call", default=None
+)
+_PROFILE_NAME = re.compile(
+    r"^(?P<timestamp>\d+)-(?P<tool>[\w.-]+)-(?P<args_hash>[0-9a-f]+)-"
+    r"(?P<duration_ms>\d+)ms\.prof$"
+)
+
+
+def hash_arguments(arguments: dict[str, Any] | None) -> str:
+    """Hash tool arguments so calls can be told apart without storing them.
+
+    Args:
+        arguments: The tool call arguments.
+
+    Returns:
+        A short hex digest of the arguments.
+    """
+    encoded = json.dumps(arguments or {}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+class SlowCallProfiler:
+    """Profiles tool calls and keeps the profiles of slow ones."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        directory: str | os.PathLike[str],
+        max_files: int = DEFAULT_MAX_FILES,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            threshold_ms: Calls slower than this are kept, in milliseconds.
+            directory: Directory the profiles are written to.
+            max_files: Number of most recent profiles kept in the directory.
+        """
+        self.threshold_ms = threshold_ms
+        self.directory = Path(directory)
+        self.max_files = max(1, max_files)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, tool: str, arguments: dict[str, Any] | None) -> Iterator[None]:
+        """Profile a block of code and keep the profile if it was slow.
+
+        Args:
+            tool: The name of the tool being called.
+            arguments: The tool call arguments, only stored as a hash.
+
+        Yields:
+            None.
+        """
+        if not self._lock.acquire(blocking=False):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active in this thread
+            self._lock.release()
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._lock.release()
+            duration_ms = (time.perf_counter() - start) * 1000
+            if duration_ms >= self.threshold_ms:
+                self._save(profiler, tool, hash_arguments(arguments), duration_ms)
+
+    def _save(
+        self,
+        profiler: cProfile.Profile,
+        tool: str,
+        args_hash: str,
+        duration_ms: float,
+    ) -> None:
+        safe_tool = re.sub(r"[^\w.-]", "_", tool)
+        name = (
+            f"{int(time.time() * 1000)}-{safe_tool}-{args_hash}-"
+            f"{int(duration_ms)}ms{PROFILE_SUFFIX}"
+        )
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.directory / name)
+            self._rotate()
+        except OSError as e:
+            logger.warning(f"Could not write profile {name}: {e}")
+            return
+        logger.info(f"Tool {tool} took {duration_ms:.0f} ms, profile saved as {name}")
+
+    def _profile_files(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            (
+                path
+                for path in self.directory.iterdir()
+                if _PROFILE_NAME.match(path.name)
+            ),
+            key=lambda path: path.name,
+        )
+
+    def _rotate(self) -> None:
+        files = self._profile_files()
+        for path in files[: max(len(files) - self.max_files, 0)]:
+            path.unlink(missing_ok=True)
+
+    def list_profiles(self, limit: int = 20) -> list[dict[str, Any]]:
+        """List the most recent slow-call profiles, newest first.
+
+        Args:
+            limit: Maximum number of profiles returned.
+
+        Returns:
+            Profile descriptions with name, tool, arguments hash, duration
+            and timestamp.
+        """
+        profiles = []
+        for path in reversed(self._profile_files()[-limit:] if limit > 0 else []):
+            match = _PROFILE_NAME.match(path.name)
+            if not match:
+                continue
+            profiles.append(
+                {
+                    "name": path.name,
+                    "tool": match["tool"],
+                    "args_hash": match["args_hash"],
+                    "duration_ms": int(match["duration_ms"]),
+                    "timestamp": int(match["timestamp"]) / 1000,
+                }
+            )
+        return profiles
+
+    def get_profile_path(self, name: str) -> Path | None:
+        """Resolve a profile name to its file.
+
+        Args:
+            name: A profile name as returned by list_profiles.
+
+        Returns:
+            The path of the profile, or None if there is no such profile.
+        """
+        if not _PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def summarize(self, name: str, limit: int = 30, sort: str = "cumulative") -> str:
+        """Render the top functions of a profile as text.
+
+        Args:
+            name: A profile name as returned by list_profiles.
+            limit: Number of functions shown.
+            sort: The pstats sort key, e.g. "cumulative" or "tottime".
+
+        Returns:
+            The pstats report.
+
+        Raises:
+            FileNotFoundError: If there is no such profile.
+        """
+        path = self.get_profile_path(name)
+        if path is None:
+            raise FileNotFoundError(name)
+        output = io.StringIO()
+        stats = pstats.Stats(str(path), stream=output)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+
+_profiler: SlowCallProfiler | None = None
+_profiler_loaded = False
+
+
+def create_slow_call_profiler() -> SlowCallProfiler | None:
+    """Create the profiler configured by the environment.
+
+    Returns:
+        The profiler, or None if PROFILE_SLOW_CALLS_MS is unset or invalid.
+    """
+    threshold = os.getenv("PROFILE_SLOW_CALLS_MS", "").strip()
+    if not threshold:
+        return None
+    try:
+        threshold_ms = float(threshold)
+        max_files = int(os.getenv("PROFILE_MAX_FILES", str(DEFAULT_MAX_FILES)))
+    except ValueError:
+        logger.warning(
+            f"Invalid profiling configuration PROFILE_SLOW_CALLS_MS='{threshold}' "
+            f"PROFILE_MAX_FILES='{os.getenv('PROFILE_MAX_FILES')}'. "
+            "Profiling is disabled."
+        )
+        return None
+    directory = os.getenv("PROFILE_DIR") or os.path.join(
+        tempfile.gettempdir(), "mcp-atlassian-profiles"
+    )
+    logger.info(
+        f"Profiling tool calls slower than {threshold_ms:g} ms into {directory}"
+    )
+    return SlowCallProfiler(threshold_ms, directory, max_files)
+
+
+def get_slow_call_profiler() -> SlowCallProfiler | None:
+    """Get the configured profiler, creating it on first use.
+
+    Returns:
+        The profiler, or None if profiling is disabled.
+    """
+    global _profiler, _profiler_loaded
+    if not _profiler_loaded:
+        _profiler = create_slow_call_profiler()
+        _profiler_loaded = True
+    return _profiler
+
+
+def set_slow_call_profiler(profiler: SlowCallProfiler | None) -> None:
+    """Install a profiler, or disable profiling with None.
+
+    Args:
+        profiler: The profiler to use.
+    """
+    global _profiler, _profiler_loaded
+    _profiler = profiler
+    _profiler_loaded = True
+
+
+@contextmanager
+def profile_tool_call(tool: str, arguments: dict[str, Any] | None) -> Iterator[None]:
+    """Profile a tool call with the configured profiler, if any.
+
+    Args:
+        tool: The name of the tool being called.
+        arguments: The tool call arguments.
+
+    Yields:
+        None.
+    """
+    profiler = get_slow_call_profiler()
+    if profiler is None:
+        yield
+        return
+    with profiler.profile(tool, arguments):
+        yield
+
+
+@contextmanager
+def tool_call_scope(tool: str, arguments: dict[str, Any] | None) -> Iterator[None]:
+    """Attribute the fetcher calls made in this context to a tool call.
+
+    Args:
+        tool: The name of the tool being called.
+        arguments: The tool call arguments.
+
+    Yields:
+        None.
+    """
+    token = _current_tool_call.set((tool, arguments))
+    try:
+        yield
+    finally:
+        _current_tool_call.reset(token)
+
+
+@contextmanager
+def profile_fetcher_call() -> Iterator[None]:
+    """Profile a blocking fetcher call of the current tool call, if any.
+
+    Meant to run in the worker thread of the fetcher call, with the context
+    of the tool call copied into it.
+
+    Yields:
+        None.
+    """
+    call = _current_tool_call.get()
+    if call is None:
+        yield
+        return
+    with profile_tool_call(*call):
+        yield
@@ -0,0 +1,485 @@
+"""Client-side rate limiting of Atlassian API requests.
+
+Atlassian Cloud throttles by site. A :class:`RateLimiter` is shared by every
+Jira and Confluence session talking to the same site (see
+:func:`get_rate_limiter`) and combines:
+
+- A token bucket. With ``ATLASSIAN_RATE_LIMIT_RPS`` unset, requests are not
+  limited until the site pushes back; the bucket then starts at half the
+  observed request rate and grows back additively with each success.
+- Adaptation to the site's signals: ``Retry-After`` on 429 (and 503) responses
+  pauses the bucket, ``X-RateLimit-Remaining: 0`` pauses it until
+  ``X-RateLimit-Reset``, and ``X-RateLimit-NearLimit`` slows it down.
+- Retries of throttled requests with jittered exponential backoff, up to
+  ``ATLASSIAN_RATE_LIMIT_MAX_RETRIES`` times.
+- A fairness queue: while requests wait, tokens go round-robin to the
+  tenants (credentials) waiting, so one agent's burst cannot starve others.
+
+Requests that would wait longer than ``ATLASSIAN_RATE_LIMIT_MAX_WAIT``
+seconds fail with :class:`~mcp_atlassian.exceptions.MCPAtlassianRateLimitError`.
+Disable with ``ATLASSIAN_RATE_LIMIT_ENABLED=false``.
+"""
+
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import wraps
+from typing import Any
+
+from requests import Response, Session
+
+from ..exceptions import MCPAtlassianRateLimitError
+from .metrics import record_rate_limit_wait, record_upstream_retry
+from .urls import site_key
+
+logger = logging.getLogger("mcp-atlassian.utils.ratelimit")
+
+# Rate a throttled bucket never drops below, in requests per second
+MIN_RATE = 1.0
+# Window over which the request rate is observed before the first throttle
+OBSERVATION_WINDOW = 5.0
+# Backoff of retries without Retry-After: BASE * 2**attempt, capped
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+# Rate multiplier on X-RateLimit-NearLimit
+NEAR_LIMIT_FACTOR = 0.75
+# Share of the recovery target added back to the rate per successful response
+RECOVERY_STEP = 0.05
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """Rate limiting settings, read from the environment."""
+
+    enabled: bool = True
+    rate: float = 0.0
+    burst: int = 10
+    max_retries: int = 3
+    max_wait: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "RateLimitSettings":
+        """Create the settings from environment variables.
+
+        Returns:
+            The settings; invalid values fall back to the defaults.
+        """
+        enabled = os.getenv("ATLASSIAN_RATE_LIMIT_ENABLED", "true").lower() in (
+            "true",
+            "1",
+            "yes",
+            "y",
+            "on",
+        )
+        try:
+            return cls(
+                enabled=enabled,
+                rate=max(float(os.getenv("ATLASSIAN_RATE_LIMIT_RPS", "0")), 0.0),
+                burst=max(int(os.getenv("ATLASSIAN_RATE_LIMIT_BURST", "10")), 1),
+                max_retries=max(
+                    int(os.getenv("ATLASSIAN_RATE_LIMIT_MAX_RETRIES", "3")), 0
+                ),
+                max_wait=max(
+                    float(os.getenv("ATLASSIAN_RATE_LIMIT_MAX_WAIT", "60")), 0
+                ),
+            )
+        except ValueError:
+            logger.warning("Invalid ATLASSIAN_RATE_LIMIT_* setting, using defaults")
+            return cls(enabled=enabled)
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: The header value, in seconds or an HTTP date.
+        now: The current epoch time, for HTTP dates.
+
+    Returns:
+        The delay in seconds, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(retry_at.timestamp() - (now or time.time()), 0.0)
+
+
+def parse_rate_limit_reset(value: str | None, now: float | None = None) -> float | None:
+    """Parse an X-RateLimit-Reset header.
+
+    Atlassian sends an ISO 8601 timestamp; epoch seconds are accepted too.
+
+    Args:
+        value: The header value.
+        now: The current epoch time.
+
+    Returns:
+        The seconds until the reset, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    now = now or time.time()
+    value = value.strip()
+    try:
+        reset_at = float(value)
+    except ValueError:
+        try:
+            reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset.tzinfo is None:
+            reset = reset.replace(tzinfo=timezone.utc)
+        reset_at = reset.timestamp()
+    return max(reset_at - now, 0.0)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for a retry without Retry-After.
+
+    Args:
+        attempt: The number of the failed attempt, from 0.
+
+    Returns:
+        A delay between half and all of BACKOFF_BASE * 2**attempt, capped
+        at BACKOFF_MAX.
+    """
+    delay = min(BACKOFF_BASE * 2**attempt, BACKOFF_MAX)
+    return delay / 2 + random.uniform(0, delay / 2)  # noqa: S311
+
+
+class RateLimiter:
+    """A fair, adaptive token bucket shared by the sessions of one site."""
+
+    def __init__(
+        self,
+        site: str,
+        rate: float = 0.0,
+        burst: int = 10,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            site: The site the limiter applies to, for logging.
+            rate: The steady request rate ceiling per second, 0 for none.
+            burst: The bucket capacity.
+            max_wait: Longest time a request waits for a token, in seconds.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.site = site
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_wait = max_wait
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._recovery_target = rate
+        self._granted: deque[float] = deque()
+        self._queues: OrderedDict[str, deque[object]] = OrderedDict()
+        self._condition = threading.Condition()
+
+    @property
+    def limited(self) -> bool:
+        """Whether the bucket currently limits the request rate."""
+        return self.rate > 0
+
+    def _refill(self, now: float) -> None:
+        # _updated is in the future while paused: no tokens accrue until then
+        if now <= self._updated:
+            return
+        if self.rate > 0:
+            elapsed = now - self._updated
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        """Seconds until the next token can be granted."""
+        delay = max(self._paused_until - now, 0.0)
+        if self.rate > 0 and self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self.rate)
+        return delay
+
+    def _head(self) -> object | None:
+        for queue in self._queues.values():
+            if queue:
+                return queue[0]
+        return None
+
+    def _observed_rate(self, now: float) -> float:
+        while self._granted and self._granted[0] < now - OBSERVATION_WINDOW:
+            self._granted.popleft()
+        return len(self._granted) / OBSERVATION_WINDOW
+
+    def acquire(self, tenant: str = "") -> float:
+        """Wait for a token, taking turns with the other waiting tenants.
+
+        Args:
+            tenant: Identifies who the request is made for.
+
+        Returns:
+            The time waited, in seconds.
+
+        Raises:
+            MCPAtlassianRateLimitError: If no token is available within
+                max_wait seconds.
+        """
+        ticket = object()
+        with self._condition:
+            start = self._clock()
+            deadline = start + self.max_wait
+            queue = self._queues.setdefault(tenant, deque())
+            queue.append(ticket)
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+                    delay = self._delay(now)
+                    if self._head() is ticket and delay <= 0:
+                        if self.rate > 0:
+                            self._tokens -= 1
+                        self._granted.append(now)
+                        self._observed_rate(now)
+                        queue.popleft()
+                        # Round robin: the tenant goes behind the others waiting
+                        self._queues.move_to_end(tenant)
+                        return now - start
+                    if now + delay > deadline:
+                        msg = (
+                            f"Rate limited by {self.site}: no request slot within "
+                            f"{self.max_wait:g} seconds"
+                        )
+                        raise MCPAtlassianRateLimitError(msg, retry_after=delay)
+                    if self._head() is ticket:
+                        self._condition.wait(timeout=max(delay, 0.001))
+                    else:
+                        # Woken up whenever a token is granted or a waiter leaves
+                        self._condition.wait(timeout=max(deadline - now, 0.001))
+            finally:
+                if ticket in queue:
+                    queue.remove(ticket)
+                if not queue and self._queues.get(tenant) is queue:
+                    del self._queues[tenant]
+                self._condition.notify_all()
+
+    def throttle(self, delay: float) -> None:
+        """Pause the bucket and halve its rate after a 429.
+
+        Args:
+            delay: Seconds until the site accepts requests again.
+        """
+        with self._condition:
+            now = self._clock()
+            self._refill(now)
+            current = self.rate or max(self._observed_rate(now), MIN_RATE * 2)
+            if not self.max_rate:
+                self._recovery_target = max(self._recovery_target, current)
+            self.rate = max(current / 2, MIN_RATE)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + delay)
+            self._updated = self._paused_until
+            self._condition.notify_all()
+        logger.warning(
+            f"Rate limited by {self.site}: pausing {delay:.1f}s, "
+            f"then sending at most {self.rate:.1f} requests/s"
+        )
+
+    def pause(self, delay: float) -> None:
+        """Pause the bucket without changing its rate.
+
+        Args:
+            delay: Seconds to pause for.
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+            self._condition.notify_all()
+
+    def slow_down(self) -> None:
+        """Reduce the rate when the site reports it is near its limit."""
+        with self._condition:
+            now = self._clock()
+            self._refill(now)
+            current = self.rate or max(self._observed_rate(now), MIN_RATE * 2)
+            if not self.max_rate:
+                self._recovery_target = max(self._recovery_target, current)
+            self.rate = max(current * NEAR_LIMIT_FACTOR, MIN_RATE)
+
+    def recover(self) -> None:
+        """Grow the rate back towards its ceiling after a successful request."""
+        if not self.limited or self.rate >= (self.max_rate or float("inf")):
+            return
+        with self._condition:
+            target = self.max_rate or self._recovery_target
+            self.rate = min(self.rate + max(target * RECOVERY_STEP, 0.1), target)
+            if self.rate >= target and not self.max_rate:
+                # Back to the rate that was fine before throttling: stop limiting
+                self.rate = 0.0
+                self._recovery_target = 0.0
+                logger.info(f"Rate limit on {self.site} lifted")
+
+    def update(self, response: Response, attempt: int = 0) -> float | None:
+        """Adapt to the rate limit signals of a response.
+
+        Args:
+            response: The response of the site.
+            attempt: The number of the attempt that got the response, from 0.
+
+        Returns:
+            The delay before retrying if the request was throttled, else None.
+        """
+        headers = response.headers
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if response.status_code == 429 or (
+            response.status_code == 503 and retry_after is not None
+        ):
+            if retry_after is None:
+                delay = backoff_delay(attempt)
+            else:
+                # Spread the retries of requests throttled together
+                delay = retry_after + random.uniform(0, min(retry_after / 10, 1.0))  # noqa: S311
+            self.throttle(delay)
+            return delay
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+            if reset:
+                self.pause(reset)
+        elif headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+            self.slow_down()
+        else:
+            self.recover()
+        return None
+
+
+_settings: RateLimitSettings | None = None
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limit_settings() -> RateLimitSettings:
+    """Get the rate limiting settings, reading the environment on first use.
+
+    Returns:
+        The settings.
+    """
+    global _settings
+    if _settings is None:
+        _settings = RateLimitSettings.from_env()
+    return _settings
+
+
+def set_rate_limit_settings(settings: RateLimitSettings | None) -> None:
+    """Replace the rate limiting settings and drop the existing limiters.
+
+    Args:
+        settings: The settings, or None to re-read the environment.
+    """
+    global _settings
+    _settings = settings
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Get the rate limiter shared by all sessions of a site.
+
+    Args:
+        url: An API base URL of the site.
+
+    Returns:
+        The site's rate limiter.
+    """
+    key = site_key(url)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            settings = get_rate_limit_settings()
+            limiter = _limiters[key] = RateLimiter(
+                key,
+                rate=settings.rate,
+                burst=settings.burst,
+                max_wait=settings.max_wait,
+            )
+        return limiter
+
+
+def _tenant(request: Any) -> str:
+    """Identify who a request is made for by its credentials."""
+    authorization = getattr(request, "headers", {}).get("Authorization") or ""
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+
+
+def _replayable(request: Any) -> bool:
+    return isinstance(getattr(request, "body", None), bytes | str | None)
+
+
+def rate_limit_session(session: Session, service: str, url: str) -> None:
+    """Send the requests of a session through its site's rate limiter.
+
+    Throttled requests are retried with backoff; requests whose body is a
+    stream cannot be replayed and are not retried. Sessions are only
+    wrapped once.
+
+    Args:
+        session: The session used by the Atlassian API client.
+        service: The service name, e.g. "jira" or "confluence".
+        url: The API base URL of the site.
+    """
+    settings = get_rate_limit_settings()
+    if not settings.enabled or getattr(session, "_mcp_rate_limiter", None):
+        return
+
+    limiter = get_rate_limiter(url)
+    send = session.send
+
+    @wraps(send)
+    def rate_limited_send(request: Any, **kwargs: Any) -> Any:
+        tenant = _tenant(request)
+        max_retries = settings.max_retries if _replayable(request) else 0
+        attempt = 0
+        while True:
+            waited = limiter.acquire(tenant)
+            if waited:
+                record_rate_limit_wait(service, waited)
+            response = send(request, **kwargs)
+            delay = limiter.update(response, attempt)
+            if delay is None:
+                return response
+            if attempt >= max_retries:
+                msg = (
+                    f"Rate limited by {limiter.site} "
+                    f"({response.status_code}) after {attempt + 1} attempts"
+                )
+                raise MCPAtlassianRateLimitError(
+                    msg, response=response, retry_after=delay
+                )
+            attempt += 1
+            record_upstream_retry(service, str(response.status_code))
+            logger.info(
+                f"Retrying {getattr(request, 'method', 'GET')} request to "
+                f"{limiter.site} in {delay:.1f}s (attempt {attempt + 1})"
+            )
+            response.close()
+
+    session.send = rate_limited_send  # type: ignore[method-assign]
+    session._mcp_rate_limiter = limiter  # type: ignore[attr-defined]
@@ -0,0 +1,211 @@
+"""Response serialization utilities for MCP Atlassian.
+
+Tool responses are JSON strings sent to the LLM client. The encoder used for
+them can be chosen per server through environment variables:
+
+- ``JIRA_RESPONSE_FORMAT`` / ``CONFLUENCE_RESPONSE_FORMAT``: ``pretty``
+  (indented, the default) or ``compact`` (no whitespace). ``RESPONSE_FORMAT``
+  applies to both servers when the service-specific variable is unset.
+- ``RESPONSE_JSON_ENCODER``: ``json`` (the standard library encoder, the
+  default), ``auto`` (orjson when installed) or ``orjson``. orjson output
+  matches the standard library for ordinary data, but encodes NaN and
+  Infinity as ``null`` and serializes datetimes the standard library rejects.
+
+Custom encoders can be installed with :func:`set_response_encoder`.
+"""
+
+import json
+import logging
+import os
+from typing import Any
+
+from .shaping import shape_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+logger = logging.getLogger("mcp-atlassian.utils.serialization")
+
+RESPONSE_FORMATS = ("pretty", "compact")
+JSON_ENCODERS = ("json", "auto", "orjson")
+
+
+class ResponseEncoder:
+    """Encoder that serializes tool responses with the standard library."""
+
+    name = "json"
+
+    def __init__(self, *, compact: bool = False) -> None:
+        """Initialize the encoder.
+
+        Args:
+            compact: Whether to emit JSON without indentation and spaces.
+        """
+        self.compact = compact
+
+    def encode(self, data: Any) -> str:
+        """Serialize data to a JSON string.
+
+        Args:
+            data: The JSON-serializable response data.
+
+        Returns:
+            The JSON string.
+        """
+        if self.compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(compact={self.compact})"
+
+
+class OrjsonResponseEncoder(ResponseEncoder):
+    """Encoder that serializes tool responses with orjson.
+
+    Falls back to the standard library encoder for data orjson rejects
+    (e.g. integers wider than 64 bits), so output never fails where the
+    standard library would succeed. Unlike the standard library, NaN and
+    Infinity are encoded as ``null``.
+    """
+
+    name = "orjson"
+
+    def __init__(self, *, compact: bool = False) -> None:
+        """Initialize the encoder.
+
+        Args:
+            compact: Whether to emit JSON without indentation and spaces.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError(
+                "orjson is not installed. Install it with 'pip install orjson'."
+            )
+        super().__init__(compact=compact)
+        self._options = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            self._options |= orjson.OPT_INDENT_2
+
+    def encode(self, data: Any) -> str:
+        """Serialize data to a JSON string.
+
+        Args:
+            data: The JSON-serializable response data.
+
+        Returns:
+            The JSON string.
+        """
+        try:
+            return orjson.dumps(data, option=self._options).decode("utf-8")
+        except TypeError:
+            return super().encode(data)
+
+
+_encoders: dict[str, ResponseEncoder] = {}
+
+
+def _get_env_choice(names: list[str], choices: tuple[str, ...]) -> str:
+    """Read the first set environment variable out of names, validated.
+
+    Args:
+        names: Environment variable names, in order of precedence.
+        choices: Accepted values; the first one is the default.
+
+    Returns:
+        The lowercased value, or the default if unset or invalid.
+    """
+    for name in names:
+        value = os.getenv(name, "").strip().lower()
+        if not value:
+            continue
+        if value in choices:
+            return value
+        logger.warning(
+            f"Invalid {name} '{value}', expected one of {', '.join(choices)}. "
+            f"Using '{choices[0]}'."
+        )
+        break
+    return choices[0]
+
+
+def create_response_encoder(service: str) -> ResponseEncoder:
+    """Create the response encoder configured for a server.
+
+    Args:
+        service: The server name, e.g. "jira" or "confluence".
+
+    Returns:
+        The configured response encoder.
+    """
+    prefix = service.upper()
+    compact = (
+        _get_env_choice(
+            [f"{prefix}_RESPONSE_FORMAT", "RESPONSE_FORMAT"], RESPONSE_FORMATS
+        )
+        == "compact"
+    )
+    backend = _get_env_choice(["RESPONSE_JSON_ENCODER"], JSON_ENCODERS)
+
+    if backend == "orjson" and orjson is None:
+        logger.warning(
+            "RESPONSE_JSON_ENCODER is 'orjson' but orjson is not installed. "
+            "Using the standard library encoder."
+        )
+    if backend != "json" and orjson is not None:
+        encoder: ResponseEncoder = OrjsonResponseEncoder(compact=compact)
+    else:
+        encoder = ResponseEncoder(compact=compact)
+
+    logger.debug(f"Using {encoder!r} for {service} responses")
+    return encoder
+
+
+def get_response_encoder(service: str) -> ResponseEncoder:
+    """Get the response encoder for a server, creating it on first use.
+
+    Args:
+        service: The server name, e.g. "jira" or "confluence".
+
+    Returns:
+        The response encoder for the server.
+    """
+    encoder = _encoders.get(service)
+    if encoder is None:
+        encoder = _encoders[service] = create_response_encoder(service)
+    return encoder
+
+
+def set_response_encoder(service: str, encoder: ResponseEncoder | None) -> None:
+    """Install a custom response encoder for a server.
+
+    Args:
+        service: The server name, e.g. "jira" or "confluence".
+        encoder: The encoder to use, or None to go back to the configured one.
+    """
+    if encoder is None:
+        _encoders.pop(service, None)
+    else:
+        _encoders[service] = encoder
+
+
+def encode_response(data: Any, service: str, *, max_bytes: int | None = None) -> str:
+    """Serialize a tool response with the encoder of the given server.
+
+    Args:
+        data: The JSON-serializable response data.
+        service: The server name, e.g. "jira" or "confluence".
+        max_bytes: Optional size budget. Dictionary responses exceeding it
+            are shaped with :func:`~mcp_atlassian.utils.shaping.shape_response`.
+
+    Returns:
+        The JSON string sent to the client.
+    """
+    encoder = get_response_encoder(service)
+    if max_bytes and isinstance(data, dict):
+        data = shape_response(data, max_bytes, encoder.encode)
+    return encoder.encode(data)
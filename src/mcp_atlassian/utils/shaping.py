@@ -0,0 +1,342 @@
+"""Budget-based response shaping for MCP Atlassian tools.
+
+Some tool responses (issues with many comments, pages with long bodies) can
+grow to hundreds of kilobytes. When a caller passes a byte or token budget,
+:func:`shape_response` shrinks the response to fit it before it is encoded:
+
+1. Long strings (descriptions, comment bodies, page content) are cut to a
+   common length, keeping their head and tail plus the section headings of
+   the elided middle.
+2. If that is not enough, trailing items of the largest lists are dropped.
+
+What was elided is reported under the ``truncation`` key of the response.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger("mcp-atlassian.utils.shaping")
+
+# Rough average for English text and JSON with common LLM tokenizers
+BYTES_PER_TOKEN = 4
+# Strings at or below this length are never truncated
+MIN_TEXT_CHARS = 256
+# Share of a truncated string reserved for the headings of the elided middle
+HEADING_SHARE = 4
+# Markdown ("## Title") and Jira wiki ("h2. Title") headings
+HEADING_PATTERN = re.compile(r"^[ \t]*(?:#{1,6}[ \t]+\S|h[1-6]\.[ \t]+\S).*$", re.M)
+TRUNCATION_KEY = "truncation"
+
+Path = tuple[str | int, ...]
+
+
+def _default_encode(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def resolve_budget(
+    max_bytes: int | None = None, max_tokens: int | None = None
+) -> int | None:
+    """Combine a byte and a token budget into a single byte budget.
+
+    Args:
+        max_bytes: Maximum response size in bytes, or 0/None for no limit.
+        max_tokens: Maximum response size in tokens, or 0/None for no limit.
+
+    Returns:
+        The tightest byte budget, or None if neither budget is set.
+    """
+    budgets = [b for b in (max_bytes, (max_tokens or 0) * BYTES_PER_TOKEN) if b]
+    return min(budgets) if budgets else None
+
+
+def _format_path(path: Path) -> str:
+    parts: list[str] = []
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        else:
+            parts.append(f".{part}" if parts else part)
+    return "".join(parts)
+
+
+def _snap_back(text: str, index: int) -> int:
+    """Move a cut position back to the preceding line or word boundary."""
+    floor = index - max(index // 5, 1)
+    for separator in ("\n", " "):
+        position = text.rfind(separator, floor, index)
+        if position > 0:
+            return position
+    return index
+
+
+def _snap_forward(text: str, index: int) -> int:
+    """Move a cut position forward to the following line or word boundary."""
+    ceiling = index + max((len(text) - index) // 5, 1)
+    for separator in ("\n", " "):
+        position = text.find(separator, index, ceiling)
+        if position != -1:
+            return position + 1
+    return index
+
+
+def truncate_text(text: str, max_chars: int) -> tuple[str, dict[str, int]]:
+    """Shorten text to about max_chars, keeping its head, tail and headings.
+
+    The head gets two thirds of the kept characters and the tail the rest.
+    Headings found in the elided middle are kept between them, using at
+    most a quarter of max_chars, so the reader still sees the outline.
+
+    Args:
+        text: The text to shorten.
+        max_chars: The number of characters of the original text to keep.
+
+    Returns:
+        The shortened text and a summary of what was elided.
+    """
+    if len(text) <= max_chars:
+        return text, {}
+
+    heading_allowance = max_chars // HEADING_SHARE
+    middle = text[max_chars * 2 // 3 : len(text) - max_chars // 3]
+    heading_chars = sum(len(m.group(0)) + 1 for m in HEADING_PATTERN.finditer(middle))
+    kept_chars = max_chars - min(heading_chars, heading_allowance)
+
+    head_end = _snap_back(text, kept_chars * 2 // 3)
+    tail_start = _snap_forward(text, len(text) - (kept_chars - head_end))
+    tail_start = max(tail_start, head_end)
+
+    headings: list[str] = []
+    used = 0
+    for match in HEADING_PATTERN.finditer(text, head_end, tail_start):
+        heading = match.group(0).strip()
+        if used + len(heading) + 1 > heading_allowance:
+            break
+        headings.append(heading)
+        used += len(heading) + 1
+
+    elided = tail_start - head_end - used
+    if headings:
+        middle_text = (
+            f"\n\n[... {elided} characters elided, section headings kept ...]\n"
+            + "\n".join(headings)
+            + "\n[...]\n\n"
+        )
+    else:
+        middle_text = f"\n\n[... {elided} characters elided ...]\n\n"
+
+    summary = {
+        "original_chars": len(text),
+        "elided_chars": elided,
+    }
+    if headings:
+        summary["headings_kept"] = len(headings)
+    return text[:head_end].rstrip() + middle_text + text[tail_start:].lstrip(), summary
+
+
+def _collect_strings(data: Any, path: Path, found: list[tuple[Path, int]]) -> None:
+    if isinstance(data, str):
+        if len(data) > MIN_TEXT_CHARS:
+            found.append((path, len(data)))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if key != TRUNCATION_KEY:
+                _collect_strings(value, (*path, key), found)
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            _collect_strings(value, (*path, index), found)
+
+
+def _collect_lists(data: Any, path: Path, found: list[tuple[Path, list]]) -> None:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            _collect_lists(value, (*path, key), found)
+    elif isinstance(data, list):
+        if len(data) > 1:
+            found.append((path, data))
+        for index, value in enumerate(data):
+            _collect_lists(value, (*path, index), found)
+
+
+def _replace(data: Any, path: Path, value: Any) -> Any:
+    """Return a copy of data with the value at path replaced.
+
+    Only the containers along the path are copied; everything else is
+    shared with the original.
+    """
+    if not path:
+        return value
+    head, rest = path[0], path[1:]
+    copied = data.copy()
+    copied[head] = _replace(data[head], rest, value)
+    return copied
+
+
+def _get(data: Any, path: Path) -> Any:
+    for part in path:
+        data = data[part]
+    return data
+
+
+def _find(data: Any, path: Path) -> Any:
+    """Get the value at path, or None if the path no longer exists."""
+    for part in path:
+        if isinstance(part, int):
+            if not isinstance(data, list) or part >= len(data):
+                return None
+        elif not isinstance(data, dict) or part not in data:
+            return None
+        data = data[part]
+    return data
+
+
+def _water_level(lengths: list[int], excess: int) -> int:
+    """Find the largest cap that removes at least excess characters.
+
+    Args:
+        lengths: Lengths of the truncatable strings.
+        excess: Number of characters to remove.
+
+    Returns:
+        The cap, never below MIN_TEXT_CHARS.
+    """
+    remaining = excess
+    ordered = sorted(lengths, reverse=True)
+    for count in range(1, len(ordered) + 1):
+        floor = ordered[count] if count < len(ordered) else MIN_TEXT_CHARS
+        floor = max(floor, MIN_TEXT_CHARS)
+        step = (ordered[count - 1] - floor) * count
+        if step >= remaining:
+            return max(ordered[count - 1] - -(-remaining // count), MIN_TEXT_CHARS)
+        remaining -= step
+        if floor == MIN_TEXT_CHARS:
+            break
+    return MIN_TEXT_CHARS
+
+
+def _truncate_strings(
+    data: dict[str, Any], strings: list[tuple[Path, int]], cap: int
+) -> tuple[dict[str, Any], dict[Path, dict[str, int]]]:
+    fields = {}
+    for path, length in strings:
+        if length <= cap:
+            continue
+        text, summary = truncate_text(_get(data, path), cap)
+        data = _replace(data, path, text)
+        fields[path] = summary
+    return data, fields
+
+
+def _with_report(
+    data: dict[str, Any],
+    max_bytes: int,
+    original_bytes: int,
+    fields: dict[Path, dict[str, int]],
+    omitted: dict[Path, int],
+) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "max_bytes": max_bytes,
+        "original_bytes": original_bytes,
+        "budget_met": True,
+    }
+    if fields:
+        report["fields"] = [
+            {"path": _format_path(path), **summary} for path, summary in fields.items()
+        ]
+    if omitted:
+        report["lists"] = [
+            {"path": _format_path(path), "omitted_items": count}
+            for path, count in omitted.items()
+        ]
+    return {**data, TRUNCATION_KEY: report}
+
+
+def shape_response(
+    data: dict[str, Any],
+    max_bytes: int,
+    encode: Callable[[Any], str] = _default_encode,
+) -> dict[str, Any]:
+    """Shrink a tool response so its encoded form fits in max_bytes.
+
+    The original data is never modified. If it already fits it is returned
+    as is; otherwise a shaped copy is returned with a ``truncation`` entry
+    listing the truncated strings and omitted list items. The budget is best
+    effort: strings are never cut below MIN_TEXT_CHARS and lists keep their
+    first item, so ``budget_met`` is False when the response could not be
+    brought under it.
+
+    Args:
+        data: The response data.
+        max_bytes: The size budget of the encoded response, in bytes.
+        encode: The encoder the response will be sent with.
+
+    Returns:
+        The response data, shaped to the budget.
+    """
+
+    def measure(value: Any) -> int:
+        return len(encode(value).encode("utf-8"))
+
+    original_bytes = measure(data)
+    if original_bytes <= max_bytes:
+        return data
+
+    strings: list[tuple[Path, int]] = []
+    _collect_strings(data, (), strings)
+
+    shaped = data
+    fields: dict[Path, dict[str, int]] = {}
+    omitted: dict[Path, int] = {}
+    result = _with_report(shaped, max_bytes, original_bytes, fields, omitted)
+    size = measure(result)
+
+    if strings:
+        removed = 0
+        for _ in range(8):
+            removed += size - max_bytes
+            cap = _water_level([length for _, length in strings], removed)
+            shaped, fields = _truncate_strings(data, strings, cap)
+            result = _with_report(shaped, max_bytes, original_bytes, fields, omitted)
+            size = measure(result)
+            if size <= max_bytes or cap == MIN_TEXT_CHARS:
+                break
+
+    if size > max_bytes:
+        lists: list[tuple[Path, list]] = []
+        _collect_lists(shaped, (), lists)
+        lists.sort(key=lambda entry: measure(entry[1]), reverse=True)
+        excess = size - max_bytes
+        for path, items in lists:
+            # Skip lists that went with an omitted item of an enclosing list
+            if _find(shaped, path) is not items:
+                continue
+            keep = len(items)
+            while keep > 1 and excess > 0:
+                keep -= 1
+                excess -= measure(items[keep]) + 1
+            if keep < len(items):
+                shaped = _replace(shaped, path, items[:keep])
+                omitted[path] = len(items) - keep
+                # Drop the reports of strings that went with the omitted items
+                fields = {
+                    field: summary
+                    for field, summary in fields.items()
+                    if field[: len(path)] != path
+                    or not isinstance(index := field[len(path)], int)
+                    or index < keep
+                }
+            if excess <= 0:
+                break
+        result = _with_report(shaped, max_bytes, original_bytes, fields, omitted)
+        size = measure(result)
+
+    result[TRUNCATION_KEY]["budget_met"] = size <= max_bytes
+    logger.debug(
+        f"Shaped response from {original_bytes} to {size} bytes "
+        f"(budget {max_bytes}): {len(fields)} strings truncated, "
+        f"{len(omitted)} lists shortened"
+    )
+    return result
@@ -0,0 +1,173 @@
+"""Coalescing of identical concurrent upstream reads (single flight).
+
+When several threads ask for the same issue, page, field list or project
+list at the same moment, :func:`coalesced` lets the first call go upstream
+and makes the others wait for its result instead of sending their own
+request. Calls are keyed by method, arguments and credential scope, so
+results are only shared between callers using the same credentials on the
+same site. Exceptions are shared the same way.
+
+Only calls that overlap are coalesced; nothing is cached once the leading
+call returns. Callers served by another call get a deep copy of its result,
+so models such as JiraIssue or ConfluencePage can be modified by each
+caller without affecting the others.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, TypeVar
+
+from .metrics import record_coalesced_call
+
+logger = logging.getLogger("mcp-atlassian.utils.singleflight")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Call:
+    __slots__ = ("done", "error", "owner", "result")
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, sharing its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> tuple[Any, bool]:
+        """Call func, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identifies calls that can share a result.
+            func: The function to call.
+            *args: Positional arguments of func.
+            **kwargs: Keyword arguments of func.
+
+        Returns:
+            The result and whether it was shared from another caller's call.
+
+        Raises:
+            Exception: Whatever the call raised, in every waiting caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader and call.owner == threading.get_ident():
+            # A re-entrant call from the leader would wait for itself
+            return func(*args, **kwargs), False
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Count the calls currently in flight.
+
+        Returns:
+            The number of keys with a running call.
+        """
+        with self._lock:
+            return len(self._calls)
+
+
+_group = SingleFlight()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn argument values into a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(repr(_freeze(v)) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def credential_scope(config: Any) -> str:
+    """Fingerprint the site and credentials of a client configuration.
+
+    Args:
+        config: A JiraConfig or ConfluenceConfig.
+
+    Returns:
+        A hash identifying who calls which site; credentials are not kept.
+    """
+    oauth = getattr(config, "oauth_config", None)
+    parts = (
+        getattr(config, "url", None),
+        getattr(config, "auth_type", None),
+        getattr(config, "username", None),
+        getattr(config, "api_token", None),
+        getattr(config, "personal_token", None),
+        getattr(oauth, "access_token", None),
+        getattr(oauth, "cloud_id", None),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def coalesced(func: F) -> F:
+    """Decorate a client read method so identical concurrent calls share one.
+
+    The client's ``config`` determines the credential scope of the key.
+    Waiting callers get a deep copy of the result.
+
+    Args:
+        func: The method to decorate.
+
+    Returns:
+        The decorated method.
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            key = (
+                name,
+                credential_scope(getattr(self, "config", None)),
+                _freeze(args),
+                _freeze(kwargs),
+            )
+        except TypeError:
+            return func(self, *args, **kwargs)
+        result, shared = _group.do(key, func, self, *args, **kwargs)
+        if shared:
+            logger.debug(f"Shared the result of an in-flight {name} call")
+            record_coalesced_call(name)
+            return copy.deepcopy(result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
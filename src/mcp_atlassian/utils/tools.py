@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Collection
 
 logger = logging.getLogger(__name__)
 
@@ -41,23 +42,15 @@ def get_enabled_tools() -> list[str] | None:
     return tools if tools else None
 
 
-def should_include_tool(tool_name: str, enabled_tools: list[str] | None) -> bool:
+def should_include_tool(tool_name: str, enabled_tools: Collection[str] | None) -> bool:
     """Check if a tool should be included based on the enabled tools list.
 
     Args:
         tool_name: The name of the tool to check.
-        enabled_tools: List of enabled tool names, or None to include all tools.
+        enabled_tools: Enabled tool names, or None to include all tools. Pass a
+            set when checking many tools.
 
     Returns:
         True if the tool should be included, False otherwise.
     """
-    if enabled_tools is None:
-        logger.debug(
-            f"Including tool '{tool_name}' because enabled_tools filter is None."
-        )
-        return True
-    should_include = tool_name in enabled_tools
-    logger.debug(
-        f"Tool '{tool_name}' included: {should_include} (based on enabled_tools: {enabled_tools})"
-    )
-    return should_include
+    return enabled_tools is None or tool_name in enabled_tools
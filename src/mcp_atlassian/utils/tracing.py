@@ -0,0 +1,311 @@
+"""Optional OpenTelemetry tracing for MCP Atlassian.
+
+Spans cover the path of a tool call: middleware authentication, fetcher
+creation, every upstream HTTP request, model parsing and text conversion.
+
+When ``opentelemetry-api`` is installed, spans are created with the global
+tracer provider. :func:`configure_tracing` installs an OTLP exporter if the
+SDK is installed and ``OTEL_EXPORTER_OTLP_ENDPOINT`` is set; applications
+embedding the server can also configure their own provider. Install the
+dependencies with ``pip install "mcp-atlassian[tracing]"``.
+
+Independently of OpenTelemetry, an :class:`InMemorySpanExporter` can be
+registered with :func:`add_span_exporter` to collect spans in process, e.g.
+in tests. With neither configured, :func:`span` is a cheap no-op.
+"""
+
+import inspect
+import itertools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TypeVar
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - exercised when opentelemetry is missing
+    otel_trace = None
+
+if TYPE_CHECKING:
+    from requests import Session
+
+
+logger = logging.getLogger("mcp-atlassian.utils.tracing")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACER_NAME = "mcp-atlassian"
+
+
+@dataclass
+class RecordedSpan:
+    """A span collected by an :class:`InMemorySpanExporter`."""
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    start_time: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+    end_time: float | None = None
+    status: str = "ok"
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """The span duration in seconds, 0 while the span is open."""
+        return (self.end_time - self.start_time) if self.end_time else 0.0
+
+
+class InMemorySpanExporter:
+    """Collects finished spans in process."""
+
+    def __init__(self) -> None:
+        self._spans: list[RecordedSpan] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: RecordedSpan) -> None:
+        """Store a finished span.
+
+        Args:
+            span: The finished span.
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> list[RecordedSpan]:
+        """Get the spans finished so far, in the order they ended.
+
+        Returns:
+            A copy of the collected spans.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop the collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+_exporters: list[InMemorySpanExporter] = []
+_current_span: ContextVar[RecordedSpan | None] = ContextVar(
+    "mcp_atlassian_current_span", default=None
+)
+_span_ids = itertools.count(1)
+_tracer = otel_trace.get_tracer(TRACER_NAME) if otel_trace is not None else None
+
+
+def add_span_exporter(exporter: InMemorySpanExporter) -> None:
+    """Start sending finished spans to an in-process exporter.
+
+    Args:
+        exporter: The exporter to add.
+    """
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+
+
+def remove_span_exporter(exporter: InMemorySpanExporter) -> None:
+    """Stop sending finished spans to an in-process exporter.
+
+    Args:
+        exporter: The exporter to remove.
+    """
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def tracing_active() -> bool:
+    """Check whether spans are recorded anywhere.
+
+    Returns:
+        True if OpenTelemetry is installed or an in-process exporter is set.
+    """
+    return _tracer is not None or bool(_exporters)
+
+
+class SpanHandle:
+    """The span opened by :func:`span`, for setting attributes after start."""
+
+    __slots__ = ("_otel_span", "_recorded")
+
+    def __init__(
+        self, otel_span: Any = None, recorded: RecordedSpan | None = None
+    ) -> None:
+        self._otel_span = otel_span
+        self._recorded = recorded
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span.
+
+        Args:
+            key: The attribute name.
+            value: The attribute value.
+        """
+        if self._otel_span is not None:
+            self._otel_span.set_attribute(key, value)
+        if self._recorded is not None:
+            self._recorded.attributes[key] = value
+
+
+_NOOP_SPAN = SpanHandle()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[SpanHandle]:
+    """Open a span around a block of code.
+
+    Exceptions raised in the block mark the span as failed and propagate.
+
+    Args:
+        name: The span name, e.g. "jira.get_fetcher".
+        **attributes: Initial span attributes; None values are skipped.
+
+    Yields:
+        A handle to set further attributes.
+    """
+    if _tracer is None and not _exporters:
+        yield _NOOP_SPAN
+        return
+
+    attributes = {k: v for k, v in attributes.items() if v is not None}
+    recorded = token = None
+    if _exporters:
+        parent = _current_span.get()
+        recorded = RecordedSpan(
+            name=name,
+            span_id=next(_span_ids),
+            parent_id=parent.span_id if parent else None,
+            start_time=time.perf_counter(),
+            attributes=attributes.copy(),
+        )
+        token = _current_span.set(recorded)
+
+    try:
+        if _tracer is not None:
+            with _tracer.start_as_current_span(name, attributes=attributes) as otel:
+                yield SpanHandle(otel, recorded)
+        else:
+            yield SpanHandle(None, recorded)
+    except BaseException as e:
+        if recorded is not None:
+            recorded.status = "error"
+            recorded.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if recorded is not None and token is not None:
+            recorded.end_time = time.perf_counter()
+            _current_span.reset(token)
+            for exporter in list(_exporters):
+                exporter.export(recorded)
+
+
+def traced(name: str, **attributes: Any) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run inside a span.
+
+    Args:
+        name: The span name.
+        **attributes: Static span attributes.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not tracing_active():
+                    return await func(*args, **kwargs)
+                with span(name, **attributes):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracing_active():
+                return func(*args, **kwargs)
+            with span(name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def trace_session(session: "Session", service: str) -> None:
+    """Open a span around every request sent through a requests session.
+
+    Args:
+        session: The session used by the Atlassian API client.
+        service: The service name, e.g. "jira" or "confluence".
+    """
+    if getattr(session, "_mcp_tracing_service", None):
+        return
+
+    send = session.send
+
+    @wraps(send)
+    def traced_send(request: Any, **kwargs: Any) -> Any:
+        if not tracing_active():
+            return send(request, **kwargs)
+        method = getattr(request, "method", None) or "GET"
+        url = str(getattr(request, "url", "") or "").split("?", 1)[0]
+        with span(
+            f"{service}.http {method}",
+            **{"http.method": method, "http.url": url, "mcp.service": service},
+        ) as current:
+            response = send(request, **kwargs)
+            current.set_attribute("http.status_code", response.status_code)
+            return response
+
+    session.send = traced_send  # type: ignore[method-assign]
+    session._mcp_tracing_service = service  # type: ignore[attr-defined]
+
+
+def configure_tracing() -> bool:
+    """Export spans over OTLP when OTEL_EXPORTER_OTLP_ENDPOINT is set.
+
+    Does nothing if a tracer provider is already configured or the
+    OpenTelemetry SDK and OTLP exporter are not installed.
+
+    Returns:
+        True if an OTLP exporter was installed.
+    """
+    if otel_trace is None or not os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        return False
+    if not isinstance(otel_trace.get_tracer_provider(), otel_trace.ProxyTracerProvider):
+        logger.debug("A tracer provider is already configured; not adding OTLP")
+        return False
+    try:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning(
+            "OTEL_EXPORTER_OTLP_ENDPOINT is set but the OpenTelemetry SDK or OTLP "
+            "exporter is not installed. Install them with "
+            "'pip install \"mcp-atlassian[tracing]\"'."
+        )
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": os.getenv("OTEL_SERVICE_NAME", TRACER_NAME)}
+        )
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    otel_trace.set_tracer_provider(provider)
+    logger.info("OpenTelemetry tracing enabled with the OTLP exporter")
+    return True
@@ -36,3 +36,25 @@ def is_atlassian_cloud_url(url: str) -> bool:
         or ".jira.com" in hostname
         or ".jira-dev.com" in hostname
     )
+
+
+def site_key(url: str) -> str:
+    """Identify the Atlassian site a URL belongs to.
+
+    Jira and Confluence of one site share a key, including through the
+    OAuth API gateway (``api.atlassian.com/ex/<product>/<cloud id>``).
+
+    Args:
+        url: An API base URL.
+
+    Returns:
+        The site key.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+    parts = [part for part in parsed.path.split("/") if part]
+    if host == "api.atlassian.com" and len(parts) >= 3 and parts[0] == "ex":
+        return f"{host}/{parts[2]}"
+    return host
@@ -310,6 +310,31 @@ This is some **bold** and *italic* text.
     assert "example.com" in storage_format
 
 
+def test_highlight_excerpt(preprocessor_with_confluence):
+    """Test lightweight conversion of CQL search excerpts."""
+    excerpt = (
+        "Release notes for @@@hl@@@version@@@endhl@@@ 2.0 &amp; "
+        "<span>later</span><br/>Second   line"
+    )
+    assert preprocessor_with_confluence.highlight_excerpt(excerpt) == (
+        "Release notes for **version** 2.0 & later\nSecond line"
+    )
+
+
+def test_highlight_excerpt_strong_tags(preprocessor_with_confluence):
+    """Test that inline emphasis tags in excerpts become markdown bold."""
+    excerpt = "Matched <strong class='hl'>term</strong> here"
+    assert (
+        preprocessor_with_confluence.highlight_excerpt(excerpt)
+        == "Matched **term** here"
+    )
+
+
+def test_highlight_excerpt_empty(preprocessor_with_confluence):
+    """Test that empty excerpts stay empty."""
+    assert preprocessor_with_confluence.highlight_excerpt("") == ""
+
+
 def test_process_confluence_profile_macro(preprocessor_with_confluence):
     """Test processing Confluence User Profile Macro in page content."""
     html_content = MOCK_PAGE_RESPONSE["body"]["storage"]["value"]
@@ -53,11 +53,92 @@ class TestCommentsMixin:
 
         # Verify
         comments_mixin.confluence.get_page_comments.assert_called_once_with(
-            content_id=page_id, expand="body.view.value,version", depth="all"
+            content_id=page_id,
+            expand="body.view.value,version,space",
+            depth="all",
+            start=0,
+            limit=100,
         )
+        comments_mixin.confluence.get_page_by_id.assert_not_called()
         assert len(result) == 1
         assert result[0].body == "Processed Markdown"
 
+    def test_get_page_comments_paginates(self, comments_mixin):
+        """Test that every page of comments is fetched and converted."""
+        # Setup
+        comments = [
+            {
+                "id": str(i),
+                "body": {"view": {"value": f"<p>Comment {i}</p>"}},
+                "version": {"number": 1},
+                "space": {"key": "PROJ"},
+            }
+            for i in range(150)
+        ]
+
+        comments_mixin.confluence.get_page_comments.side_effect = self._serve_comments(
+            comments
+        )
+        comments_mixin.preprocessor.process_html_content.side_effect = (
+            lambda content, space_key: (content, f"{space_key}: {content}")
+        )
+
+        # Call the method
+        result = comments_mixin.get_page_comments("12345")
+
+        # Verify
+        starts = [
+            c.kwargs["start"]
+            for c in comments_mixin.confluence.get_page_comments.call_args_list
+        ]
+        assert starts == [0, 100]
+        assert [comment.id for comment in result] == [str(i) for i in range(150)]
+        assert result[42].body == "PROJ: <p>Comment 42</p>"
+
+    def test_get_page_comments_server_caps_page_size(self, comments_mixin):
+        """Test that batches smaller than requested do not end the paging."""
+        # Setup
+        comments = [
+            {
+                "id": str(i),
+                "body": {"view": {"value": f"<p>Comment {i}</p>"}},
+                "version": {"number": 1},
+                "space": {"key": "PROJ"},
+            }
+            for i in range(60)
+        ]
+        # The server returns at most 25 comments, whatever the limit
+        comments_mixin.confluence.get_page_comments.side_effect = self._serve_comments(
+            comments, max_limit=25
+        )
+
+        # Call the method
+        result = comments_mixin.get_page_comments("12345")
+
+        # Verify
+        starts = [
+            c.kwargs["start"]
+            for c in comments_mixin.confluence.get_page_comments.call_args_list
+        ]
+        assert starts == [0, 25, 50]
+        assert [comment.id for comment in result] == [str(i) for i in range(60)]
+
+    @staticmethod
+    def _serve_comments(comments, max_limit=None):
+        """Serve ``comments`` like the API, with a next link while more remain."""
+
+        def get_page_comments(content_id, expand, depth, start, limit):
+            end = start + min(limit, max_limit or limit)
+            links = {
+                "next": f"/rest/api/content/{content_id}/child/comment?start={end}"
+            }
+            return {
+                "results": comments[start:end],
+                "_links": links if end < len(comments) else {},
+            }
+
+        return get_page_comments
+
     def test_get_page_comments_with_html(self, comments_mixin):
         """Test get_page_comments with HTML output instead of markdown."""
         # Setup
@@ -115,8 +196,8 @@ class TestCommentsMixin:
 
     def test_get_page_comments_value_error(self, comments_mixin):
         """Test handling of unexpected data types."""
-        # Cause a value error by returning a string where a dict is expected
-        comments_mixin.confluence.get_page_by_id.return_value = "invalid"
+        # Cause an error by returning a string where a dict is expected
+        comments_mixin.confluence.get_page_comments.return_value = "invalid"
 
         # Act
         result = comments_mixin.get_page_comments("987654321")
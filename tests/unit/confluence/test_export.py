@@ -0,0 +1,208 @@
+"""Unit tests for the ExportMixin class."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.confluence.export import ExportMixin
+
+
+def _page(page_id, title, version, body=True):
+    page = {"id": page_id, "title": title, "version": {"number": version}}
+    if body:
+        page["body"] = {"storage": {"value": f"<p>{title}</p>"}}
+    return page
+
+
+class TestExportMixin:
+    """Tests for the ExportMixin class."""
+
+    @pytest.fixture
+    def export_mixin(self, confluence_client):
+        """Create an ExportMixin instance for testing."""
+        # ExportMixin inherits from ConfluenceClient, so we need to create it properly
+        with patch(
+            "mcp_atlassian.confluence.export.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = ExportMixin()
+            # Copy the necessary attributes from our mocked client
+            mixin.confluence = confluence_client.confluence
+            mixin.config = confluence_client.config
+            mixin.preprocessor = confluence_client.preprocessor
+            return mixin
+
+    @staticmethod
+    def _serve_pages(export_mixin, pages):
+        """Serve ``pages`` from get_all_pages_from_space with real pagination."""
+
+        def get_all_pages_from_space(space, start, limit, expand):
+            return [
+                page
+                if "body" in expand
+                else {k: v for k, v in page.items() if k != "body"}
+                for page in pages[start : start + limit]
+            ]
+
+        export_mixin.confluence.get_all_pages_from_space.side_effect = (
+            get_all_pages_from_space
+        )
+
+    def test_export_space_writes_markdown_and_manifest(self, export_mixin, tmp_path):
+        """Test a full export across several listing batches."""
+        # Arrange
+        pages = [_page(str(i), f"Page {i}", 1) for i in range(5)]
+        self._serve_pages(export_mixin, pages)
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(tmp_path), page_size=2)
+
+        # Assert
+        assert result["success"] is True
+        assert result["exported"] == 5
+        assert result["unchanged"] == 0
+        starts = [
+            c.kwargs["start"]
+            for c in export_mixin.confluence.get_all_pages_from_space.call_args_list
+        ]
+        assert starts == [0, 2, 4, 5]
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["space_key"] == "DEMO"
+        assert sorted(entry["id"] for entry in manifest["pages"]) == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+        ]
+        page_file = tmp_path / "0-Page-0.md"
+        assert page_file.read_text() == "# Page 0\n\nProcessed Markdown"
+        assert not (tmp_path / "manifest.json.tmp").exists()
+
+    def test_export_space_server_caps_page_size(self, export_mixin, tmp_path):
+        """Test that listing batches smaller than requested do not end the export."""
+        # Arrange
+        pages = [_page(str(i), f"Page {i}", 1) for i in range(5)]
+        self._serve_pages(export_mixin, pages)
+        serve = export_mixin.confluence.get_all_pages_from_space.side_effect
+        # The server returns at most 2 pages, whatever the limit
+        export_mixin.confluence.get_all_pages_from_space.side_effect = (
+            lambda space, start, limit, expand: serve(
+                space, start, min(limit, 2), expand
+            )
+        )
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(tmp_path), page_size=50)
+
+        # Assert
+        assert result["exported"] == 5
+
+    def test_export_space_incremental_skips_unchanged(self, export_mixin, tmp_path):
+        """Test that a re-export only converts pages with a new version."""
+        # Arrange
+        self._serve_pages(export_mixin, [_page("1", "One", 1), _page("2", "Two", 1)])
+        export_mixin.export_space("DEMO", str(tmp_path))
+        export_mixin.preprocessor.process_html_content.reset_mock()
+
+        self._serve_pages(export_mixin, [_page("1", "One", 1), _page("2", "Two", 2)])
+        export_mixin.confluence.get_page_by_id.return_value = _page("2", "Two", 2)
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(tmp_path))
+
+        # Assert
+        assert result["exported"] == 1
+        assert result["unchanged"] == 1
+        export_mixin.confluence.get_page_by_id.assert_called_once_with(
+            page_id="2", expand="body.storage,version"
+        )
+        assert export_mixin.preprocessor.process_html_content.call_count == 1
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        versions = {entry["id"]: entry["version"] for entry in manifest["pages"]}
+        assert versions == {"1": 1, "2": 2}
+
+    def test_export_space_removes_deleted_pages(self, export_mixin, tmp_path):
+        """Test that files of pages no longer in the space are removed."""
+        # Arrange
+        self._serve_pages(export_mixin, [_page("1", "One", 1), _page("2", "Two", 1)])
+        export_mixin.export_space("DEMO", str(tmp_path))
+        self._serve_pages(export_mixin, [_page("1", "One", 1)])
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(tmp_path))
+
+        # Assert
+        assert result["removed"] == ["2"]
+        assert not (tmp_path / "2-Two.md").exists()
+        assert (tmp_path / "1-One.md").exists()
+
+    def test_export_space_records_failures(self, export_mixin, tmp_path):
+        """Test that a failing page is reported without aborting the export."""
+        # Arrange
+        self._serve_pages(export_mixin, [_page("1", "One", 1), _page("2", "Two", 1)])
+
+        def process(content, space_key):
+            if "Two" in content:
+                raise ValueError("conversion failed")
+            return "<p>Processed HTML</p>", "Processed Markdown"
+
+        export_mixin.preprocessor.process_html_content.side_effect = process
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(tmp_path))
+
+        # Assert
+        assert result["success"] is False
+        assert result["exported"] == 1
+        assert result["failed"] == [
+            {"id": "2", "title": "Two", "error": "conversion failed"}
+        ]
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert [entry["id"] for entry in manifest["pages"]] == ["1"]
+
+    def test_export_space_ignores_unsafe_manifest_paths(self, export_mixin, tmp_path):
+        """Test that manifest paths outside the export are never touched."""
+        # Arrange
+        target = tmp_path / "export"
+        target.mkdir()
+        outside = tmp_path / "outside.md"
+        outside.write_text("keep")
+        absolute = tmp_path / "absolute.md"
+        absolute.write_text("keep")
+        manifest = {
+            "space_key": "DEMO",
+            "pages": [
+                # Unchanged page pointing outside the export
+                {"id": "1", "title": "One", "version": 1, "path": "../outside.md"},
+                # Renamed page whose old path is absolute
+                {"id": "2", "title": "Two", "version": 1, "path": str(absolute)},
+                # Deleted pages with traversal in the ID and the path
+                {
+                    "id": "../outside",
+                    "title": "Up",
+                    "version": 1,
+                    "path": "../outside.md",
+                },
+                {"id": "3", "title": "Three", "version": 1, "path": "3/../../x.md"},
+            ],
+        }
+        (target / "manifest.json").write_text(json.dumps(manifest))
+        self._serve_pages(export_mixin, [_page("1", "One", 1), _page("2", "Two", 2)])
+        export_mixin.confluence.get_page_by_id.side_effect = lambda page_id, expand: (
+            _page(page_id, {"1": "One", "2": "Two"}[page_id], 1)
+        )
+
+        # Act
+        result = export_mixin.export_space("DEMO", str(target))
+
+        # Assert
+        assert outside.read_text() == "keep"
+        assert absolute.read_text() == "keep"
+        assert result["exported"] == 2
+        assert result["unchanged"] == 0
+        assert sorted(result["removed"]) == ["../outside", "3"]
+        assert (target / "1-One.md").is_file()
+        assert (target / "2-Two.md").is_file()
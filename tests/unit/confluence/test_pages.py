@@ -503,6 +503,202 @@ class TestPagesMixin:
         # Assert - should return empty list on error, not raise exception
         assert len(results) == 0
 
+    def test_get_page_tree_walks_levels(self, pages_mixin):
+        """Test walking a page tree breadth-first across paginated levels."""
+        # Arrange
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+        tree = {
+            "root": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}],
+            "a": [{"id": "a1", "title": "A1"}],
+            "b": [],
+            "a1": [{"id": "a1x", "title": "A1X"}],
+        }
+
+        def child_by_type(page_id, type, start, limit, expand):
+            return tree.get(page_id, [])[start : start + limit]
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes, truncated = pages_mixin.get_page_tree("root", max_depth=2, max_workers=2)
+
+        # Assert
+        assert [(n.page.id, n.parent_id, n.depth) for n in nodes] == [
+            ("a", "root", 1),
+            ("b", "root", 1),
+            ("a1", "a", 2),
+        ]
+        assert truncated is False
+        pages_mixin.confluence.get_page_child_by_type.assert_any_call(
+            page_id="root", type="page", start=0, limit=50, expand="version,space"
+        )
+
+    def test_get_page_tree_follows_pagination(self, pages_mixin):
+        """Test that every page of children is fetched for a parent."""
+        # Arrange
+        children = [{"id": str(i), "title": f"Child {i}"} for i in range(5)]
+
+        def child_by_type(page_id, type, start, limit, expand):
+            if page_id != "root":
+                return []
+            return children[start : start + limit]
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes = list(pages_mixin.iter_page_tree("root", max_depth=1, page_size=2))
+
+        # Assert
+        assert [n.page.id for n in nodes] == ["0", "1", "2", "3", "4"]
+        starts = [
+            c.kwargs["start"]
+            for c in pages_mixin.confluence.get_page_child_by_type.call_args_list
+        ]
+        assert starts == [0, 2, 4, 5]
+
+    def test_get_page_tree_server_caps_page_size(self, pages_mixin):
+        """Test that batches smaller than requested do not end the paging."""
+        # Arrange
+        children = [{"id": str(i), "title": f"Child {i}"} for i in range(5)]
+
+        def child_by_type(page_id, type, start, limit, expand):
+            if page_id != "root":
+                return []
+            # The server returns at most 2 results, whatever the limit
+            return children[start : start + min(limit, 2)]
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes = list(pages_mixin.iter_page_tree("root", max_depth=1, page_size=50))
+
+        # Assert
+        assert [n.page.id for n in nodes] == ["0", "1", "2", "3", "4"]
+
+    def test_get_page_tree_follows_next_links(self, pages_mixin):
+        """Test that paginated responses stop without a next link."""
+        # Arrange
+        children = [{"id": str(i), "title": f"Child {i}"} for i in range(3)]
+
+        def child_by_type(page_id, type, start, limit, expand):
+            if page_id != "root":
+                return {"results": [], "_links": {}}
+            batch = children[start : start + 2]
+            links = {"next": "/rest/api/content/root/child/page?start=2"}
+            return {"results": batch, "_links": links if start == 0 else {}}
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes = list(pages_mixin.iter_page_tree("root", max_depth=1, page_size=50))
+
+        # Assert
+        assert [n.page.id for n in nodes] == ["0", "1", "2"]
+        root_calls = [
+            c
+            for c in pages_mixin.confluence.get_page_child_by_type.call_args_list
+            if c.kwargs["page_id"] == "root"
+        ]
+        assert [c.kwargs["start"] for c in root_calls] == [0, 2]
+
+    def test_get_page_tree_respects_max_nodes(self, pages_mixin):
+        """Test that the walk stops once max_nodes pages were yielded."""
+        # Arrange
+        pages_mixin.confluence.get_page_child_by_type.side_effect = (
+            lambda page_id, type, start, limit, expand: (
+                [{"id": f"{page_id}-{i}", "title": f"Page {i}"} for i in range(3)]
+                if start == 0
+                else []
+            )
+        )
+
+        # Act
+        nodes, truncated = pages_mixin.get_page_tree("root", max_depth=5, max_nodes=4)
+
+        # Assert
+        assert len(nodes) == 4
+        assert truncated is True
+
+    def test_get_page_tree_not_truncated_at_exact_max_nodes(self, pages_mixin):
+        """Test that a tree of exactly max_nodes pages is not reported truncated."""
+        # Arrange
+        tree = {
+            "root": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}],
+            "a": [{"id": "a1", "title": "A1"}],
+        }
+
+        def child_by_type(page_id, type, start, limit, expand):
+            return tree.get(page_id, [])[start : start + limit]
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes, truncated = pages_mixin.get_page_tree("root", max_depth=5, max_nodes=3)
+
+        # Assert
+        assert [n.page.id for n in nodes] == ["a", "b", "a1"]
+        assert truncated is False
+
+    def test_get_page_tree_with_content(self, pages_mixin):
+        """Test that bodies are converted when content is requested."""
+        # Arrange
+        pages_mixin.confluence.get_page_child_by_type.side_effect = (
+            lambda page_id, type, start, limit, expand: (
+                [
+                    {
+                        "id": "child",
+                        "title": "Child",
+                        "space": {"key": "DEMO"},
+                        "body": {"storage": {"value": "<p>Body</p>"}},
+                    }
+                ]
+                if page_id == "root" and start == 0
+                else []
+            )
+        )
+        pages_mixin.preprocessor.process_html_content.return_value = (
+            "<p>Processed HTML</p>",
+            "Processed Markdown",
+        )
+
+        # Act
+        nodes, truncated = pages_mixin.get_page_tree("root", include_content=True)
+
+        # Assert
+        assert len(nodes) == 1
+        assert nodes[0].page.content == "Processed Markdown"
+        pages_mixin.preprocessor.process_html_content.assert_called_once_with(
+            "<p>Body</p>", space_key="DEMO"
+        )
+        pages_mixin.confluence.get_page_child_by_type.assert_any_call(
+            page_id="root",
+            type="page",
+            start=0,
+            limit=50,
+            expand="version,space,body.storage",
+        )
+
+    def test_get_page_tree_skips_failed_subtrees(self, pages_mixin):
+        """Test that an error for one parent does not abort the whole walk."""
+
+        # Arrange
+        def child_by_type(page_id, type, start, limit, expand):
+            if page_id == "a":
+                raise Exception("API Error")
+            tree = {
+                "root": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}],
+                "b": [{"id": "b1", "title": "B1"}],
+            }
+            return tree.get(page_id, [])[start : start + limit]
+
+        pages_mixin.confluence.get_page_child_by_type.side_effect = child_by_type
+
+        # Act
+        nodes, truncated = pages_mixin.get_page_tree("root", max_depth=3)
+
+        # Assert
+        assert {n.page.id for n in nodes} == {"a", "b", "b1"}
+
     def test_get_page_success(self, pages_mixin):
         """Test successful page retrieval."""
         # Setup
@@ -47,10 +47,7 @@ class TestSearchMixin:
         }
 
         # Mock the preprocessor to return processed content
-        search_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
-        )
+        search_mixin.preprocessor.highlight_excerpt.return_value = "Processed content"
 
         # Call the method
         result = search_mixin.search("test query")
@@ -63,6 +60,37 @@ class TestSearchMixin:
         assert result[0].id == "123456789"
         assert result[0].title == "Test Page"
         assert result[0].content == "Processed content"
+        search_mixin.preprocessor.highlight_excerpt.assert_called_once_with(
+            "Test content excerpt"
+        )
+        search_mixin.preprocessor.process_html_content.assert_not_called()
+
+    def test_search_matches_excerpts_by_id(self, search_mixin):
+        """Test that each result page receives the excerpt of its own item."""
+        # Prepare the mock
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {
+                    "content": {"id": str(i), "title": f"Page {i}", "type": "page"},
+                    "excerpt": f"Excerpt {i}",
+                }
+                for i in range(3)
+            ]
+            + [{"content": {"id": "3", "title": "No excerpt", "type": "page"}}]
+        }
+        search_mixin.preprocessor.highlight_excerpt.side_effect = lambda e: e.upper()
+
+        # Act
+        results = search_mixin.search("test query")
+
+        # Assert
+        assert [page.content for page in results] == [
+            "EXCERPT 0",
+            "EXCERPT 1",
+            "EXCERPT 2",
+            "",
+        ]
+        assert search_mixin.preprocessor.highlight_excerpt.call_count == 3
 
     def test_search_with_empty_results(self, search_mixin):
         """Test handling of empty search results."""
@@ -167,10 +195,7 @@ class TestSearchMixin:
         }
 
         # Mock the preprocessor
-        search_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
-        )
+        search_mixin.preprocessor.highlight_excerpt.return_value = "Processed content"
 
         # Test with single space filter
         result = search_mixin.search("test query", spaces_filter="DEV")
@@ -223,10 +248,7 @@ class TestSearchMixin:
         }
 
         # Mock the preprocessor
-        search_mixin.preprocessor.process_html_content.return_value = (
-            "<p>Processed HTML</p>",
-            "Processed content",
-        )
+        search_mixin.preprocessor.highlight_excerpt.return_value = "Processed content"
 
         # Set config filter
         search_mixin.config.spaces_filter = "DEV,TEAM"
@@ -265,3 +287,91 @@ class TestSearchMixin:
         # Assert
         assert isinstance(results, list)
         assert len(results) == 0
+
+    def test_search_page_returns_cloud_next_cursor(self, search_mixin):
+        """Test that a Cloud _links.next link becomes an opaque cursor."""
+        # Prepare the mock
+        search_mixin.confluence.cql.return_value = {
+            "results": [{"content": {"id": "1", "title": "One", "type": "page"}}],
+            "start": 0,
+            "limit": 1,
+            "size": 1,
+            "_links": {
+                "next": "/rest/api/search?next=true&cursor=abc123&limit=1&cql=type%3Dpage"
+            },
+        }
+        search_mixin.confluence.get.return_value = {
+            "results": [{"content": {"id": "2", "title": "Two", "type": "page"}}],
+            "start": 1,
+            "limit": 1,
+            "size": 1,
+            "_links": {},
+        }
+
+        # Act
+        first = search_mixin.search_page("type=page", limit=1)
+        second = search_mixin.search_page("ignored", limit=1, cursor=first.next_cursor)
+
+        # Assert
+        assert [p.id for p in first.results] == ["1"]
+        assert first.next_cursor
+        search_mixin.confluence.get.assert_called_once_with(
+            "rest/api/search",
+            params={"next": "true", "cursor": "abc123", "limit": 1, "cql": "type=page"},
+        )
+        assert [p.id for p in second.results] == ["2"]
+        assert second.next_cursor is None
+
+    def test_iter_search_follows_server_offsets(self, search_mixin):
+        """Test streaming results across pages on Server/DC offset pagination."""
+        # Prepare the mock
+        pages = [
+            {"content": {"id": str(i), "title": f"Page {i}", "type": "page"}}
+            for i in range(5)
+        ]
+
+        def page_at(start, limit):
+            return {
+                "results": pages[start : start + limit],
+                "start": start,
+                "limit": limit,
+                "size": len(pages[start : start + limit]),
+                "totalSize": len(pages),
+            }
+
+        search_mixin.confluence.cql.side_effect = lambda cql, limit: page_at(0, limit)
+        search_mixin.confluence.get.side_effect = lambda path, params: page_at(
+            params["start"], params["limit"]
+        )
+
+        # Act
+        results = list(search_mixin.iter_search("type=page", page_size=2))
+
+        # Assert
+        assert [p.id for p in results] == ["0", "1", "2", "3", "4"]
+        assert search_mixin.confluence.get.call_count == 2
+
+    def test_iter_search_respects_max_results(self, search_mixin):
+        """Test that the iterator stops after max_results pages."""
+        # Prepare the mock
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {"content": {"id": str(i), "title": f"Page {i}", "type": "page"}}
+                for i in range(3)
+            ],
+            "start": 0,
+            "size": 3,
+            "totalSize": 100,
+        }
+
+        # Act
+        results = list(search_mixin.iter_search("type=page", max_results=2))
+
+        # Assert
+        assert len(results) == 2
+        search_mixin.confluence.get.assert_not_called()
+
+    def test_search_page_invalid_cursor(self, search_mixin):
+        """Test that a malformed cursor is rejected."""
+        with pytest.raises(ValueError, match="Invalid search cursor"):
+            search_mixin.search_page("type=page", cursor="not-a-cursor")
@@ -1,7 +1,14 @@
 """Tests for the Confluence utility functions."""
 
+import pytest
+
 from mcp_atlassian.confluence.constants import RESERVED_CQL_WORDS
-from mcp_atlassian.confluence.utils import quote_cql_identifier_if_needed
+from mcp_atlassian.confluence.utils import (
+    decode_search_cursor,
+    encode_search_cursor,
+    next_search_cursor,
+    quote_cql_identifier_if_needed,
+)
 
 
 class TestCQLQuoting:
@@ -55,3 +62,44 @@ class TestCQLQuoting:
         assert quote_cql_identifier_if_needed("DEV") == "DEV"
         assert quote_cql_identifier_if_needed("MYSPACE") == "MYSPACE"
         assert quote_cql_identifier_if_needed("documentation") == "documentation"
+
+
+class TestSearchCursor:
+    """Tests for the CQL search cursor helpers."""
+
+    def test_cursor_round_trip(self):
+        """Test that encoded cursors decode to the same parameters."""
+        params = {"cql": 'space = "~user" AND type = page', "start": 50}
+        assert decode_search_cursor(encode_search_cursor(params)) == params
+
+    def test_decode_rejects_garbage(self):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_search_cursor("%%%")
+        with pytest.raises(ValueError):
+            decode_search_cursor(encode_search_cursor({"start": 10}))
+
+    def test_next_cursor_from_next_link(self):
+        """Test that Cloud next links are carried in the cursor."""
+        response = {
+            "results": [{}],
+            "_links": {"next": "/rest/api/search?cursor=xyz&next=true&limit=10"},
+        }
+        cursor = next_search_cursor("type=page", response)
+        assert decode_search_cursor(cursor) == {
+            "cql": "type=page",
+            "cursor": "xyz",
+            "next": "true",
+            "limit": "10",
+        }
+
+    def test_next_cursor_from_offsets(self):
+        """Test that Server/DC offsets produce the next start index."""
+        response = {"results": [{}] * 10, "start": 20, "size": 10, "totalSize": 45}
+        cursor = next_search_cursor("type=page", response)
+        assert decode_search_cursor(cursor) == {"cql": "type=page", "start": 30}
+
+    def test_no_cursor_on_last_page(self):
+        """Test that the last page has no cursor."""
+        response = {"results": [{}] * 5, "start": 40, "size": 5, "totalSize": 45}
+        assert next_search_cursor("type=page", response) is None
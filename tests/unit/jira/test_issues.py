@@ -3,6 +3,7 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
@@ -1193,6 +1194,104 @@ class TestIssuesMixin:
         # Verify result
         assert fields["assignee"] == {"name": "jdoe"}
 
+    @staticmethod
+    def _search_by_keys(jql: str, **kwargs) -> list[dict]:
+        """Answer a `key in (...)` search with an issue per key."""
+        keys = jql[jql.index("(") + 1 : jql.rindex(")")].split(", ")
+        return [
+            {
+                "id": key.split("-")[1],
+                "key": key,
+                "fields": {
+                    "summary": f"Issue {key}",
+                    "comment": {"comments": [], "total": 2},
+                },
+            }
+            for key in keys
+        ]
+
+    def test_batch_get_issues_chunks_keys(self, issues_mixin: IssuesMixin):
+        """Test batch_get_issues searches in chunks and keeps the key order."""
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            self._search_by_keys
+        )
+        keys = [f"TEST-{i}" for i in range(120, 0, -1)]
+
+        result = issues_mixin.batch_get_issues(
+            keys + ["test-5"], fields="summary", chunk_size=50
+        )
+
+        assert [issue.key for issue in result] == keys
+        assert result[0].summary == "Issue TEST-120"
+        calls = issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_args_list
+        assert sorted(call.kwargs["limit"] for call in calls) == [20, 50, 50]
+        assert all(call.kwargs["fields"] == "summary" for call in calls)
+        issues_mixin.jira.issue_get_comments.assert_not_called()
+
+    def test_batch_get_issues_server(self, issues_mixin: IssuesMixin):
+        """Test batch_get_issues uses the JQL search on Server/Data Center."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = False
+        issues_mixin.jira.jql.side_effect = lambda jql, **kwargs: {
+            "issues": self._search_by_keys(jql)
+        }
+
+        result = issues_mixin.batch_get_issues(["TEST-1", "TEST-2"])
+
+        assert [issue.key for issue in result] == ["TEST-1", "TEST-2"]
+        issues_mixin.jira.jql.assert_called_once_with(
+            "key in (TEST-1, TEST-2)",
+            fields=ANY,
+            start=0,
+            limit=2,
+            expand=None,
+        )
+
+    def test_batch_get_issues_skips_unknown_keys(self, issues_mixin: IssuesMixin):
+        """Test keys rejected by the JQL validation are dropped and retried."""
+        response = MagicMock(status_code=400)
+        response.json.return_value = {
+            "errorMessages": [
+                "An issue with key 'TEST-404' does not exist for field 'key'."
+            ]
+        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = [
+            HTTPError(response=response),
+            self._search_by_keys("key in (TEST-1, TEST-2)"),
+        ]
+
+        result = issues_mixin.batch_get_issues(["TEST-1", "TEST-404", "TEST-2"])
+
+        assert [issue.key for issue in result] == ["TEST-1", "TEST-2"]
+        last_call = issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_args
+        assert last_call.args[0] == "key in (TEST-1, TEST-2)"
+
+    def test_batch_get_issues_hydrates_comments(self, issues_mixin: IssuesMixin):
+        """Test comments are fetched per issue when a comment limit is set."""
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            self._search_by_keys
+        )
+        issues_mixin.jira.issue_get_comments.side_effect = lambda key: {
+            "comments": [
+                {"id": "1", "body": f"First on {key}"},
+                {"id": "2", "body": f"Second on {key}"},
+            ]
+        }
+
+        result = issues_mixin.batch_get_issues(
+            ["TEST-1", "TEST-2"], fields="summary,comment", comment_limit=1
+        )
+
+        assert [len(issue.comments) for issue in result] == [1, 1]
+        assert result[1].comments[0].body == "First on TEST-2"
+        assert issues_mixin.jira.issue_get_comments.call_count == 2
+
+    def test_batch_get_issues_invalid_key(self, issues_mixin: IssuesMixin):
+        """Test malformed keys are rejected before building the JQL."""
+        with pytest.raises(ValueError, match="Invalid issue keys"):
+            issues_mixin.batch_get_issues(["TEST-1", "TEST-2) OR project = X"])
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+
     def test_batch_get_changelogs_not_cloud(self, issues_mixin: IssuesMixin):
         """Test batch_get_changelogs method on non-cloud instance."""
         issues_mixin.config = MagicMock()
@@ -3,17 +3,39 @@
 from unittest.mock import MagicMock
 
 import pytest
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.transitions import TransitionsMixin
+from mcp_atlassian.jira.transitions import TransitionsMixin, clear_transition_cache
 from mcp_atlassian.models.jira import (
     JiraIssue,
+    JiraIssueType,
+    JiraProject,
     JiraStatus,
     JiraStatusCategory,
     JiraTransition,
 )
 
 
+@pytest.fixture(autouse=True)
+def no_cached_transitions():
+    """Start every test without transitions resolved by earlier tests."""
+    clear_transition_cache()
+    yield
+    clear_transition_cache()
+
+
+def _issue(key: str, status: str = "Open", status_id: str = "1") -> JiraIssue:
+    """Create an issue with the fields batch transitions read."""
+    return JiraIssue(
+        id=key.split("-")[1],
+        key=key,
+        status=JiraStatus(id=status_id, name=status),
+        issue_type=JiraIssueType(id="10001", name="Task"),
+        project=JiraProject(id="100", key="TEST"),
+    )
+
+
 class TestTransitionsMixin:
     """Tests for the TransitionsMixin class."""
 
@@ -388,3 +410,213 @@ class TestTransitionsMixin:
             transition_data["update"]["comment"][0]["add"]["body"]
             == "Converted comment"
         )
+
+    def test_batch_transition_issues(self, transitions_mixin: TransitionsMixin):
+        """Test issues of one workflow share a single transition lookup."""
+        transitions_mixin.batch_get_issues = MagicMock(
+            return_value=[_issue("TEST-1"), _issue("TEST-2"), _issue("TEST-3")]
+        )
+
+        result = transitions_mixin.batch_transition_issues(
+            ["TEST-1", "TEST-2", "test-3"], "in progress"
+        )
+
+        assert [outcome["status"] for outcome in result] == ["transitioned"] * 3
+        assert result[0] == {
+            "issue_key": "TEST-1",
+            "status": "transitioned",
+            "from_status": "Open",
+            "to_status": "In Progress",
+            "transition_id": "10",
+        }
+        transitions_mixin.get_transitions_models.assert_called_once()
+        assert transitions_mixin.jira.post.call_count == 3
+        posts = transitions_mixin.jira.post.call_args_list
+        assert sorted(call.args[0].rsplit("/", 2)[1] for call in posts) == [
+            "TEST-1",
+            "TEST-2",
+            "TEST-3",
+        ]
+        assert all(
+            call.kwargs["data"] == {"transition": {"id": "10"}} for call in posts
+        )
+
+    def test_batch_transition_issues_reuses_cache(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test resolved transitions are reused per workflow and status."""
+        transitions_mixin.batch_get_issues = MagicMock(return_value=[_issue("TEST-1")])
+        transitions_mixin.batch_transition_issues(["TEST-1"], "Start Progress")
+        transitions_mixin.batch_transition_issues(["TEST-1"], "Start Progress")
+        assert transitions_mixin.get_transitions_models.call_count == 1
+
+        # Another current status belongs to another cache entry
+        transitions_mixin.batch_get_issues.return_value = [
+            _issue("TEST-1", status="Reopened", status_id="4")
+        ]
+        transitions_mixin.batch_transition_issues(["TEST-1"], "Start Progress")
+        assert transitions_mixin.get_transitions_models.call_count == 2
+
+    def test_batch_transition_issues_outcomes(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test skipped and failed issues are reported without failing the batch."""
+        transitions_mixin.batch_get_issues = MagicMock(
+            return_value=[
+                _issue("TEST-1"),
+                _issue("TEST-2", status="In Progress", status_id="2"),
+                _issue("TEST-3", status="Closed", status_id="6"),
+            ]
+        )
+        # Closed issues have no way back to In Progress
+        transitions = transitions_mixin.get_transitions_models.return_value
+        transitions_mixin.get_transitions_models.side_effect = lambda key: (
+            [] if key == "TEST-3" else transitions
+        )
+
+        result = transitions_mixin.batch_transition_issues(
+            ["TEST-1", "TEST-2", "TEST-3", "TEST-404"], "In Progress"
+        )
+
+        assert [outcome["status"] for outcome in result] == [
+            "transitioned",
+            "skipped",
+            "failed",
+            "failed",
+        ]
+        assert "No transition to 'In Progress'" in result[2]["error"]
+        assert result[3] == {
+            "issue_key": "TEST-404",
+            "status": "failed",
+            "error": "Issue not found",
+        }
+        transitions_mixin.jira.post.assert_called_once()
+
+    def test_batch_transition_issues_fields_and_comment(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test fields and comments are prepared once and sent with each transition."""
+        transitions_mixin.batch_get_issues = MagicMock(
+            return_value=[_issue("TEST-1"), _issue("TEST-2")]
+        )
+        transitions_mixin._get_account_id = MagicMock(return_value="account-1")
+
+        transitions_mixin.batch_transition_issues(
+            ["TEST-1", "TEST-2"],
+            "10",
+            fields={"assignee": "user@example.com"},
+            comment="Closing out the sprint",
+        )
+
+        transitions_mixin._get_account_id.assert_called_once_with("user@example.com")
+        for call in transitions_mixin.jira.post.call_args_list:
+            payload = call.kwargs["data"]
+            assert payload["transition"] == {"id": "10"}
+            assert payload["fields"] == {"assignee": {"accountId": "account-1"}}
+            assert "comment" in payload["update"]
+
+    def test_batch_transition_issues_auth_error(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test an authentication failure stops transitions not yet started."""
+        transitions_mixin.batch_get_issues = MagicMock(
+            return_value=[_issue("TEST-1"), _issue("TEST-2"), _issue("TEST-3")]
+        )
+        transitions_mixin.jira.post.side_effect = HTTPError(
+            response=MagicMock(status_code=401)
+        )
+
+        result = transitions_mixin.batch_transition_issues(
+            ["TEST-1", "TEST-2", "TEST-3"], "In Progress", max_workers=1
+        )
+
+        assert [outcome["status"] for outcome in result] == ["failed"] * 3
+        assert "Authentication failed" in result[0]["error"]
+        assert result[1] == {
+            "issue_key": "TEST-2",
+            "status": "failed",
+            "error": "Not attempted: authentication with the Jira API failed",
+        }
+        transitions_mixin.jira.post.assert_called_once()
+
+    def test_batch_transition_issues_permission_error(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test a permission failure only fails the issue it happened on."""
+        transitions_mixin.batch_get_issues = MagicMock(
+            return_value=[_issue("TEST-1"), _issue("TEST-2")]
+        )
+
+        def post(url, data):
+            if "/TEST-1/" in url:
+                raise HTTPError(response=MagicMock(status_code=403))
+
+        transitions_mixin.jira.post.side_effect = post
+
+        result = transitions_mixin.batch_transition_issues(
+            ["TEST-1", "TEST-2"], "In Progress"
+        )
+
+        assert [outcome["status"] for outcome in result] == [
+            "failed",
+            "transitioned",
+        ]
+        assert "Permission denied" in result[0]["error"]
+
+    def test_batch_transition_issues_refreshes_stale_transition(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test a rejected cached transition is looked up again and retried."""
+        transitions_mixin.batch_get_issues = MagicMock(return_value=[_issue("TEST-1")])
+        transitions_mixin.batch_transition_issues(["TEST-1"], "In Progress")
+
+        # The workflow changed: transition 10 is gone, 21 leads to In Progress
+        transitions_mixin.get_transitions_models.return_value = [
+            JiraTransition(
+                id="21",
+                name="Resume",
+                to_status=JiraStatus(id="2", name="In Progress"),
+            )
+        ]
+        transitions_mixin.jira.post.reset_mock()
+        transitions_mixin.jira.post.side_effect = [
+            HTTPError(response=MagicMock(status_code=400)),
+            None,
+        ]
+
+        result = transitions_mixin.batch_transition_issues(["TEST-1"], "In Progress")
+
+        assert result[0]["status"] == "transitioned"
+        assert result[0]["transition_id"] == "21"
+        assert transitions_mixin.get_transitions_models.call_count == 2
+        posts = transitions_mixin.jira.post.call_args_list
+        assert [call.kwargs["data"]["transition"]["id"] for call in posts] == [
+            "10",
+            "21",
+        ]
+
+    def test_batch_transition_issues_rejected_fresh_transition(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test a rejection is not retried if the lookup finds the same transition."""
+        transitions_mixin.batch_get_issues = MagicMock(return_value=[_issue("TEST-1")])
+        transitions_mixin.jira.post.side_effect = HTTPError(
+            "400 Client Error", response=MagicMock(status_code=400)
+        )
+
+        result = transitions_mixin.batch_transition_issues(["TEST-1"], "In Progress")
+
+        assert result[0] == {
+            "issue_key": "TEST-1",
+            "status": "failed",
+            "error": "400 Client Error",
+        }
+        assert transitions_mixin.get_transitions_models.call_count == 2
+        transitions_mixin.jira.post.assert_called_once()
+
+    def test_batch_transition_issues_requires_target(
+        self, transitions_mixin: TransitionsMixin
+    ):
+        """Test an empty target is rejected."""
+        with pytest.raises(ValueError, match="target"):
+            transitions_mixin.batch_transition_issues(["TEST-1"], " ")
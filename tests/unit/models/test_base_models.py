@@ -5,6 +5,7 @@ Tests for the base models and utility classes.
 from typing import Any
 
 import pytest
+from pydantic import Field
 
 from src.mcp_atlassian.models.base import ApiModel, TimestampMixin
 from src.mcp_atlassian.models.constants import EMPTY_STRING
@@ -41,6 +42,35 @@ class TestApiModel:
         assert result["field1"] == "test"
         assert result["field2"] == 123
 
+    def test_construct_trusted_with_all_fields(self):
+        """Test that construct_trusted assembles an equal instance without validation."""
+
+        class TestModel(ApiModel):
+            field1: str = "test"
+            field2: int = 0
+
+        model = TestModel.construct_trusted(field1="value", field2=5)
+
+        assert model == TestModel(field1="value", field2=5)
+        assert model.model_fields_set == {"field1", "field2"}
+        assert model.to_simplified_dict() == {"field1": "value", "field2": 5}
+        # Values are trusted as-is
+        assert TestModel.construct_trusted(field1="value", field2="5").field2 == "5"
+
+    def test_construct_trusted_fills_defaults(self):
+        """Test that construct_trusted falls back to defaults for omitted fields."""
+
+        class TestModel(ApiModel):
+            field1: str = "test"
+            field2: list[str] = Field(default_factory=list)
+
+        first = TestModel.construct_trusted(field1="value")
+        second = TestModel.construct_trusted(field1="value")
+
+        assert first.field2 == []
+        assert first.field2 is not second.field2
+        assert first.model_fields_set == {"field1"}
+
 
 class TestTimestampMixin:
     """Tests for the TimestampMixin utility class."""
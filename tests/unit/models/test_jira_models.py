@@ -7,6 +7,7 @@ and the simplified dictionary conversion for API responses.
 
 import os
 import re
+from unittest.mock import patch
 
 import pytest
 
@@ -32,6 +33,7 @@ from src.mcp_atlassian.models.jira import (
     JiraUser,
     JiraWorklog,
 )
+from src.mcp_atlassian.models.jira.issue import JiraIssueProjection
 
 # Optional: Import real API client for optional real-data testing
 try:
@@ -200,6 +202,11 @@ class TestJiraStatus:
         assert status.category.name == "In Progress"
         assert status.category.color_name == "yellow"
 
+    def test_from_api_response_normalizes_ids(self):
+        """Test that integer and null IDs are normalized before construction."""
+        assert JiraStatus.from_api_response({"id": 3, "name": "Done"}).id == "3"
+        assert JiraStatus.from_api_response({"id": None}).id == JIRA_DEFAULT_ID
+
     def test_from_api_response_with_empty_data(self):
         """Test creating a JiraStatus from empty data."""
         status = JiraStatus.from_api_response({})
@@ -979,6 +986,48 @@ class TestJiraIssue:
         assert "timetracking" in simplified
         assert simplified["timetracking"]["original_estimate"] == "1d"
 
+    def test_custom_field_attribute_access(self, jira_issue_data):
+        """Test that custom fields can be read as attributes by their ID."""
+        issue = JiraIssue.from_api_response(jira_issue_data)
+
+        assert issue.customfield_10011 == issue.custom_fields["customfield_10011"]
+        assert issue.summary == "Test Issue Summary"
+        with pytest.raises(AttributeError):
+            _ = issue.customfield_99999
+
+    def test_unrequested_fields_are_parsed_lazily(self, jira_issue_data):
+        """Test that fields outside requested_fields are parsed on first access."""
+        with patch.object(
+            JiraUser, "from_api_response", wraps=JiraUser.from_api_response
+        ) as mock_user:
+            issue = JiraIssue.from_api_response(
+                jira_issue_data, requested_fields="summary,status"
+            )
+            simplified = issue.to_simplified_dict()
+            assert mock_user.call_count == 0
+
+            assert issue.assignee is not None
+            assert issue.assignee.display_name == "Test User"
+            assert issue.assignee is issue.assignee
+            assert mock_user.call_count == 1
+
+        assert set(simplified) == {"id", "key", "summary", "status"}
+        assert issue.status is not None
+        assert issue.status.name == "In Progress"
+
+    def test_lazy_issue_matches_eager_issue(self, jira_issue_data):
+        """Test that a lazily parsed issue dumps and compares like an eager one."""
+        eager = JiraIssue.from_api_response(jira_issue_data)
+        lazy = JiraIssue.from_api_response(jira_issue_data, requested_fields=["key"])
+        eager.requested_fields = ["key"]
+
+        assert lazy.model_dump() == eager.model_dump()
+        assert lazy == JiraIssue.from_api_response(
+            jira_issue_data, requested_fields=["key"]
+        )
+        assert lazy.timetracking == eager.timetracking
+        assert lazy.comments == eager.comments
+
 
 class TestJiraSearchResult:
     """Tests for the JiraSearchResult model."""
@@ -996,6 +1045,35 @@ class TestJiraSearchResult:
         assert issue.key == "PROJ-123"
         assert issue.summary == "Test Issue Summary"
 
+    def test_to_simplified_dict(self, jira_search_data):
+        """Test that a search simplifies issues with their requested fields."""
+        api_data = dict(jira_search_data)
+        api_data["issues"] = [
+            {**jira_search_data["issues"][0], "key": f"PROJ-{i}"} for i in range(3)
+        ]
+        search_result = JiraSearchResult.from_api_response(
+            api_data, requested_fields="summary, status"
+        )
+
+        with patch.object(
+            JiraIssueProjection,
+            "for_requested_fields",
+            wraps=JiraIssueProjection.for_requested_fields,
+        ) as mock_projection:
+            simplified = search_result.to_simplified_dict()
+
+        mock_projection.assert_called_once_with(["summary", "status"])
+        assert simplified["total"] == 34
+        assert simplified["start_at"] == 0
+        assert simplified["max_results"] == 5
+        assert [issue["key"] for issue in simplified["issues"]] == [
+            "PROJ-0",
+            "PROJ-1",
+            "PROJ-2",
+        ]
+        assert set(simplified["issues"][0]) == {"id", "key", "summary", "status"}
+        assert simplified["issues"][0] == search_result.issues[0].to_simplified_dict()
+
     def test_from_api_response_with_empty_data(self):
         """Test creating a JiraSearchResult from empty data."""
         result = JiraSearchResult.from_api_response({})
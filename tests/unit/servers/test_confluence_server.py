@@ -15,6 +15,7 @@ from starlette.requests import Request
 from src.mcp_atlassian.confluence import ConfluenceFetcher
 from src.mcp_atlassian.confluence.config import ConfluenceConfig
 from src.mcp_atlassian.models.confluence.page import ConfluencePage
+from src.mcp_atlassian.models.confluence.search import ConfluenceSearchResult
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
@@ -42,8 +43,29 @@ def mock_confluence_fetcher():
 
     # Set up mock responses for each method
     mock_fetcher.search.return_value = [mock_page]
+    mock_fetcher.search_page.return_value = ConfluenceSearchResult(
+        total_size=1, start=0, limit=10, next_cursor="next-page-token"
+    )
+    mock_fetcher.search_page.return_value.results = [mock_page]
     mock_fetcher.get_page_content.return_value = mock_page
     mock_fetcher.get_page_children.return_value = [mock_page]
+
+    mock_tree_node = MagicMock()
+    mock_tree_node.to_simplified_dict.return_value = {
+        "id": "654321",
+        "title": "Test Child Page",
+        "parent_id": "123456",
+        "depth": 1,
+    }
+    mock_fetcher.get_page_tree.return_value = ([mock_tree_node], False)
+    mock_fetcher.export_space.return_value = {
+        "success": True,
+        "space_key": "TEST",
+        "exported": 3,
+        "unchanged": 0,
+        "removed": [],
+        "failed": [],
+    }
     mock_fetcher.create_page.return_value = mock_page
     mock_fetcher.update_page.return_value = mock_page
     mock_fetcher.delete_page.return_value = True
@@ -104,10 +126,12 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         add_label,
         create_page,
         delete_page,
+        export_space,
         get_comments,
         get_labels,
         get_page,
         get_page_children,
+        get_page_tree,
         search,
         update_page,
     )
@@ -132,6 +156,8 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     confluence_sub_mcp.tool()(search)
     confluence_sub_mcp.tool()(get_page)
     confluence_sub_mcp.tool()(get_page_children)
+    confluence_sub_mcp.tool()(get_page_tree)
+    confluence_sub_mcp.tool()(export_space)
     confluence_sub_mcp.tool()(get_comments)
     confluence_sub_mcp.tool()(add_comment)
     confluence_sub_mcp.tool()(get_labels)
@@ -155,10 +181,12 @@ def no_fetcher_test_confluence_mcp(mock_base_confluence_config):
         add_label,
         create_page,
         delete_page,
+        export_space,
         get_comments,
         get_labels,
         get_page,
         get_page_children,
+        get_page_tree,
         search,
         update_page,
     )
@@ -185,6 +213,8 @@ def no_fetcher_test_confluence_mcp(mock_base_confluence_config):
     confluence_sub_mcp.tool()(search)
     confluence_sub_mcp.tool()(get_page)
     confluence_sub_mcp.tool()(get_page_children)
+    confluence_sub_mcp.tool()(get_page_tree)
+    confluence_sub_mcp.tool()(export_space)
     confluence_sub_mcp.tool()(get_comments)
     confluence_sub_mcp.tool()(add_comment)
     confluence_sub_mcp.tool()(get_labels)
@@ -239,8 +269,8 @@ async def test_search(client, mock_confluence_fetcher):
     """Test the search tool with basic query."""
     response = await client.call_tool("confluence_search", {"query": "test search"})
 
-    mock_confluence_fetcher.search.assert_called_once()
-    args, kwargs = mock_confluence_fetcher.search.call_args
+    mock_confluence_fetcher.search_page.assert_called_once()
+    args, kwargs = mock_confluence_fetcher.search_page.call_args
     assert 'siteSearch ~ "test search"' in args[0]
     assert kwargs.get("limit") == 10
     assert kwargs.get("spaces_filter") == ""
@@ -251,6 +281,49 @@ async def test_search(client, mock_confluence_fetcher):
     assert result_data[0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_search_paginate(client, mock_confluence_fetcher):
+    """Test the search tool returns the continuation cursor when paginating."""
+    response = await client.call_tool(
+        "confluence_search", {"query": "test search", "paginate": True}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert isinstance(result_data["results"], list)
+    assert result_data["results"][0]["title"] == "Test Page Mock Title"
+    assert result_data["next_cursor"] == "next-page-token"
+
+
+@pytest.mark.anyio
+async def test_search_with_cursor(client, mock_confluence_fetcher):
+    """Test continuing a search from a cursor skips query conversion."""
+    response = await client.call_tool(
+        "confluence_search",
+        {"query": "test search", "cursor": "next-page-token", "limit": 5},
+    )
+
+    mock_confluence_fetcher.search_page.assert_called_once_with(
+        "test search", limit=5, cursor="next-page-token"
+    )
+    result_data = json.loads(response[0].text)
+    assert result_data["next_cursor"] == "next-page-token"
+
+
+@pytest.mark.anyio
+async def test_search_with_invalid_cursor(client, mock_confluence_fetcher):
+    """Test a malformed cursor is reported as an error."""
+    mock_confluence_fetcher.search_page.side_effect = ValueError(
+        "Invalid search cursor: 'garbage'"
+    )
+
+    response = await client.call_tool(
+        "confluence_search", {"query": "test search", "cursor": "garbage"}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["error"].startswith("Invalid search cursor: 'garbage'.")
+
+
 @pytest.mark.anyio
 async def test_get_page(client, mock_confluence_fetcher):
     """Test the get_page tool with default parameters."""
@@ -285,6 +358,27 @@ async def test_get_page_no_metadata(client, mock_confluence_fetcher):
     assert "This is a test page content" in result_data["content"]["value"]
 
 
+@pytest.mark.anyio
+async def test_get_page_with_byte_budget(client, mock_confluence_fetcher):
+    """Test get_page shortens a long page body to the requested budget."""
+    long_page = MagicMock(spec=ConfluencePage)
+    long_page.content = "# Intro\n" + "Lorem ipsum dolor sit amet. " * 2000
+    mock_confluence_fetcher.get_page_content.return_value = long_page
+
+    response = await client.call_tool(
+        "confluence_get_page",
+        {"page_id": "123456", "include_metadata": False, "max_bytes": 4000},
+    )
+
+    assert len(response[0].text.encode("utf-8")) <= 4000
+    result_data = json.loads(response[0].text)
+    assert result_data["content"]["value"].startswith("# Intro")
+    assert "characters elided" in result_data["content"]["value"]
+    truncation = result_data["truncation"]
+    assert truncation["budget_met"] is True
+    assert truncation["fields"][0]["path"] == "content.value"
+
+
 @pytest.mark.anyio
 async def test_get_page_no_markdown(client, mock_confluence_fetcher):
     """Test get_page with HTML content format."""
@@ -337,6 +431,62 @@ async def test_get_page_children(client, mock_confluence_fetcher):
     assert result_data["results"][0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_get_page_tree(client, mock_confluence_fetcher):
+    """Test the get_page_tree tool."""
+    response = await client.call_tool(
+        "confluence_get_page_tree", {"root_id": "123456", "max_depth": 2}
+    )
+
+    mock_confluence_fetcher.get_page_tree.assert_called_once_with(
+        page_id="123456",
+        max_depth=2,
+        max_nodes=200,
+        include_content=False,
+        convert_to_markdown=True,
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["root_id"] == "123456"
+    assert result_data["count"] == 1
+    assert result_data["truncated"] is False
+    assert result_data["results"][0]["parent_id"] == "123456"
+    assert result_data["results"][0]["depth"] == 1
+
+
+@pytest.mark.anyio
+async def test_export_space(client, mock_confluence_fetcher):
+    """Test the export_space tool."""
+    response = await client.call_tool(
+        "confluence_export_space", {"space_key": "TEST", "target_dir": "/tmp/export"}
+    )
+
+    mock_confluence_fetcher.export_space.assert_called_once_with(
+        space_key="TEST", target_dir="/tmp/export", incremental=True
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is True
+    assert result_data["exported"] == 3
+
+
+@pytest.mark.anyio
+async def test_export_space_error(client, mock_confluence_fetcher):
+    """Test the export_space tool reports failures as an error."""
+    mock_confluence_fetcher.export_space.side_effect = PermissionError(
+        "Permission denied: '/export'"
+    )
+
+    response = await client.call_tool(
+        "confluence_export_space", {"space_key": "TEST", "target_dir": "/export"}
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data == {
+        "error": "Failed to export space: Permission denied: '/export'"
+    }
+
+
 @pytest.mark.anyio
 async def test_get_comments(client, mock_confluence_fetcher):
     """Test retrieving page comments."""
@@ -2,18 +2,22 @@
 
 import json
 import logging
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 from fastmcp import Client, FastMCP
 from fastmcp.client import FastMCPTransport
 from fastmcp.exceptions import ToolError
 from starlette.requests import Request
 
+from mcp_atlassian.utils.metrics import TOOL_CALLS, TOOL_DURATION
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.models.jira import JiraIssue
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
@@ -247,6 +251,8 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         add_worklog,
         batch_create_issues,
         batch_get_changelogs,
+        batch_get_issues,
+        batch_transition_issues,
         create_issue,
         create_issue_link,
         delete_issue,
@@ -272,6 +278,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
 
     jira_sub_mcp = FastMCP(name="TestJiraSubMCP")
     jira_sub_mcp.tool()(get_issue)
+    jira_sub_mcp.tool()(batch_get_issues)
     jira_sub_mcp.tool()(search)
     jira_sub_mcp.tool()(search_fields)
     jira_sub_mcp.tool()(get_project_issues)
@@ -295,6 +302,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.tool()(create_issue_link)
     jira_sub_mcp.tool()(remove_issue_link)
     jira_sub_mcp.tool()(transition_issue)
+    jira_sub_mcp.tool()(batch_transition_issues)
     jira_sub_mcp.tool()(update_sprint)
     test_mcp.mount("jira", jira_sub_mcp)
     return test_mcp
@@ -391,6 +399,130 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_batch_get_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_get_issues tool reports the keys it did not find."""
+    mock_jira_fetcher.batch_get_issues.return_value = [
+        JiraIssue(
+            id="10001",
+            key="TEST-1",
+            summary="First",
+            requested_fields=["summary"],
+        ),
+        JiraIssue(
+            id="10002",
+            key="TEST-2",
+            summary="Second",
+            requested_fields=["summary"],
+        ),
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_get_issues",
+        {"issue_keys": ["TEST-1", "TEST-404", "test-2"], "fields": "summary"},
+    )
+    content = json.loads(response[0].text)
+    assert content["issues"] == [
+        {"id": "10001", "key": "TEST-1", "summary": "First"},
+        {"id": "10002", "key": "TEST-2", "summary": "Second"},
+    ]
+    assert content["not_found"] == ["TEST-404"]
+    mock_jira_fetcher.batch_get_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-404", "test-2"],
+        fields=["summary"],
+        expand=None,
+        comment_limit=0,
+    )
+
+
+@pytest.mark.anyio
+async def test_batch_transition_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_transition_issues tool summarizes the outcomes."""
+    mock_jira_fetcher.batch_transition_issues.return_value = [
+        {"issue_key": "TEST-1", "status": "transitioned", "to_status": "Done"},
+        {"issue_key": "TEST-2", "status": "skipped", "to_status": "Done"},
+        {"issue_key": "TEST-3", "status": "failed", "error": "Issue not found"},
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_transition_issues",
+        {"issue_keys": ["TEST-1", "TEST-2", "TEST-3"], "target": "Done"},
+    )
+    content = json.loads(response[0].text)
+    assert content["summary"] == {"transitioned": 1, "skipped": 1, "failed": 1}
+    assert content["results"][2]["error"] == "Issue not found"
+    mock_jira_fetcher.batch_transition_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-2", "TEST-3"],
+        target="Done",
+        fields=None,
+        comment=None,
+    )
+
+
+@pytest.mark.anyio
+async def test_tool_calls_are_recorded_in_metrics(jira_client, mock_jira_fetcher):
+    """Test tool calls are counted and timed by tool, service and status."""
+    labels = {"tool": "jira_get_issue", "service": "jira"}
+    before_success = TOOL_CALLS.value(**labels, status="success")
+    before_error = TOOL_CALLS.value(**labels, status="error")
+
+    await jira_client.call_tool("jira_get_issue", {"issue_key": "TEST-123"})
+    mock_jira_fetcher.get_issue.side_effect = ValueError("boom")
+    with pytest.raises(ToolError):
+        await jira_client.call_tool("jira_get_issue", {"issue_key": "TEST-123"})
+
+    assert TOOL_CALLS.value(**labels, status="success") == before_success + 1
+    assert TOOL_CALLS.value(**labels, status="error") == before_error + 1
+    assert TOOL_DURATION.count(**labels, status="success") >= 1
+
+
+@pytest.mark.anyio
+async def test_unknown_tool_calls_share_one_metrics_label(jira_client):
+    """Test client-supplied names of unknown tools do not become labels."""
+    labels = {"tool": "unknown", "service": "main", "status": "error"}
+    before = TOOL_CALLS.value(**labels)
+
+    for name in ("jira_no_such_tool", "made_up_1", "made_up_2"):
+        with pytest.raises(ToolError):
+            await jira_client.call_tool(name, {})
+
+    assert TOOL_CALLS.value(**labels) == before + 3
+    assert TOOL_CALLS.value(tool="made_up_1", service="made", status="error") == 0
+
+
+@pytest.mark.anyio
+async def test_blocked_fetcher_call_does_not_stall_other_calls(
+    jira_client, mock_jira_fetcher
+):
+    """Test a fetcher call stuck in a rate limit wait leaves the loop free."""
+    entered = threading.Event()
+    release = threading.Event()
+    default_issue = mock_jira_fetcher.get_issue.side_effect
+
+    def get_issue(issue_key, **kwargs):
+        if issue_key == "SLOW-1":
+            entered.set()
+            release.wait(timeout=10)
+        return default_issue(issue_key=issue_key, **kwargs)
+
+    mock_jira_fetcher.get_issue.side_effect = get_issue
+    finished: list[str] = []
+
+    async def call(issue_key):
+        await jira_client.call_tool("jira_get_issue", {"issue_key": issue_key})
+        finished.append(issue_key)
+
+    try:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call, "SLOW-1")
+            await anyio.to_thread.run_sync(entered.wait, 10)
+            with anyio.fail_after(5):
+                await call("TEST-123")
+            assert finished == ["TEST-123"]
+            release.set()
+    finally:
+        release.set()
+    assert finished == ["TEST-123", "SLOW-1"]
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
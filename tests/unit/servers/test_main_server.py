@@ -1,11 +1,39 @@
 """Tests for the main MCP server implementation."""
 
-from unittest.mock import patch
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
+from fastmcp import Client
+from fastmcp.client import FastMCPTransport
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
 
-from mcp_atlassian.servers.main import main_mcp
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.main import (
+    AtlassianMCP,
+    UserTokenMiddleware,
+    get_slow_call_profile,
+    list_slow_call_profiles,
+    main_mcp,
+    mount_service_servers,
+)
+from mcp_atlassian.utils.circuitbreaker import (
+    get_circuit_breaker,
+    set_circuit_breaker_settings,
+)
+from mcp_atlassian.utils.profiling import SlowCallProfiler
+
+
+@pytest.fixture
+def no_circuit_breakers():
+    """Start without circuit breakers from previously created clients."""
+    set_circuit_breaker_settings(None)
+    yield
+    set_circuit_breaker_settings(None)
 
 
 @pytest.mark.anyio
@@ -55,7 +83,7 @@ async def test_run_server_invalid_transport():
 
 
 @pytest.mark.anyio
-async def test_health_check_endpoint():
+async def test_health_check_endpoint(no_circuit_breakers):
     """Test the health check endpoint returns 200 and correct JSON response."""
     app = main_mcp.sse_app()
     transport = httpx.ASGITransport(app=app)
@@ -63,26 +91,196 @@ async def test_health_check_endpoint():
         response = await client.get("/healthz")
 
         assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+        assert response.json() == {"status": "ok", "circuit_breakers": {}}
 
 
 @pytest.mark.anyio
-async def test_sse_app_health_check_endpoint():
+async def test_sse_app_health_check_endpoint(no_circuit_breakers):
     """Test the /healthz endpoint on the SSE app returns 200 and correct JSON response."""
     app = main_mcp.sse_app()
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.get("/healthz")
         assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+        assert response.json() == {"status": "ok", "circuit_breakers": {}}
 
 
 @pytest.mark.anyio
-async def test_streamable_http_app_health_check_endpoint():
+async def test_streamable_http_app_health_check_endpoint(no_circuit_breakers):
     """Test the /healthz endpoint on the Streamable HTTP app returns 200 and correct JSON response."""
     app = main_mcp.streamable_http_app()
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.get("/healthz")
         assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+        assert response.json() == {"status": "ok", "circuit_breakers": {}}
+
+
+@pytest.mark.anyio
+async def test_health_check_reports_open_circuit(no_circuit_breakers):
+    """Test /healthz reports degraded upstream sites."""
+    breaker = get_circuit_breaker("https://test.atlassian.net")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure("ConnectTimeout")
+
+    app = main_mcp.sse_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/healthz")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "degraded"
+    site = body["circuit_breakers"]["test.atlassian.net"]
+    assert site["state"] == "open"
+    assert site["last_error"] == "ConnectTimeout"
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint():
+    """Test the /metrics endpoint serves the Prometheus text format."""
+    app = main_mcp.streamable_http_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE mcp_atlassian_tool_calls_total counter" in response.text
+        assert "# TYPE mcp_atlassian_tool_duration_seconds histogram" in response.text
+
+
+@pytest.mark.anyio
+async def test_slow_call_profile_endpoints(tmp_path):
+    """Test slow-call profiles can be listed and inspected over HTTP."""
+    profiler = SlowCallProfiler(threshold_ms=0, directory=tmp_path)
+    with profiler.profile("jira_get_issue", {"issue_key": "PROJ-1"}):
+        pass
+    app = Starlette(
+        routes=[
+            Route("/debug/profiles", list_slow_call_profiles),
+            Route("/debug/profiles/{name}", get_slow_call_profile),
+        ]
+    )
+    transport = httpx.ASGITransport(app=app)
+    with patch(
+        "mcp_atlassian.servers.main.get_slow_call_profiler", return_value=profiler
+    ):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            listing = await client.get("/debug/profiles")
+            assert listing.status_code == 200
+            (profile,) = listing.json()["profiles"]
+            assert profile["tool"] == "jira_get_issue"
+
+            summary = await client.get(f"/debug/profiles/{profile['name']}")
+            assert summary.status_code == 200
+            assert "function calls" in summary.text
+
+            raw = await client.get(f"/debug/profiles/{profile['name']}?raw=true")
+            assert raw.content == (tmp_path / profile["name"]).read_bytes()
+
+            missing = await client.get("/debug/profiles/1-x-abc-1ms.prof")
+            assert missing.status_code == 404
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "services, prefixes",
+    [
+        ({"jira": True, "confluence": False}, {"jira_"}),
+        ({"jira": False, "confluence": True}, {"confluence_"}),
+        ({"jira": True, "confluence": True}, {"jira_", "confluence_"}),
+        ({"jira": False, "confluence": False}, set()),
+    ],
+)
+async def test_mount_service_servers(services, prefixes):
+    """Only the tools of configured services are mounted."""
+    mcp = AtlassianMCP(name="Test")
+    mount_service_servers(mcp, services)
+
+    tools = await mcp.get_tools()
+    assert {name.split("_", 1)[0] + "_" for name in tools} == prefixes
+
+
+@pytest.mark.anyio
+async def test_list_tools_is_cached_per_filter():
+    """The filtered tool list is built once and rebuilt when tools change."""
+    app_context = MainAppContext(
+        full_jira_config=MagicMock(),
+        read_only=True,
+        enabled_tools=frozenset(
+            {"jira_read", "jira_write", "jira_new", "confluence_read"}
+        ),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield {"app_lifespan_context": app_context}
+
+    mcp = AtlassianMCP(name="Test", lifespan=lifespan)
+    mcp.add_tool(lambda: "", name="jira_read", tags={"jira", "read"})
+    mcp.add_tool(lambda: "", name="jira_write", tags={"jira", "write"})
+    mcp.add_tool(lambda: "", name="jira_other", tags={"jira", "read"})
+    mcp.add_tool(lambda: "", name="confluence_read", tags={"confluence", "read"})
+
+    with patch.object(mcp, "get_tools", wraps=mcp.get_tools) as get_tools:
+        async with Client(transport=FastMCPTransport(mcp)) as client:
+            first = await client.list_tools()
+            second = await client.list_tools()
+            assert [tool.name for tool in first] == ["jira_read"]
+            assert second == first
+            assert get_tools.call_count == 1
+
+            mcp.add_tool(lambda: "", name="jira_new", tags={"jira", "read"})
+            assert {tool.name for tool in await client.list_tools()} == {
+                "jira_read",
+                "jira_new",
+            }
+            assert get_tools.call_count == 2
+
+
+def _auth_state_app() -> UserTokenMiddleware:
+    async def endpoint(request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "auth_type": getattr(request.state, "user_atlassian_auth_type", None),
+                "token": getattr(request.state, "user_atlassian_token", None),
+            }
+        )
+
+    app = Starlette(
+        routes=[
+            Route("/mcp", endpoint, methods=["GET", "POST"]),
+            Route("/mcp/", endpoint, methods=["POST"]),
+            Route("/other", endpoint, methods=["POST"]),
+        ]
+    )
+    server = MagicMock()
+    server.settings.streamable_http_path = "/mcp/"
+    return UserTokenMiddleware(app, mcp_server_ref=server)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "method, path, header, status, expected",
+    [
+        ("POST", "/mcp", "Bearer abc", 200, {"auth_type": "oauth", "token": "abc"}),
+        ("POST", "/mcp/", "Token pat1", 200, {"auth_type": "pat", "token": "pat1"}),
+        ("POST", "/mcp", None, 200, {"auth_type": None, "token": None}),
+        ("POST", "/mcp", "Bearer ", 401, None),
+        ("POST", "/mcp", "Basic dXNlcg==", 401, None),
+        ("GET", "/mcp", "Basic dXNlcg==", 200, {"auth_type": None, "token": None}),
+        ("POST", "/other", "Bearer abc", 200, {"auth_type": None, "token": None}),
+    ],
+)
+async def test_user_token_middleware(method, path, header, status, expected):
+    """Credentials are only read from POST requests to the MCP endpoint."""
+    transport = httpx.ASGITransport(app=_auth_state_app())
+    headers = {"Authorization": header} if header else {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.request(method, path, headers=headers)
+
+    assert response.status_code == status
+    if expected is not None:
+        assert response.json() == expected
@@ -0,0 +1,149 @@
+"""Tests for the per-site circuit breakers."""
+
+import io
+
+import pytest
+from requests import PreparedRequest, Response, Session
+from requests.exceptions import ConnectTimeout
+
+from mcp_atlassian.exceptions import MCPAtlassianCircuitOpenError
+from mcp_atlassian.utils.circuitbreaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerSettings,
+    circuit_breaker_states,
+    get_circuit_breaker,
+    protect_session,
+    set_circuit_breaker_settings,
+)
+
+
+class FakeClock:
+    """A clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def circuit_breaker_settings():
+    """Use a low threshold and fresh breakers in every test."""
+    set_circuit_breaker_settings(CircuitBreakerSettings(failure_threshold=2))
+    yield
+    set_circuit_breaker_settings(None)
+
+
+def _response(status: int) -> Response:
+    response = Response()
+    response.status_code = status
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def _request() -> PreparedRequest:
+    request = PreparedRequest()
+    request.prepare(method="GET", url="https://test.atlassian.net/rest/api/2/myself")
+    return request
+
+
+def _session(outcomes: list) -> tuple[Session, list]:
+    session = Session()
+    sent: list = []
+
+    def send(request, **kwargs):
+        sent.append(request)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    session.send = send
+    protect_session(session, "https://test.atlassian.net")
+    return session, sent
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """Test the circuit opens at the threshold and fails fast."""
+    breaker = CircuitBreaker("site", failure_threshold=3)
+    breaker.record_failure("HTTP 503")
+    breaker.record_success()
+    breaker.record_failure("HTTP 503")
+    breaker.record_failure("HTTP 503")
+    assert breaker.state == CLOSED
+
+    breaker.record_failure("HTTP 503")
+    assert breaker.state == OPEN
+    with pytest.raises(MCPAtlassianCircuitOpenError, match="site is unavailable"):
+        breaker.before_call()
+
+
+def test_breaker_probes_when_half_open():
+    """Test one probe is let through after the reset timeout."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("site", failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure("ConnectTimeout")
+
+    clock.now = 10
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(MCPAtlassianCircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure("ConnectTimeout")
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["retry_in"] == 10
+
+    clock.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_released_probe_lets_another_through():
+    """Test a probe ending without an outcome frees the half-open slot."""
+    breaker = CircuitBreaker("site", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure("ConnectTimeout")
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+
+
+def test_protected_session_fails_fast_when_open():
+    """Test connection errors and 5xx responses open the circuit."""
+    session, sent = _session([ConnectTimeout("timed out"), _response(502)])
+
+    with pytest.raises(ConnectTimeout):
+        session.send(_request())
+    assert session.send(_request()).status_code == 502
+
+    with pytest.raises(MCPAtlassianCircuitOpenError) as excinfo:
+        session.send(_request())
+    assert len(sent) == 2
+    assert excinfo.value.retry_after == pytest.approx(30, abs=1)
+    assert circuit_breaker_states()["test.atlassian.net"]["state"] == OPEN
+
+
+def test_client_errors_do_not_open_the_circuit():
+    """Test 4xx responses count as the site being up."""
+    session, _ = _session([_response(404), _response(500), _response(404)])
+    for _ in range(3):
+        session.send(_request())
+
+    assert get_circuit_breaker("https://test.atlassian.net").state == CLOSED
+
+
+def test_circuit_breaker_can_be_disabled():
+    """Test sessions are left alone when circuit breakers are disabled."""
+    set_circuit_breaker_settings(CircuitBreakerSettings(enabled=False))
+    session, sent = _session([_response(503) for _ in range(3)])
+    for _ in range(3):
+        session.send(_request())
+
+    assert len(sent) == 3
+    assert circuit_breaker_states() == {}
@@ -0,0 +1,146 @@
+"""Tests for the metrics utilities."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from mcp_atlassian.utils import metrics
+from mcp_atlassian.utils.metrics import (
+    CACHE_LOOKUPS,
+    CONVERSION_DURATION,
+    UPSTREAM_DURATION,
+    UPSTREAM_REQUESTS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    instrument_conversion,
+    instrument_session,
+    record_cache_lookup,
+    record_tool_call,
+    set_metrics_enabled,
+)
+
+
+@pytest.fixture(autouse=True)
+def enabled_metrics():
+    """Enable metrics and start every test from empty samples."""
+    set_metrics_enabled(enabled=True)
+    metrics.REGISTRY.reset()
+    yield
+    metrics.REGISTRY.reset()
+    set_metrics_enabled(enabled=None)
+
+
+def test_counter_render():
+    """Test counters render one sample per label set."""
+    counter = Counter("test_total", "Test counter.", ("status",))
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    counter.inc(status='bad "one"')
+
+    assert counter.value(status="ok") == 3
+    assert counter.render() == [
+        "# HELP test_total Test counter.",
+        "# TYPE test_total counter",
+        'test_total{status="bad \\"one\\""} 1',
+        'test_total{status="ok"} 3',
+    ]
+
+
+def test_histogram_render():
+    """Test histograms render cumulative buckets, sum and count."""
+    histogram = Histogram("test_seconds", "Test histogram.", ("op",), (0.1, 1.0))
+    histogram.observe(0.05, op="read")
+    histogram.observe(0.5, op="read")
+    histogram.observe(5, op="read")
+
+    assert histogram.count(op="read") == 3
+    assert histogram.render()[2:] == [
+        'test_seconds_bucket{op="read",le="0.1"} 1',
+        'test_seconds_bucket{op="read",le="1.0"} 2',
+        'test_seconds_bucket{op="read",le="+Inf"} 3',
+        'test_seconds_sum{op="read"} 5.55',
+        'test_seconds_count{op="read"} 3',
+    ]
+
+
+def test_registry_rejects_duplicates():
+    """Test a metric name can only be registered once."""
+    registry = MetricsRegistry()
+    registry.register(Counter("dup_total", "Duplicate."))
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("dup_total", "Duplicate."))
+
+
+def test_record_tool_call_derives_service():
+    """Test the service label is taken from the tool name prefix."""
+    record_tool_call("confluence_get_page", "success", 0.2)
+
+    assert (
+        metrics.TOOL_CALLS.value(
+            tool="confluence_get_page", service="confluence", status="success"
+        )
+        == 1
+    )
+
+
+def test_disabled_metrics_are_not_recorded():
+    """Test nothing is recorded when metrics are disabled."""
+    set_metrics_enabled(enabled=False)
+    record_tool_call("jira_get_issue", "success", 0.1)
+    record_cache_lookup("jira_fields", hit=True)
+
+    assert "jira_get_issue" not in metrics.REGISTRY.render()
+
+
+def test_record_cache_lookup():
+    """Test cache hits and misses are counted separately."""
+    record_cache_lookup("jira_fields", hit=True)
+    record_cache_lookup("jira_fields", hit=True)
+    record_cache_lookup("jira_fields", hit=False)
+
+    assert CACHE_LOOKUPS.value(cache="jira_fields", result="hit") == 2
+    assert CACHE_LOOKUPS.value(cache="jira_fields", result="miss") == 1
+
+
+def test_instrument_session_records_responses_and_errors():
+    """Test upstream requests are counted by status, including failures."""
+    session = requests.Session()
+    response = MagicMock(status_code=429)
+    session.send = MagicMock(
+        side_effect=[response, requests.ConnectionError("refused")]
+    )
+    instrument_session(session, "jira")
+    instrument_session(session, "jira")  # instrumenting twice is a no-op
+    request = MagicMock(method="GET")
+
+    assert session.send(request) is response
+    with pytest.raises(requests.ConnectionError):
+        session.send(request)
+
+    assert UPSTREAM_REQUESTS.value(service="jira", method="GET", status="429") == 1
+    assert (
+        UPSTREAM_REQUESTS.value(service="jira", method="GET", status="ConnectionError")
+        == 1
+    )
+    assert UPSTREAM_DURATION.count(service="jira", method="GET", status="429") == 1
+
+
+def test_instrument_conversion():
+    """Test conversions are timed by name and outcome."""
+
+    @instrument_conversion("test_conversion")
+    def convert(text):
+        if not text:
+            raise ValueError("empty")
+        return text.upper()
+
+    assert convert("a") == "A"
+    with pytest.raises(ValueError):
+        convert("")
+
+    assert (
+        CONVERSION_DURATION.count(conversion="test_conversion", status="success") == 1
+    )
+    assert CONVERSION_DURATION.count(conversion="test_conversion", status="error") == 1
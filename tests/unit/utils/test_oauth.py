@@ -1,20 +1,37 @@
 """Tests for the OAuth utilities."""
 
 import json
+import threading
 import time
 import urllib.parse
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
 
 from mcp_atlassian.utils.oauth import (
     KEYRING_SERVICE_NAME,
     TOKEN_EXPIRY_MARGIN,
     OAuthConfig,
+    clear_accessible_resources_cache,
     configure_oauth_session,
+    find_cloud_id,
+    get_accessible_resources,
+    get_oauth_token_manager,
+    stop_oauth_token_managers,
 )
 
 
+@pytest.fixture(autouse=True)
+def no_token_managers():
+    """Start every test without tokens or sites shared by earlier tests."""
+    stop_oauth_token_managers()
+    clear_accessible_resources_cache()
+    yield
+    stop_oauth_token_managers()
+    clear_accessible_resources_cache()
+
+
 class TestOAuthConfig:
     """Tests for the OAuthConfig class."""
 
@@ -280,7 +297,7 @@ class TestOAuthConfig:
         assert result is False
         mock_refresh.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_cloud_id_success(self, mock_get):
         """Test _get_cloud_id success case."""
         # Mock response
@@ -304,7 +321,7 @@ class TestOAuthConfig:
         headers = mock_get.call_args[1]["headers"]
         assert headers["Authorization"] == "Bearer test-access-token"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_cloud_id_no_access_token(self, mock_get):
         """Test _get_cloud_id with no access token."""
         config = OAuthConfig(
@@ -615,3 +632,203 @@ def test_configure_oauth_session_failure():
     # Check result
     assert result is False
     assert "Authorization" not in session.headers
+
+
+def _managed_config(**kwargs) -> OAuthConfig:
+    return OAuthConfig(
+        client_id="managed-client-id",
+        client_secret="test-client-secret",
+        redirect_uri="https://example.com/callback",
+        scope="read:jira-work offline_access",
+        refresh_token="refresh-1",
+        **kwargs,
+    )
+
+
+def _fake_refresh(delay: float = 0.0):
+    """Make refresh_access_token issue numbered tokens valid for an hour."""
+    calls = []
+
+    def refresh(self: OAuthConfig) -> bool:
+        time.sleep(delay)
+        calls.append(self.refresh_token)
+        self.access_token = f"access-{len(calls) + 1}"
+        self.refresh_token = f"refresh-{len(calls) + 1}"
+        self.expires_at = time.time() + 3600
+        return True
+
+    return refresh, calls
+
+
+class TestOAuthTokenManager:
+    """Tests for the shared OAuth token manager."""
+
+    def test_refreshes_expiring_token_in_background(self):
+        """A token about to expire is used while it is refreshed in the background."""
+        refresh, calls = _fake_refresh(delay=0.1)
+        config = _managed_config(
+            access_token="access-1", expires_at=time.time() + TOKEN_EXPIRY_MARGIN - 60
+        )
+        with patch.object(OAuthConfig, "refresh_access_token", refresh):
+            start = time.perf_counter()
+            assert config.ensure_valid_token() is True
+            assert time.perf_counter() - start < 0.1
+            assert config.access_token == "access-1"
+
+            manager = get_oauth_token_manager(config)
+            deadline = time.time() + 5
+            while not calls and time.time() < deadline:
+                time.sleep(0.01)
+            while manager.expires_at < time.time() + 3000 and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert config.ensure_valid_token() is True
+        assert calls == ["refresh-1"]
+        assert config.access_token == "access-2"
+        assert config.refresh_token == "refresh-2"
+
+    def test_concurrent_refreshes_are_deduplicated(self):
+        """Threads finding an expired token share a single refresh."""
+        refresh, calls = _fake_refresh(delay=0.2)
+        configs = [
+            _managed_config(access_token="access-1", expires_at=time.time() - 10)
+            for _ in range(8)
+        ]
+        results = []
+        with patch.object(OAuthConfig, "refresh_access_token", refresh):
+            threads = [
+                threading.Thread(
+                    target=lambda c=config: results.append(c.ensure_valid_token())
+                )
+                for config in configs
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert results == [True] * 8
+        assert calls == ["refresh-1"]
+        assert {config.access_token for config in configs} == {"access-2"}
+
+    def test_configs_of_a_client_share_tokens(self):
+        """A configuration picks up tokens refreshed through another one."""
+        refresh, calls = _fake_refresh()
+        first = _managed_config(access_token="access-1", expires_at=time.time() - 10)
+        second = _managed_config(access_token="access-1", expires_at=time.time() - 10)
+        with patch.object(OAuthConfig, "refresh_access_token", refresh):
+            assert first.ensure_valid_token() is True
+            assert second.ensure_valid_token() is True
+
+        assert len(calls) == 1
+        assert second.access_token == first.access_token == "access-2"
+
+    def test_failed_refresh_of_expired_token(self):
+        """An expired token that cannot be refreshed is reported as invalid."""
+        config = _managed_config(access_token="access-1", expires_at=time.time() - 10)
+        with patch.object(OAuthConfig, "refresh_access_token", return_value=False):
+            assert config.ensure_valid_token() is False
+        assert config.access_token == "access-1"
+
+    def test_stop_ends_background_thread(self):
+        """Stopping the managers ends their refresh threads."""
+        config = _managed_config(access_token="access-1", expires_at=time.time() + 3600)
+        assert config.ensure_valid_token() is True
+        thread = get_oauth_token_manager(config)._thread
+        assert thread is not None and thread.is_alive()
+
+        stop_oauth_token_managers()
+        assert not thread.is_alive()
+
+
+class TestAccessibleResources:
+    """Tests for the cached accessible resources lookup."""
+
+    RESOURCES = [
+        {"id": "cloud-1", "url": "https://first.atlassian.net", "name": "First"},
+        {"id": "cloud-2", "url": "https://second.atlassian.net", "name": "Second"},
+    ]
+
+    @pytest.fixture
+    def mock_get(self):
+        response = MagicMock()
+        response.json.return_value = self.RESOURCES
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            yield mock_get
+
+    def test_cached_per_token(self, mock_get):
+        """Test that each token's sites are only looked up once."""
+        assert get_accessible_resources("token-a") == self.RESOURCES
+        assert get_accessible_resources("token-a") == self.RESOURCES
+        assert mock_get.call_count == 1
+
+        get_accessible_resources("token-b")
+        assert mock_get.call_count == 2
+        headers = mock_get.call_args[1]["headers"]
+        assert headers["Authorization"] == "Bearer token-b"
+
+    def test_failures_not_cached(self, mock_get):
+        """Test that a failed lookup is retried by the next call."""
+        mock_get.side_effect = [requests.ConnectionError("down"), mock_get.return_value]
+        with pytest.raises(requests.ConnectionError):
+            get_accessible_resources("token-a")
+        assert get_accessible_resources("token-a") == self.RESOURCES
+
+    def test_cloud_id_discovery_is_cached(self, mock_get):
+        """Test that _get_cloud_id reuses the cached resources."""
+        for _ in range(3):
+            config = OAuthConfig(
+                client_id="test-client-id",
+                client_secret="test-client-secret",
+                redirect_uri="https://example.com/callback",
+                scope="read:jira-work",
+                access_token="token-a",
+            )
+            config._get_cloud_id()
+            assert config.cloud_id == "cloud-1"
+        assert mock_get.call_count == 1
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://second.atlassian.net", "cloud-2"),
+            ("https://SECOND.atlassian.net/wiki", "cloud-2"),
+            ("https://other.atlassian.net", None),
+            (None, "cloud-1"),
+        ],
+    )
+    def test_find_cloud_id(self, mock_get, url, expected):
+        """Test that only the site matching the URL is used."""
+        assert find_cloud_id("token-a", url) == expected
+
+    def test_find_cloud_id_no_sites(self, mock_get):
+        """Test that a token without sites has no cloud ID."""
+        mock_get.return_value.json.return_value = []
+        assert find_cloud_id("token-a", "https://first.atlassian.net") is None
+
+    def test_session_created_once(self):
+        """Test that concurrent first lookups share one session."""
+        barrier = threading.Barrier(4)
+
+        def slow_session():
+            time.sleep(0.05)
+            return MagicMock()
+
+        with (
+            patch("mcp_atlassian.utils.oauth._resources_session", None),
+            patch("requests.Session", side_effect=slow_session) as mock_session,
+        ):
+
+            def lookup(token):
+                barrier.wait()
+                get_accessible_resources(token)
+
+            threads = [
+                threading.Thread(target=lookup, args=(f"token-{i}",)) for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_session.call_count == 1
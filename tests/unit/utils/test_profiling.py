@@ -0,0 +1,153 @@
+"""Tests for the slow tool call profiler."""
+
+import os
+import time
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from mcp_atlassian.servers.dependencies import run_blocking
+from mcp_atlassian.utils import profiling
+from mcp_atlassian.utils.profiling import (
+    SlowCallProfiler,
+    create_slow_call_profiler,
+    hash_arguments,
+    profile_tool_call,
+    set_slow_call_profiler,
+    tool_call_scope,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    """Reset the configured profiler around every test."""
+    yield
+    profiling._profiler = None
+    profiling._profiler_loaded = False
+
+
+def _slow_call(profiler, tool="jira_get_issue", arguments=None, seconds=0.02):
+    with profiler.profile(tool, arguments or {"issue_key": "PROJ-1"}):
+        time.sleep(seconds)
+
+
+def test_hash_arguments_is_stable():
+    """Test the hash ignores key order and differs between arguments."""
+    assert hash_arguments({"a": 1, "b": 2}) == hash_arguments({"b": 2, "a": 1})
+    assert hash_arguments({"a": 1}) != hash_arguments({"a": 2})
+    assert len(hash_arguments(None)) == 12
+
+
+def test_slow_call_profile_is_saved(tmp_path):
+    """Test calls over the threshold are saved and listed."""
+    profiler = SlowCallProfiler(threshold_ms=10, directory=tmp_path)
+    _slow_call(profiler)
+
+    (profile,) = profiler.list_profiles()
+    assert profile["tool"] == "jira_get_issue"
+    assert profile["args_hash"] == hash_arguments({"issue_key": "PROJ-1"})
+    assert profile["duration_ms"] >= 10
+    assert (tmp_path / profile["name"]).is_file()
+    assert "function calls" in profiler.summarize(profile["name"])
+
+
+def test_fast_call_profile_is_discarded(tmp_path):
+    """Test calls under the threshold leave no profile."""
+    profiler = SlowCallProfiler(threshold_ms=60_000, directory=tmp_path)
+    _slow_call(profiler, seconds=0)
+
+    assert profiler.list_profiles() == []
+
+
+def test_failed_slow_call_is_saved(tmp_path):
+    """Test slow calls that raise are profiled too."""
+    profiler = SlowCallProfiler(threshold_ms=0, directory=tmp_path)
+    with pytest.raises(ValueError), profiler.profile("jira_search", {}):
+        raise ValueError("boom")
+
+    assert [p["tool"] for p in profiler.list_profiles()] == ["jira_search"]
+
+
+def test_profiles_are_rotated(tmp_path):
+    """Test only the most recent profiles are kept, newest listed first."""
+    profiler = SlowCallProfiler(threshold_ms=0, directory=tmp_path, max_files=2)
+    for tool in ("first", "second", "third"):
+        _slow_call(profiler, tool=tool, seconds=0.002)
+
+    assert [p["tool"] for p in profiler.list_profiles()] == ["third", "second"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_overlapping_calls_are_not_profiled(tmp_path):
+    """Test a call overlapping a profiled one runs unprofiled."""
+    profiler = SlowCallProfiler(threshold_ms=0, directory=tmp_path)
+    with profiler.profile("outer", {}), profiler.profile("inner", {}):
+        pass
+
+    assert [p["tool"] for p in profiler.list_profiles()] == ["outer"]
+
+
+def test_get_profile_path_rejects_other_names(tmp_path):
+    """Test only profile file names are resolved."""
+    profiler = SlowCallProfiler(threshold_ms=0, directory=tmp_path)
+    (tmp_path / "notes.txt").write_text("secret")
+
+    assert profiler.get_profile_path("notes.txt") is None
+    assert profiler.get_profile_path("../notes.txt") is None
+    with pytest.raises(FileNotFoundError):
+        profiler.summarize("1-tool-abc-1ms.prof")
+
+
+def test_create_slow_call_profiler_from_env(tmp_path):
+    """Test the profiler is configured from the environment."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert create_slow_call_profiler() is None
+
+    env = {
+        "PROFILE_SLOW_CALLS_MS": "250",
+        "PROFILE_DIR": str(tmp_path),
+        "PROFILE_MAX_FILES": "5",
+    }
+    with patch.dict(os.environ, env, clear=True):
+        profiler = create_slow_call_profiler()
+    assert profiler.threshold_ms == 250
+    assert profiler.directory == tmp_path
+    assert profiler.max_files == 5
+
+    with patch.dict(os.environ, {"PROFILE_SLOW_CALLS_MS": "slow"}, clear=True):
+        assert create_slow_call_profiler() is None
+
+
+def test_profile_tool_call_uses_configured_profiler(tmp_path):
+    """Test the tool call hook is a no-op unless a profiler is set."""
+    set_slow_call_profiler(None)
+    with profile_tool_call("jira_get_issue", {}):
+        pass
+    assert not any(tmp_path.iterdir())
+
+    set_slow_call_profiler(SlowCallProfiler(threshold_ms=0, directory=tmp_path))
+    with profile_tool_call("jira_get_issue", {}):
+        pass
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.anyio
+async def test_fetcher_calls_are_profiled_in_their_thread(tmp_path):
+    """Test fetcher calls of a tool call are profiled, the awaits around them not."""
+    profiler = SlowCallProfiler(threshold_ms=10, directory=tmp_path)
+    set_slow_call_profiler(profiler)
+
+    # Outside of a tool call nothing is profiled
+    await run_blocking(time.sleep, 0.02)
+    assert profiler.list_profiles() == []
+
+    with tool_call_scope("jira_get_issue", {"issue_key": "PROJ-1"}):
+        await run_blocking(time.sleep, 0.02)
+        await anyio.sleep(0.2)
+
+    (profile,) = profiler.list_profiles()
+    assert profile["tool"] == "jira_get_issue"
+    assert profile["args_hash"] == hash_arguments({"issue_key": "PROJ-1"})
+    assert profile["duration_ms"] < 200
+    assert "sleep" in profiler.summarize(profile["name"])
@@ -0,0 +1,206 @@
+"""Tests for the client-side Atlassian rate limiter."""
+
+import io
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from requests import HTTPError, PreparedRequest, Response, Session
+
+from mcp_atlassian.exceptions import MCPAtlassianRateLimitError
+from mcp_atlassian.utils import ratelimit
+from mcp_atlassian.utils.metrics import UPSTREAM_RETRIES
+from mcp_atlassian.utils.ratelimit import (
+    RateLimiter,
+    RateLimitSettings,
+    get_rate_limiter,
+    parse_rate_limit_reset,
+    parse_retry_after,
+    rate_limit_session,
+    set_rate_limit_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_settings(monkeypatch):
+    """Use fast retries and fresh limiters in every test."""
+    set_rate_limit_settings(RateLimitSettings(max_retries=2, max_wait=5))
+    # Keep throttled buckets fast so retries do not slow the tests down
+    monkeypatch.setattr("mcp_atlassian.utils.ratelimit.MIN_RATE", 1000.0)
+    UPSTREAM_RETRIES.reset()
+    yield
+    set_rate_limit_settings(None)
+
+
+def _response(status: int = 200, **headers: str) -> Response:
+    response = Response()
+    response.status_code = status
+    response.raw = io.BytesIO(b"")
+    response.headers.update({k.replace("_", "-"): v for k, v in headers.items()})
+    return response
+
+
+def _session(responses: list[Response], url: str = "https://test.atlassian.net"):
+    session = Session()
+    sent: list[PreparedRequest] = []
+
+    def send(request, **kwargs):
+        sent.append(request)
+        return responses.pop(0)
+
+    session.send = send
+    rate_limit_session(session, "jira", url)
+    return session, sent
+
+
+def _request(body: object = None) -> PreparedRequest:
+    request = PreparedRequest()
+    request.prepare(method="GET", url="https://test.atlassian.net/rest/api/2/myself")
+    request.body = body
+    return request
+
+
+def test_parse_retry_after():
+    """Test Retry-After is read as seconds or as an HTTP date."""
+    assert parse_retry_after("7") == 7
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    now = time.time()
+    assert parse_retry_after(formatdate(now + 30, usegmt=True), now=now) == (
+        pytest.approx(30, abs=1)
+    )
+
+
+def test_parse_rate_limit_reset():
+    """Test X-RateLimit-Reset is read as an ISO timestamp or epoch seconds."""
+    assert parse_rate_limit_reset("2024-01-01T00:00:30Z", now=1704067200) == 30
+    assert parse_rate_limit_reset("1704067210", now=1704067200) == 10
+    assert parse_rate_limit_reset("garbage") is None
+
+
+def test_sites_share_a_rate_limiter():
+    """Test Jira and Confluence of one site share a limiter."""
+    assert get_rate_limiter("https://test.atlassian.net") is get_rate_limiter(
+        "https://test.atlassian.net/wiki"
+    )
+
+
+def test_token_bucket_limits_rate():
+    """Test requests beyond the burst wait for tokens."""
+    limiter = RateLimiter("site", rate=50, burst=2)
+    start = time.perf_counter()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_throttle_pauses_and_halves_rate():
+    """Test a 429 pauses the bucket and halves the rate."""
+    limiter = RateLimiter("site", rate=4000)
+    limiter.throttle(0.1)
+
+    assert limiter.rate == 2000
+    assert limiter.acquire() >= 0.09
+
+
+def test_unlimited_bucket_recovers_after_throttle():
+    """Test an unlimited bucket starts limiting on a 429 and lifts it again."""
+    limiter = RateLimiter("site")
+    assert not limiter.limited
+
+    limiter.throttle(0)
+    assert limiter.limited
+    assert limiter.rate >= ratelimit.MIN_RATE
+
+    for _ in range(100):
+        limiter.recover()
+    assert not limiter.limited
+
+
+def test_acquire_fails_past_max_wait():
+    """Test requests fail instead of waiting beyond max_wait."""
+    limiter = RateLimiter("site", max_wait=0.05)
+    limiter.throttle(10)
+
+    with pytest.raises(MCPAtlassianRateLimitError) as excinfo:
+        limiter.acquire()
+    assert excinfo.value.retry_after == pytest.approx(10, abs=0.1)
+
+
+def test_waiting_tenants_take_turns():
+    """Test a tenant with a backlog does not starve another tenant."""
+    limiter = RateLimiter("site", rate=100, burst=1)
+    limiter.pause(0.1)
+    order: list[str] = []
+    threads = []
+    for tenant in ["a", "a", "a", "a", "b"]:
+        thread = threading.Thread(
+            target=lambda t=tenant: (limiter.acquire(t), order.append(t))
+        )
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    assert order == ["a", "b", "a", "a", "a"]
+
+
+def test_session_retries_throttled_requests():
+    """Test 429 responses are retried after Retry-After."""
+    session, sent = _session(
+        [_response(429, Retry_After="0"), _response(429), _response(200)]
+    )
+
+    response = session.send(_request())
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert UPSTREAM_RETRIES.value(service="jira", reason="429") == 2
+
+
+def test_session_raises_when_retries_are_exhausted():
+    """Test throttling beyond the retry budget raises a rate limit error."""
+    session, sent = _session([_response(429, Retry_After="0") for _ in range(3)])
+
+    with pytest.raises(MCPAtlassianRateLimitError) as excinfo:
+        session.send(_request())
+
+    assert len(sent) == 3
+    assert isinstance(excinfo.value, HTTPError)
+    assert excinfo.value.response.status_code == 429
+
+
+def test_session_does_not_replay_streamed_bodies():
+    """Test requests with a streamed body are not retried."""
+    session, sent = _session([_response(429, Retry_After="0"), _response(200)])
+
+    with pytest.raises(MCPAtlassianRateLimitError):
+        session.send(_request(body=iter([b"chunk"])))
+    assert len(sent) == 1
+
+
+def test_exhausted_rate_limit_pauses_site():
+    """Test X-RateLimit-Remaining: 0 pauses the site until the reset."""
+    reset = time.time() + 0.1
+    session, _ = _session(
+        [
+            _response(200, X_RateLimit_Remaining="0", X_RateLimit_Reset=str(reset)),
+            _response(200),
+        ]
+    )
+
+    session.send(_request())
+    start = time.perf_counter()
+    session.send(_request())
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_rate_limiting_can_be_disabled():
+    """Test sessions are left alone when rate limiting is disabled."""
+    set_rate_limit_settings(RateLimitSettings(enabled=False))
+    session, sent = _session([_response(429, Retry_After="0")])
+
+    assert session.send(_request()).status_code == 429
+    assert len(sent) == 1
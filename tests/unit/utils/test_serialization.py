@@ -0,0 +1,135 @@
+"""Tests for response serialization utilities."""
+
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.utils import serialization
+from mcp_atlassian.utils.serialization import (
+    OrjsonResponseEncoder,
+    ResponseEncoder,
+    create_response_encoder,
+    encode_response,
+    get_response_encoder,
+    set_response_encoder,
+)
+
+SAMPLE = {"key": "PROJ-1", "summary": "Ünïcödé summary", "labels": ["a", "b"]}
+
+
+@pytest.fixture(autouse=True)
+def reset_encoders():
+    """Drop cached encoders so every test reads its own environment."""
+    serialization._encoders.clear()
+    yield
+    serialization._encoders.clear()
+
+
+def test_stdlib_encoder_pretty_matches_previous_output():
+    """Test the default encoder output is unchanged from json.dumps(indent=2)."""
+    encoder = ResponseEncoder()
+    assert encoder.encode(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_stdlib_encoder_compact():
+    """Test compact mode drops all insignificant whitespace."""
+    encoded = ResponseEncoder(compact=True).encode(SAMPLE)
+    assert "\n" not in encoded
+    assert '"key":"PROJ-1"' in encoded
+    assert "Ünïcödé" in encoded
+    assert json.loads(encoded) == SAMPLE
+
+
+def test_orjson_encoder_matches_stdlib():
+    """Test orjson output is identical to the stdlib output in both modes."""
+    pytest.importorskip("orjson")
+    for compact in (False, True):
+        assert OrjsonResponseEncoder(compact=compact).encode(SAMPLE) == ResponseEncoder(
+            compact=compact
+        ).encode(SAMPLE)
+
+
+def test_orjson_encoder_differences_from_stdlib():
+    """Test the known differences of orjson output from the stdlib output."""
+    pytest.importorskip("orjson")
+    data = {"nan": float("nan"), "inf": float("inf")}
+    assert ResponseEncoder(compact=True).encode(data) == '{"nan":NaN,"inf":Infinity}'
+    assert OrjsonResponseEncoder(compact=True).encode(data) == '{"nan":null,"inf":null}'
+
+    when = {"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+    assert OrjsonResponseEncoder(compact=True).encode(when) == (
+        '{"at":"2024-01-02T03:04:05+00:00"}'
+    )
+    with pytest.raises(TypeError):
+        ResponseEncoder().encode(when)
+
+
+def test_orjson_encoder_falls_back_on_unsupported_data():
+    """Test data orjson rejects is still encoded via the stdlib."""
+    pytest.importorskip("orjson")
+    data = {"big": 2**70}
+    assert json.loads(OrjsonResponseEncoder().encode(data)) == data
+
+
+def test_create_response_encoder_defaults():
+    """Test the default encoder is the pretty stdlib encoder."""
+    with patch.dict(os.environ, {}, clear=True):
+        encoder = create_response_encoder("jira")
+    assert encoder.compact is False
+    assert type(encoder) is ResponseEncoder
+
+
+def test_create_response_encoder_auto_backend():
+    """Test RESPONSE_JSON_ENCODER=auto prefers orjson when installed."""
+    with patch.dict(os.environ, {"RESPONSE_JSON_ENCODER": "auto"}, clear=True):
+        encoder = create_response_encoder("jira")
+    expected = "orjson" if serialization.orjson is not None else "json"
+    assert encoder.name == expected
+
+
+def test_create_response_encoder_per_service_format():
+    """Test the service-specific format overrides the global one."""
+    env = {"RESPONSE_FORMAT": "compact", "CONFLUENCE_RESPONSE_FORMAT": "pretty"}
+    with patch.dict(os.environ, env, clear=True):
+        assert create_response_encoder("jira").compact is True
+        assert create_response_encoder("confluence").compact is False
+
+
+def test_create_response_encoder_stdlib_backend():
+    """Test RESPONSE_JSON_ENCODER=json forces the stdlib encoder."""
+    with patch.dict(os.environ, {"RESPONSE_JSON_ENCODER": "json"}, clear=True):
+        encoder = create_response_encoder("jira")
+    assert type(encoder) is ResponseEncoder
+
+
+def test_create_response_encoder_invalid_value(caplog):
+    """Test invalid values fall back to the defaults with a warning."""
+    with patch.dict(os.environ, {"JIRA_RESPONSE_FORMAT": "tiny"}, clear=True):
+        encoder = create_response_encoder("jira")
+    assert encoder.compact is False
+    assert "Invalid JIRA_RESPONSE_FORMAT" in caplog.text
+
+
+def test_get_response_encoder_is_cached():
+    """Test the encoder is created once per service."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_response_encoder("jira") is get_response_encoder("jira")
+        assert get_response_encoder("jira") is not get_response_encoder("confluence")
+
+
+def test_set_response_encoder():
+    """Test a custom encoder can be installed and removed."""
+
+    class UpperEncoder(ResponseEncoder):
+        def encode(self, data):
+            return super().encode(data).upper()
+
+    set_response_encoder("jira", UpperEncoder(compact=True))
+    assert encode_response({"a": "b"}, "jira") == '{"A":"B"}'
+
+    set_response_encoder("jira", None)
+    with patch.dict(os.environ, {}, clear=True):
+        assert encode_response({"a": "b"}, "jira") == '{\n  "a": "b"\n}'
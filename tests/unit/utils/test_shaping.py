@@ -0,0 +1,157 @@
+"""Tests for budget-based response shaping."""
+
+import json
+
+from mcp_atlassian.utils.shaping import (
+    BYTES_PER_TOKEN,
+    MIN_TEXT_CHARS,
+    resolve_budget,
+    shape_response,
+    truncate_text,
+)
+
+
+def _size(data):
+    return len(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def _document(sections=20, lines=15):
+    parts = []
+    for section in range(sections):
+        parts.append(f"## Section {section}")
+        parts.extend(
+            f"Line {line} of section {section}, with some filler text."
+            for line in range(lines)
+        )
+    return "\n".join(parts)
+
+
+def test_resolve_budget():
+    """Test the tighter of the byte and token budgets is used."""
+    assert resolve_budget(0, 0) is None
+    assert resolve_budget(None, None) is None
+    assert resolve_budget(1000, 0) == 1000
+    assert resolve_budget(0, 100) == 100 * BYTES_PER_TOKEN
+    assert resolve_budget(1000, 100) == min(1000, 100 * BYTES_PER_TOKEN)
+
+
+def test_truncate_text_short_text_unchanged():
+    """Test text within the limit is returned as is."""
+    assert truncate_text("short", 100) == ("short", {})
+
+
+def test_truncate_text_keeps_head_tail_and_headings():
+    """Test truncation keeps the start, the end and the elided headings."""
+    text = _document()
+    truncated, summary = truncate_text(text, 2000)
+
+    assert truncated.startswith("## Section 0\nLine 0 of section 0")
+    assert truncated.endswith("Line 14 of section 19, with some filler text.")
+    assert "## Section 10" in truncated
+    assert "characters elided, section headings kept" in truncated
+    assert summary["original_chars"] == len(text)
+    assert summary["headings_kept"] > 0
+    assert len(truncated) < len(text) - summary["elided_chars"] + 200
+
+
+def test_truncate_text_without_headings():
+    """Test truncation of plain text only leaves a marker."""
+    text = "word " * 2000
+    truncated, summary = truncate_text(text, 500)
+
+    assert "characters elided ...]" in truncated
+    assert "headings_kept" not in summary
+    assert len(truncated) < 600
+
+
+def test_shape_response_within_budget_is_unchanged():
+    """Test responses that fit are returned untouched."""
+    data = {"key": "PROJ-1", "description": _document()}
+    assert shape_response(data, _size(data)) is data
+
+
+def test_shape_response_truncates_long_strings():
+    """Test long strings are cut to fit and reported, others are kept."""
+    data = {
+        "key": "PROJ-1",
+        "summary": "A short summary",
+        "description": _document(),
+        "comments": [{"id": "1", "body": "x" * 10000}],
+    }
+    shaped = shape_response(data, 6000)
+
+    assert _size(shaped) <= 6000
+    assert shaped["summary"] == "A short summary"
+    assert data["description"] == _document()  # original is not modified
+    report = shaped["truncation"]
+    assert report["budget_met"] is True
+    assert report["max_bytes"] == 6000
+    assert report["original_bytes"] == _size(data)
+    assert {field["path"] for field in report["fields"]} == {
+        "description",
+        "comments[0].body",
+    }
+    assert "lists" not in report
+
+
+def test_shape_response_omits_trailing_list_items():
+    """Test trailing list items are dropped once strings are at their minimum."""
+    data = {
+        "key": "PROJ-1",
+        "comments": [
+            {"id": str(i), "body": "comment " * (MIN_TEXT_CHARS // 4)}
+            for i in range(50)
+        ],
+    }
+    shaped = shape_response(data, 3000)
+
+    assert _size(shaped) <= 3000
+    report = shaped["truncation"]
+    assert report["budget_met"] is True
+    assert report["lists"] == [
+        {"path": "comments", "omitted_items": 50 - len(shaped["comments"])}
+    ]
+    assert shaped["comments"][0]["id"] == "0"
+    kept = len(shaped["comments"])
+    assert all(
+        int(field["path"][len("comments[") :].split("]")[0]) < kept
+        for field in report.get("fields", [])
+    )
+
+
+def test_shape_response_nested_lists():
+    """Test inner lists of omitted items are not touched or restored."""
+
+    def comments(count):
+        return [{"id": str(i), "body": f"comment {i}"} for i in range(count)]
+
+    data = {
+        "issues": [{"key": f"PROJ-{i}", "comments": comments(20)} for i in range(4)]
+        + [{"key": "PROJ-4", "comments": comments(60)}]
+    }
+    shaped = shape_response(data, 300)
+
+    assert shaped["issues"][0]["key"] == "PROJ-0"
+    lists = {entry["path"]: entry for entry in shaped["truncation"]["lists"]}
+    assert lists["issues"]["omitted_items"] == 5 - len(shaped["issues"])
+    for index, issue in enumerate(shaped["issues"]):
+        omitted = lists.get(f"issues[{index}].comments", {}).get("omitted_items", 0)
+        assert len(issue["comments"]) == 20 - omitted
+    assert len(data["issues"][4]["comments"]) == 60
+
+
+def test_shape_response_reports_unmet_budget():
+    """Test an unreachable budget is reported instead of failing."""
+    data = {"key": "PROJ-1", "description": _document()}
+    shaped = shape_response(data, 50)
+
+    assert shaped["truncation"]["budget_met"] is False
+    assert len(shaped["description"]) < len(data["description"])
+
+
+def test_shape_response_uses_encoder():
+    """Test the budget is measured with the given encoder."""
+    data = {"description": "y" * 5000}
+    pretty = lambda value: json.dumps(value, indent=2)  # noqa: E731
+    shaped = shape_response(data, 2000, pretty)
+    assert len(pretty(shaped)) <= 2000
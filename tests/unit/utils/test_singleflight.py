@@ -0,0 +1,150 @@
+"""Tests for coalescing identical concurrent reads."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_atlassian.utils.metrics import COALESCED_CALLS
+from mcp_atlassian.utils.singleflight import SingleFlight, coalesced, credential_scope
+
+
+class FakeClient:
+    """A client whose reads take a while and count upstream calls."""
+
+    def __init__(self, token: str = "token-a") -> None:
+        self.config = SimpleNamespace(
+            url="https://test.atlassian.net", auth_type="token", personal_token=token
+        )
+        self.calls = 0
+        self.fields: list[str] | None = None
+        self.lock = threading.Lock()
+
+    @coalesced
+    def get_issue(self, issue_key: str, fields: list[str] | None = None) -> dict:
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.05)
+        if issue_key == "BAD-1":
+            raise ValueError("not found")
+        return {"key": issue_key, "fields": fields}
+
+    @coalesced
+    def get_fields(self) -> list[str]:
+        if self.fields is None:
+            self.fields = ["summary"]
+            # Re-enters with the same key, like FieldsMixin._generate_field_map
+            self.get_fields()
+        return self.fields
+
+
+def _run_concurrently(func, count: int = 5) -> list:
+    results: list = [None] * count
+    barrier = threading.Barrier(count)
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as e:  # noqa: BLE001 - collected for assertions
+            results[index] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_identical_reads_share_one_call():
+    """Test overlapping identical reads send one request and share its result."""
+    COALESCED_CALLS.reset()
+    client = FakeClient()
+
+    results = _run_concurrently(lambda: client.get_issue("PROJ-1", fields=["a"]))
+
+    assert client.calls == 1
+    assert all(result == {"key": "PROJ-1", "fields": ["a"]} for result in results)
+    assert COALESCED_CALLS.value(call="FakeClient.get_issue") == 4
+
+
+def test_shared_results_are_copies():
+    """Test callers sharing a result can modify it without affecting others."""
+    client = FakeClient()
+
+    results = _run_concurrently(lambda: client.get_issue("PROJ-1", fields=["a"]))
+    results[0]["fields"].append("b")
+
+    assert client.calls == 1
+    assert len({id(result) for result in results}) == len(results)
+    assert all(result["fields"] == ["a"] for result in results[1:])
+
+
+def test_different_arguments_are_not_coalesced():
+    """Test reads of different issues run separately."""
+    client = FakeClient()
+    keys = iter(f"PROJ-{i}" for i in range(5))
+    lock = threading.Lock()
+
+    def read() -> dict:
+        with lock:
+            key = next(keys)
+        return client.get_issue(key)
+
+    _run_concurrently(read)
+    assert client.calls == 5
+
+
+def test_different_credentials_are_not_coalesced():
+    """Test results are only shared within a credential scope."""
+    clients = [FakeClient("token-a"), FakeClient("token-b")]
+    counter = iter(range(2))
+    lock = threading.Lock()
+
+    def read() -> dict:
+        with lock:
+            client = clients[next(counter)]
+        return client.get_issue("PROJ-1")
+
+    _run_concurrently(read, count=2)
+    assert [client.calls for client in clients] == [1, 1]
+    assert credential_scope(clients[0].config) != credential_scope(clients[1].config)
+
+
+def test_errors_are_shared():
+    """Test every waiting caller sees the error of the shared call."""
+    client = FakeClient()
+
+    results = _run_concurrently(lambda: client.get_issue("BAD-1"))
+
+    assert client.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_sequential_reads_are_not_cached():
+    """Test nothing is kept once the call completes."""
+    client = FakeClient()
+    client.get_issue("PROJ-1")
+    client.get_issue("PROJ-1")
+    assert client.calls == 2
+
+
+def test_reentrant_calls_do_not_deadlock():
+    """Test a call re-entering with its own key runs directly."""
+    assert FakeClient().get_fields() == ["summary"]
+
+    group = SingleFlight()
+    result, shared = group.do("key", lambda: group.do("key", lambda: 42))
+    assert result == (42, False)
+    assert not shared
+    assert group.in_flight() == 0
+
+
+def test_leader_error_propagates_and_clears_key():
+    """Test a failing call does not leave its key in flight."""
+    group = SingleFlight()
+    with pytest.raises(RuntimeError):
+        group.do("key", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    assert group.in_flight() == 0
@@ -0,0 +1,108 @@
+"""Tests for the tracing utilities."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.tracing import (
+    InMemorySpanExporter,
+    add_span_exporter,
+    remove_span_exporter,
+    span,
+    trace_session,
+    traced,
+)
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+
+@pytest.fixture
+def exporter():
+    """Collect spans in process for the duration of a test."""
+    span_exporter = InMemorySpanExporter()
+    add_span_exporter(span_exporter)
+    yield span_exporter
+    remove_span_exporter(span_exporter)
+
+
+def test_span_without_exporter_is_noop():
+    """Test spans are not recorded when no exporter is registered."""
+    unused = InMemorySpanExporter()
+    with span("noop", key="value") as current:
+        current.set_attribute("other", 1)
+    assert unused.get_finished_spans() == []
+
+
+def test_nested_spans(exporter):
+    """Test nested spans are linked to their parent."""
+    with span("outer", service="jira") as outer:
+        with span("inner", skipped=None):
+            pass
+        outer.set_attribute("late", "yes")
+
+    inner, outer_span = exporter.get_finished_spans()
+    assert inner.name == "inner"
+    assert inner.parent_id == outer_span.span_id
+    assert inner.attributes == {}
+    assert outer_span.parent_id is None
+    assert outer_span.attributes == {"service": "jira", "late": "yes"}
+    assert outer_span.duration >= inner.duration >= 0
+
+
+def test_span_records_errors(exporter):
+    """Test exceptions mark the span as failed and propagate."""
+    with pytest.raises(ValueError), span("failing"):
+        raise ValueError("boom")
+
+    (failed,) = exporter.get_finished_spans()
+    assert failed.status == "error"
+    assert failed.error == "ValueError: boom"
+
+
+@pytest.mark.anyio
+async def test_traced_async_function(exporter):
+    """Test coroutine functions are traced across awaits."""
+
+    @traced("async.op", kind="test")
+    async def operation():
+        with span("async.child"):
+            return 42
+
+    assert await operation() == 42
+    child, parent = exporter.get_finished_spans()
+    assert parent.name == "async.op"
+    assert parent.attributes == {"kind": "test"}
+    assert child.parent_id == parent.span_id
+
+
+def test_trace_session(exporter):
+    """Test upstream requests get a span with method, URL and status."""
+    session = requests.Session()
+    session.send = MagicMock(return_value=MagicMock(status_code=200))
+    trace_session(session, "jira")
+    request = MagicMock(
+        method="GET", url="https://example.atlassian.net/rest/api/2/issue/A-1?x=1"
+    )
+
+    session.send(request)
+
+    (http_span,) = exporter.get_finished_spans()
+    assert http_span.name == "jira.http GET"
+    assert http_span.attributes == {
+        "http.method": "GET",
+        "http.url": "https://example.atlassian.net/rest/api/2/issue/A-1",
+        "mcp.service": "jira",
+        "http.status_code": 200,
+    }
+
+
+def test_parsing_and_conversion_spans(exporter):
+    """Test model parsing and text conversion are traced."""
+    JiraIssue.from_api_response(MOCK_JIRA_ISSUE_RESPONSE)
+    JiraPreprocessor().markdown_to_jira("**bold**")
+
+    names = [s.name for s in exporter.get_finished_spans()]
+    assert "jira.parse_issue" in names
+    assert "conversion.markdown_to_jira" in names
@@ -1,6 +1,6 @@
 """Tests for the URL utilities module."""
 
-from mcp_atlassian.utils.urls import is_atlassian_cloud_url
+from mcp_atlassian.utils.urls import is_atlassian_cloud_url, site_key
 
 
 def test_is_atlassian_cloud_url_empty():
@@ -57,3 +57,16 @@ def test_is_atlassian_cloud_url_with_protocols():
     assert (
         is_atlassian_cloud_url("ftp://example.atlassian.net") is True
     )  # URL parsing still works
+
+
+def test_site_key_is_shared_by_products():
+    """Test Jira and Confluence of one site share a site key."""
+    assert site_key("https://test.atlassian.net") == site_key(
+        "https://test.atlassian.net/wiki"
+    )
+    assert site_key("https://api.atlassian.com/ex/jira/abc") == site_key(
+        "https://api.atlassian.com/ex/confluence/abc/"
+    )
+    assert site_key("https://api.atlassian.com/ex/jira/abc") != site_key(
+        "https://api.atlassian.com/ex/jira/xyz"
+    )